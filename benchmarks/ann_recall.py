@@ -0,0 +1,67 @@
+"""
+ANN 색인의 재현율(recall) / 지연 시간 측정
+
+무작위 질의 단어마다 KeyedVectors.most_similar 의 정확한 상위 K개와
+IVF-PQ 색인의 결과를 비교해 nprobe 값별 recall@K 와 지연 시간을 출력한다.
+
+    python benchmarks/ann_recall.py --path cc.ko.300 --queries 200 --k 100 --nprobe 4 8 16 32 64
+"""
+import argparse
+import os
+import sys
+import time
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from simword.ann import load_index  # noqa: E402
+
+
+def percentile_ms(latencies, q):
+    return round(float(np.percentile(latencies, q)) * 1000, 2)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--path", default="cc.ko.300", help="모델 저장소 경로 (확장자 제외)")
+    parser.add_argument("--queries", type=int, default=200, help="질의 단어 수")
+    parser.add_argument("--query-pool", type=int, default=50000, help="질의 단어를 뽑을 빈도 상위 단어 수")
+    parser.add_argument("--k", type=int, default=100)
+    parser.add_argument("--nprobe", type=int, nargs="+", default=[4, 8, 16, 32, 64])
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    index = load_index(args.path)
+    if index is None:
+        sys.exit("색인이 없습니다. 'python manage.py build_ann_index' 를 먼저 실행하세요.")
+    model = index.model
+
+    rng = np.random.default_rng(args.seed)
+    pool = min(args.query_pool, len(model.index_to_key))
+    words = [model.index_to_key[int(row)] for row in rng.choice(pool, min(args.queries, pool), replace=False)]
+
+    model.most_similar(words[0], topn=args.k)  # 전체 벡터 노름 계산은 측정에서 제외
+    exact, exact_latencies = {}, []
+    for word in words:
+        started = time.perf_counter()
+        exact[word] = {neighbor for neighbor, _ in model.most_similar(word, topn=args.k)}
+        exact_latencies.append(time.perf_counter() - started)
+
+    print(f"{'method':<12} {'recall@' + str(args.k):>10} {'p50(ms)':>9} {'p95(ms)':>9} {'p99(ms)':>9}")
+    print(f"{'exact':<12} {1.0:>10.3f} {percentile_ms(exact_latencies, 50):>9} "
+          f"{percentile_ms(exact_latencies, 95):>9} {percentile_ms(exact_latencies, 99):>9}")
+
+    for nprobe in args.nprobe:
+        recalls, latencies = [], []
+        for word in words:
+            started = time.perf_counter()
+            neighbors = index.most_similar(word, args.k, nprobe)
+            latencies.append(time.perf_counter() - started)
+            recalls.append(len(exact[word] & {neighbor for neighbor, _ in neighbors}) / max(len(exact[word]), 1))
+
+        print(f"{'nprobe=' + str(nprobe):<12} {np.mean(recalls):>10.3f} {percentile_ms(latencies, 50):>9} "
+              f"{percentile_ms(latencies, 95):>9} {percentile_ms(latencies, 99):>9}")
+
+
+if __name__ == "__main__":
+    main()
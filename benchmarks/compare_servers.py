@@ -0,0 +1,110 @@
+"""
+Gunicorn(동기 WSGI) 와 uvicorn(비동기 ASGI) 의 고동시성 지연 시간 비교
+
+두 서버를 같은 워커 수로 차례대로 띄우고, DB 의 AnswerWord / BaseWord 로 만든
+상위 100개 / 추측 요청을 동시성 단계별로 보내 처리량과 p50 / p95 / p99 를 출력한다.
+uvicorn 쪽은 SIMWORD_ASYNC_VIEWS=True 로 비동기 뷰를 사용한다.
+
+    python benchmarks/compare_servers.py --workers 4 --concurrency 16 64 256
+"""
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+import urllib.request
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from http_load import run_load  # noqa: E402
+
+SERVERS = {
+    "gunicorn": lambda port, workers: [
+        "gunicorn", "config.wsgi:application", "--bind", f"127.0.0.1:{port}", "--workers", str(workers),
+    ],
+    "uvicorn": lambda port, workers: [
+        "uvicorn", "config.asgi:application", "--host", "127.0.0.1", "--port", str(port),
+        "--workers", str(workers), "--no-access-log",
+    ],
+}
+
+
+def sample_paths(answer_count, guess_count, seed):
+    """DB 에서 정답 / 추측 단어를 뽑아 요청 경로 목록을 만듦"""
+    import django
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+    django.setup()
+    from simword.models import AnswerWord, BaseWord
+
+    rng = random.Random(seed)
+    answer_ids = list(AnswerWord.objects.values_list("id", flat=True))
+    words = list(BaseWord.objects.values_list("base_word", flat=True))
+    answer_ids = rng.sample(answer_ids, min(answer_count, len(answer_ids)))
+    guesses = rng.sample(words, min(guess_count, len(words)))
+
+    paths = [f"/api/simword/{answer_id}/" for answer_id in answer_ids]
+    paths += [f"/api/simword/{rng.choice(answer_ids)}/{urllib.request.quote(word)}/" for word in guesses]
+    rng.shuffle(paths)
+    return paths
+
+
+def wait_until_ready(port, timeout):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            urllib.request.urlopen(f"http://127.0.0.1:{port}/api/simword/total/", timeout=1).read()
+            return True
+        except OSError:
+            time.sleep(0.5)
+    return False
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--servers", nargs="+", choices=list(SERVERS), default=list(SERVERS))
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[16, 64, 256])
+    parser.add_argument("--requests", type=int, default=5000, help="동시성 단계별 요청 수")
+    parser.add_argument("--answers", type=int, default=20, help="요청에 사용할 AnswerWord 수")
+    parser.add_argument("--guesses", type=int, default=500, help="요청에 사용할 추측 단어 수")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--startup-timeout", type=float, default=300)
+    parser.add_argument("--output", help="결과를 저장할 JSON 파일")
+    args = parser.parse_args()
+
+    paths = sample_paths(args.answers, args.guesses, seed=0)
+    results = []
+
+    for server in args.servers:
+        env = dict(os.environ, SIMWORD_ASYNC_VIEWS=str(server == "uvicorn"))
+        process = subprocess.Popen(SERVERS[server](args.port, args.workers), cwd=ROOT_DIR, env=env)
+        try:
+            if not wait_until_ready(args.port, args.startup_timeout):
+                sys.exit(f"{server} 가 {args.startup_timeout}초 안에 시작되지 않았습니다.")
+
+            urls = [f"http://127.0.0.1:{args.port}{path}" for path in paths]
+            run_load(urls, 4, len(urls))  # 캐시 / 순위표 예열
+            for concurrency in args.concurrency:
+                result = {"server": server, "workers": args.workers, **run_load(urls, concurrency, args.requests)}
+                results.append(result)
+                print(
+                    f"{server:<9} c={concurrency:<4} {result['throughput_rps']:>8} req/s  "
+                    f"p50 {result['p50_ms']:>8}ms  p95 {result['p95_ms']:>8}ms  p99 {result['p99_ms']:>8}ms  "
+                    f"{result['statuses']}"
+                )
+        finally:
+            process.terminate()
+            process.wait()
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+임베딩 모델 로딩 방식별 워커 시작 시간 / 메모리 비교
+
+pickle 기반 .kv 파일을 워커마다 읽는 방식(kv), 메모리 맵 저장소를 공유하는
+방식(store), 어휘 색인만 여는 방식(vocab, 단어 포함 여부만 확인하는 스크립트용)을
+1, 4, 8개 워커로 동시에 띄워 로딩 시간(모듈 import 포함)과 RSS / PSS 를 측정한다.
+PSS 는 공유 페이지를 프로세스 수로 나눠 계산하므로 워커 합계가 실제 메모리 사용량에 가깝다.
+
+    python benchmarks/embedding_startup.py --path cc.ko.300 --workers 1 4 8
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+PROBE_WORDS = ["신문", "기사", "학교", "사과", "컴퓨터"]
+MODES = ("kv", "store", "vocab")
+
+
+def read_memory_kb():
+    """현재 프로세스의 RSS / PSS (kB)"""
+    memory = {"rss_kb": 0, "pss_kb": 0}
+    with open("/proc/self/smaps_rollup") as f:
+        for line in f:
+            name, _, value = line.partition(":")
+            if name == "Rss":
+                memory["rss_kb"] = int(value.split()[0])
+            elif name == "Pss":
+                memory["pss_kb"] = int(value.split()[0])
+    return memory
+
+
+def run_worker(mode, path):
+    """모델을 로드하고 측정값을 출력한 뒤 부모가 종료시킬 때까지 대기"""
+    started = time.perf_counter()
+    if mode == "kv":
+        from gensim.models import KeyedVectors
+        model = KeyedVectors.load(f"{path}.kv")
+    elif mode == "store":
+        from simword.embedding import load_store
+        model = load_store(path)
+    else:
+        from simword.embedding import load_vocabulary
+        vocabulary = load_vocabulary(path)
+    load_seconds = time.perf_counter() - started
+
+    if mode == "vocab":
+        # 스크립트처럼 단어 포함 여부만 확인
+        for word in PROBE_WORDS:
+            word in vocabulary
+    else:
+        # 실제 요청처럼 몇 개 단어의 벡터를 읽어 페이지를 불러옴
+        words = [word for word in PROBE_WORDS if word in model.key_to_index]
+        for word in words[1:]:
+            model.similarity(words[0], word)
+
+    print(json.dumps({"load_seconds": load_seconds, **read_memory_kb()}), flush=True)
+    sys.stdin.read()
+
+
+def measure(mode, path, workers):
+    """워커 여러 개를 동시에 띄워 측정값을 모음"""
+    processes = [
+        subprocess.Popen(
+            [sys.executable, __file__, "--worker", mode, "--path", path],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True,
+        )
+        for _ in range(workers)
+    ]
+    results = [json.loads(process.stdout.readline()) for process in processes]
+    for process in processes:
+        process.stdin.close()
+        process.wait()
+
+    return {
+        "mode": mode,
+        "workers": workers,
+        "max_load_ms": round(max(result["load_seconds"] for result in results) * 1000, 1),
+        "mean_load_ms": round(sum(result["load_seconds"] for result in results) / workers * 1000, 1),
+        "total_rss_mb": round(sum(result["rss_kb"] for result in results) / 1024, 1),
+        "total_pss_mb": round(sum(result["pss_kb"] for result in results) / 1024, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--path", default="cc.ko.300", help="모델 경로 (확장자 제외)")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4, 8])
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=list(MODES))
+    parser.add_argument("--worker", choices=MODES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        run_worker(args.worker, args.path)
+        return
+
+    print(f"{'mode':<6} {'workers':>7} {'max load(ms)':>13} {'mean load(ms)':>14} {'RSS(MB)':>10} {'PSS(MB)':>10}")
+    for mode in args.modes:
+        for workers in args.workers:
+            result = measure(mode, args.path, workers)
+            print(
+                f"{result['mode']:<6} {result['workers']:>7} {result['max_load_ms']:>13} "
+                f"{result['mean_load_ms']:>14} {result['total_rss_mb']:>10} {result['total_pss_mb']:>10}"
+            )
+
+
+if __name__ == "__main__":
+    main()
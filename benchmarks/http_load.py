@@ -0,0 +1,97 @@
+"""
+동시 HTTP 부하 생성기
+
+URL 목록을 여러 스레드가 돌아가며 요청해 처리량과 p50 / p95 / p99 지연 시간을 측정한다.
+각 스레드는 keep-alive 연결을 재사용하고, 서버가 연결을 닫으면 다시 연결한다.
+
+    python benchmarks/http_load.py --concurrency 64 --requests 5000 http://127.0.0.1:8000/api/simword/1/
+"""
+import argparse
+import http.client
+import itertools
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+
+def percentile(sorted_values, q):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(q / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def run_load(urls, concurrency, total_requests, timeout=30):
+    """urls 를 순환하며 total_requests 번 요청하고 지연 시간 통계를 반환"""
+    counter = itertools.count()
+    lock = threading.Lock()
+    latencies, statuses = [], {}
+
+    def worker():
+        connection = None
+        while True:
+            number = next(counter)
+            if number >= total_requests:
+                break
+            url = urls[number % len(urls)]
+            parts = urlsplit(url)
+            path = parts.path + (f"?{parts.query}" if parts.query else "")
+
+            started = time.perf_counter()
+            try:
+                if connection is None:
+                    connection = http.client.HTTPConnection(parts.hostname, parts.port or 80, timeout=timeout)
+                connection.request("GET", path)
+                response = connection.getresponse()
+                response.read()
+                status = response.status
+                if response.getheader("Connection", "").lower() == "close":
+                    connection.close()
+                    connection = None
+            except (OSError, http.client.HTTPException):
+                status = "error"
+                if connection is not None:
+                    connection.close()
+                connection = None
+            elapsed = time.perf_counter() - started
+
+            with lock:
+                latencies.append(elapsed)
+                statuses[status] = statuses.get(status, 0) + 1
+
+        if connection is not None:
+            connection.close()
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        for _ in range(concurrency):
+            executor.submit(worker)
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "concurrency": concurrency,
+        "requests": len(latencies),
+        "seconds": round(elapsed, 3),
+        "throughput_rps": round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+        "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 2),
+        "statuses": {str(status): count for status, count in statuses.items()},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("urls", nargs="+")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+
+    print(json.dumps(run_load(args.urls, args.concurrency, args.requests), ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+BaseWord 일괄 저장 속도 측정
+
+임시 SQLite DB 에 가상 단어를 batch 개씩 rounds 번 저장하면서 ingest_words 의 처리 속도를 출력하고,
+같은 크기의 일부 표본으로 기존 방식(단어마다 get_or_create)과 비교한다.
+배치마다 절반은 이미 저장된 단어, 일부는 어휘에 없는 단어로 채운다.
+
+    python benchmarks/ingestion.py --batch 10000 --rounds 5
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+
+def setup_django(db_path):
+    import django
+
+    os.environ["SIMWORD_BENCHMARK_DB"] = db_path
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "benchmarks.settings")
+    django.setup()
+
+    from django.core.management import call_command
+    call_command("migrate", verbosity=0)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--batch", type=int, default=10000, help="한 번에 저장하는 단어 수")
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--baseline", type=int, default=1000, help="get_or_create 로 비교할 단어 수 (0 이면 생략)")
+    parser.add_argument("--oov-ratio", type=float, default=0.1, help="어휘에 없는 단어 비율")
+    parser.add_argument("--db", help="SQLite DB 경로 (기본값: 임시 파일)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    db_path = args.db or os.path.join(tempfile.mkdtemp(prefix="simword-bench-"), "ingestion.sqlite3")
+    setup_django(db_path)
+
+    from simword.ingestion import ingest_words
+    from simword.models import BaseWord
+
+    rng = random.Random(args.seed)
+    vocabulary = {f"단어{i}" for i in range(args.batch * (args.rounds + 1))}
+    stored = []
+
+    print(f"{'round':>5} {'words':>7} {'created':>8} {'time(ms)':>9} {'words/s':>9}")
+    for round_number in range(1, args.rounds + 1):
+        fresh = [f"단어{i}" for i in range(round_number * args.batch, round_number * args.batch + args.batch // 2)]
+        repeated = rng.sample(stored, min(len(stored), args.batch // 2 - int(args.batch * args.oov_ratio)))
+        unknown = [f"없는단어{round_number}_{i}" for i in range(args.batch - len(fresh) - len(repeated))]
+        words = fresh + repeated + unknown
+        rng.shuffle(words)
+
+        started = time.perf_counter()
+        created = ingest_words(words, BaseWord, "base_word", vocabulary, report=None)
+        elapsed = time.perf_counter() - started
+        stored.extend(fresh)
+        print(f"{round_number:>5} {len(words):>7} {created:>8} {elapsed * 1000:>9.1f} {len(words) / elapsed:>9.0f}")
+
+    if args.baseline:
+        words = [f"기존방식{i}" for i in range(args.baseline)]
+        started = time.perf_counter()
+        for word in words:
+            BaseWord.objects.get_or_create(base_word=word)
+        elapsed = time.perf_counter() - started
+        print(f"\nget_or_create {len(words)}개: {elapsed * 1000:.1f}ms ({len(words) / elapsed:.0f}단어/초)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+"""
+벤치마크용 Django 설정
+
+config.settings 를 그대로 쓰고 DB 만 SQLite 파일(SIMWORD_BENCHMARK_DB), 캐시는 프로세스 메모리로 바꾼다.
+
+    DJANGO_SETTINGS_MODULE=benchmarks.settings python benchmarks/term_stats.py
+"""
+import os
+
+BENCHMARK_DB = os.environ.get("SIMWORD_BENCHMARK_DB", "benchmark.sqlite3")
+
+os.environ.setdefault("SECRET_KEY", "benchmark")
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{os.path.abspath(BENCHMARK_DB)}")
+
+from config.settings import *  # noqa: E402,F401,F403
+
+DATABASES = {
+    "default": {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": os.path.abspath(BENCHMARK_DB),
+    }
+}
+
+CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+}
+
+# 벤치마크 중에는 추측 단어 / 추측 기록 자동 저장 스레드를 띄우지 않음
+SIMWORD_BASEWORD_FLUSH_INTERVAL = 0
+SIMWORD_GUESS_FLUSH_INTERVAL = 0
+
+# 미리 만든 스냅샷이 아니라 실제 계산 경로를 측정
+SIMWORD_SNAPSHOT_DIR = ""
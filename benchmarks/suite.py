@@ -0,0 +1,294 @@
+"""
+simword API 벤치마크 모음 (네트워크 / cc.ko.300 없이 실행)
+
+임시 디렉터리에 가상 임베딩 모델(KeyedVectors → 메모리 맵 저장소)과 SQLite DB 를 만들고
+AnswerWord / BaseWord 를 지정한 개수만큼 채운 뒤,
+
+  1. 마이크로 벤치마크 : get_similarity_rank_list / calculate_similarity 를 RequestFactory 로
+     직접 호출해 처음 호출(cold)과 반복 호출(warm)의 지연 시간을 측정
+  2. HTTP 부하 테스트 : runserver(또는 gunicorn / uvicorn)를 띄워 동시성 단계별
+     처리량과 p50 / p95 / p99 를 측정
+
+결과는 커밋 해시와 함께 JSON 으로 저장하고, --compare 로 이전 결과와의 차이를 출력한다.
+
+    python benchmarks/suite.py --answers 200 --base-words 20000 --vocab 50000 --concurrency 8 32
+    python benchmarks/suite.py --compare benchmarks/results/<이전 결과>.json
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from datetime import datetime
+import numpy as np
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESULTS_DIR = os.path.join(ROOT_DIR, "benchmarks", "results")
+sys.path.insert(0, ROOT_DIR)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from http_load import percentile, run_load  # noqa: E402
+
+SERVERS = {
+    "runserver": lambda port, workers: [
+        sys.executable, "manage.py", "runserver", f"127.0.0.1:{port}", "--noreload", "--skip-checks",
+    ],
+    "gunicorn": lambda port, workers: [
+        "gunicorn", "config.wsgi:application", "--bind", f"127.0.0.1:{port}", "--workers", str(workers),
+    ],
+    "uvicorn": lambda port, workers: [
+        "uvicorn", "config.asgi:application", "--host", "127.0.0.1", "--port", str(port),
+        "--workers", str(workers), "--no-access-log",
+    ],
+}
+
+
+def git_commit():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT_DIR, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def build_model(path, vocab_size, dims, seed):
+    """가상 단어 vocab_size 개의 임베딩 저장소를 만들고 단어 목록을 반환
+
+    실제 임베딩처럼 의미가 가까운 단어 묶음이 생기도록 군집 중심 주변에 벡터를 뿌린다.
+    """
+    from gensim.models import KeyedVectors
+    from simword.embedding import save_store
+
+    rng = np.random.default_rng(seed)
+    centers = rng.standard_normal((max(1, vocab_size // 100), dims)).astype(np.float32)
+    vectors = centers[rng.integers(len(centers), size=vocab_size)] + 0.5 * rng.standard_normal((vocab_size, dims)).astype(np.float32)
+
+    words = [f"단어{i}" for i in range(vocab_size)]
+    model = KeyedVectors(dims)
+    model.add_vectors(words, vectors)
+    save_store(model, path)
+    return words
+
+
+def setup_environment(work_dir, args):
+    """벤치마크용 환경 변수 (이 프로세스와 HTTP 서버 프로세스가 함께 사용)"""
+    env = {
+        "DJANGO_SETTINGS_MODULE": "benchmarks.settings",
+        "SIMWORD_BENCHMARK_DB": os.path.join(work_dir, "suite.sqlite3"),
+        "SIMWORD_MODEL_PATH": os.path.join(work_dir, "model"),
+        "ALLOWED_HOSTS": "127.0.0.1,localhost,testserver",
+    }
+    os.environ.update(env)
+    return env
+
+
+def seed_database(words, args):
+    """AnswerWord / BaseWord 를 채우고 (정답 id 목록, 추측 단어 목록)을 반환"""
+    from django.core.management import call_command
+    from simword.models import AnswerWord, BaseWord
+
+    call_command("migrate", verbosity=0)
+
+    rng = random.Random(args.seed)
+    base_words = rng.sample(words, min(args.base_words, len(words)))
+    answers = rng.sample(base_words, min(args.answers, len(base_words)))
+
+    BaseWord.objects.bulk_create([BaseWord(base_word=word) for word in base_words], batch_size=1000)
+    AnswerWord.objects.bulk_create([AnswerWord(answer_word=word) for word in answers], batch_size=1000)
+
+    # 추측 단어는 등록된 단어와 처음 보는 단어를 섞음
+    guesses = rng.sample(base_words, min(args.guesses // 2, len(base_words)))
+    guesses += rng.sample(words, min(args.guesses - len(guesses), len(words)))
+    return list(AnswerWord.objects.values_list("id", flat=True)), guesses
+
+
+def summarize(latencies):
+    latencies = sorted(latencies)
+    return {
+        "calls": len(latencies),
+        "mean_ms": round(sum(latencies) / len(latencies) * 1000, 3),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 3),
+    }
+
+
+def run_micro(answer_ids, guesses, args):
+    """뷰 함수를 직접 호출해 처음 호출(cold) / 반복 호출(warm) 지연 시간을 측정"""
+    from urllib.parse import quote
+    from django.core.cache import cache
+    from django.test import RequestFactory
+    from simword import views
+    from simword.ranking import clear_rank_indexes
+
+    factory = RequestFactory()
+    rng = random.Random(args.seed)
+    sample_ids = rng.sample(answer_ids, min(args.micro_answers, len(answer_ids)))
+
+    def timed(view, *view_args):
+        request = factory.get(f"/api/simword/{'/'.join(quote(str(arg)) for arg in view_args)}/")
+        started = time.perf_counter()
+        response = view(request, *view_args)
+        elapsed = time.perf_counter() - started
+        if response.status_code != 200:
+            raise RuntimeError(f"{view.__name__}{view_args}: {response.status_code} {response.content[:200]!r}")
+        return elapsed
+
+    # 어휘가 다른 단어 하나를 조회해 엔진(정규화 행렬)을 먼저 만듦
+    views.calculate_similarity(factory.get("/"), sample_ids[0], guesses[0])
+    clear_rank_indexes()
+    cache.clear()
+
+    results = {}
+    results["rank_list_cold"] = summarize([timed(views.get_similarity_rank_list, answer_id) for answer_id in sample_ids])
+    results["rank_list_warm"] = summarize([
+        timed(views.get_similarity_rank_list, rng.choice(sample_ids)) for _ in range(args.micro_calls)
+    ])
+
+    # 순위표가 DB 에 저장된 뒤 프로세스 캐시만 비운 경우 (다른 워커가 처음 요청하는 상황)
+    clear_rank_indexes()
+    results["guess_cold"] = summarize([
+        timed(views.calculate_similarity, answer_id, rng.choice(guesses)) for answer_id in sample_ids
+    ])
+    results["guess_warm"] = summarize([
+        timed(views.calculate_similarity, rng.choice(sample_ids), rng.choice(guesses)) for _ in range(args.micro_calls)
+    ])
+    return results
+
+
+def wait_until_ready(port, timeout):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            urllib.request.urlopen(f"http://127.0.0.1:{port}/api/simword/total/", timeout=1).read()
+            return True
+        except OSError:
+            time.sleep(0.5)
+    return False
+
+
+def run_http(answer_ids, guesses, env, args):
+    """서버를 띄우고 동시성 단계별 부하 테스트 결과 목록을 반환"""
+    from urllib.parse import quote
+
+    rng = random.Random(args.seed)
+    paths = [f"/api/simword/{answer_id}/" for answer_id in answer_ids[:args.http_answers]]
+    paths += [f"/api/simword/{rng.choice(answer_ids[:args.http_answers])}/{quote(word)}/" for word in guesses]
+    rng.shuffle(paths)
+    urls = [f"http://127.0.0.1:{args.port}{path}" for path in paths]
+
+    process = subprocess.Popen(
+        SERVERS[args.server](args.port, args.workers), cwd=ROOT_DIR, env=dict(os.environ, **env),
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        if not wait_until_ready(args.port, args.startup_timeout):
+            raise RuntimeError(f"{args.server} 가 {args.startup_timeout}초 안에 시작되지 않았습니다.")
+
+        run_load(urls, 4, len(urls))  # 캐시 / 순위표 예열
+        results = []
+        for concurrency in args.concurrency:
+            result = run_load(urls, concurrency, args.requests)
+            results.append({"server": args.server, "workers": args.workers, **result})
+            print(
+                f"  c={concurrency:<4} {result['throughput_rps']:>8} req/s  p50 {result['p50_ms']:>8}ms  "
+                f"p95 {result['p95_ms']:>8}ms  p99 {result['p99_ms']:>8}ms  {result['statuses']}"
+            )
+        return results
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def compare(previous, current):
+    """이전 결과 대비 지연 시간 / 처리량 변화를 출력"""
+    print(f"\n이전 결과({previous['meta']['commit']}) 대비")
+    for name, result in current["micro"].items():
+        before = previous.get("micro", {}).get(name)
+        if before:
+            change = (result["p50_ms"] - before["p50_ms"]) / max(before["p50_ms"], 1e-9) * 100
+            print(f"  {name:<16} p50 {before['p50_ms']:>9}ms -> {result['p50_ms']:>9}ms ({change:+.1f}%)")
+
+    previous_http = {item["concurrency"]: item for item in previous.get("http", [])}
+    for result in current["http"]:
+        before = previous_http.get(result["concurrency"])
+        if before:
+            change = (result["throughput_rps"] - before["throughput_rps"]) / max(before["throughput_rps"], 1e-9) * 100
+            print(
+                f"  http c={result['concurrency']:<8} {before['throughput_rps']:>9} -> {result['throughput_rps']:>9} req/s "
+                f"({change:+.1f}%), p99 {before['p99_ms']}ms -> {result['p99_ms']}ms"
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--answers", type=int, default=200, help="AnswerWord 수")
+    parser.add_argument("--base-words", type=int, default=20000, help="BaseWord 수")
+    parser.add_argument("--vocab", type=int, default=50000, help="가상 모델 어휘 수")
+    parser.add_argument("--dims", type=int, default=300, help="가상 모델 벡터 차원")
+    parser.add_argument("--guesses", type=int, default=500, help="추측 요청에 사용할 단어 수")
+    parser.add_argument("--micro-answers", type=int, default=20, help="cold 측정에 사용할 AnswerWord 수")
+    parser.add_argument("--micro-calls", type=int, default=500, help="warm 측정 호출 수")
+    parser.add_argument("--server", choices=list(SERVERS), default="runserver")
+    parser.add_argument("--workers", type=int, default=4, help="gunicorn / uvicorn 워커 수")
+    parser.add_argument("--http-answers", type=int, default=20, help="HTTP 요청에 사용할 AnswerWord 수")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[8, 32])
+    parser.add_argument("--requests", type=int, default=2000, help="동시성 단계별 요청 수")
+    parser.add_argument("--port", type=int, default=8799)
+    parser.add_argument("--startup-timeout", type=float, default=60)
+    parser.add_argument("--skip-http", action="store_true", help="HTTP 부하 테스트 생략")
+    parser.add_argument("--output", help="결과 JSON 경로 (기본값: benchmarks/results/<커밋>-<시각>.json)")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    work_dir = tempfile.mkdtemp(prefix="simword-suite-")
+    env = setup_environment(work_dir, args)
+
+    started = time.perf_counter()
+    words = build_model(env["SIMWORD_MODEL_PATH"], args.vocab, args.dims, args.seed)
+
+    import django
+    django.setup()
+    answer_ids, guesses = seed_database(words, args)
+    print(f"준비 완료: 어휘 {len(words)}개, AnswerWord {len(answer_ids)}개, BaseWord {args.base_words}개 "
+          f"({time.perf_counter() - started:.1f}초, {work_dir})")
+
+    micro = run_micro(answer_ids, guesses, args)
+    for name, result in micro.items():
+        print(f"  {name:<16} mean {result['mean_ms']:>9}ms  p50 {result['p50_ms']:>9}ms  "
+              f"p95 {result['p95_ms']:>9}ms  p99 {result['p99_ms']:>9}ms")
+
+    http = [] if args.skip_http else run_http(answer_ids, guesses, env, args)
+
+    commit = git_commit()
+    report = {
+        "meta": {
+            "commit": commit,
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "cpu_count": os.cpu_count(),
+            "args": vars(args),
+        },
+        "micro": micro,
+        "http": http,
+    }
+
+    output = args.output or os.path.join(RESULTS_DIR, f"{commit}-{datetime.now():%Y%m%d%H%M%S}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"\n결과 저장: {output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            compare(json.load(f), report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+누적 단어 통계 갱신 / 조회 비용 측정
+
+임시 SQLite DB 에 하루 기사 수만큼의 가상 명사 빈도(Zipf 분포 + 며칠간 급증하는 사건 단어)를
+days 일 동안 차례대로 더하면서, 하루 갱신 시간이 누적 데이터 양과 관계없이 일정한지 확인하고
+마지막 날 기준 rolling window / TF-IDF 유행 단어 조회 시간을 출력한다.
+
+    python benchmarks/term_stats.py --days 365 --articles 50 --nouns-per-article 300
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from collections import Counter
+from datetime import date, timedelta
+import numpy as np
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+
+def setup_django(db_path):
+    import django
+
+    os.environ["SIMWORD_BENCHMARK_DB"] = db_path
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "benchmarks.settings")
+    django.setup()
+
+    from django.core.management import call_command
+    call_command("migrate", verbosity=0)
+
+
+def daily_counts(rng, day, args):
+    """하루치 명사 빈도 (상위 단어일수록 자주 나오는 Zipf 분포 + 사흘 동안 급증하는 사건 단어)"""
+    ids = rng.zipf(args.zipf, size=args.articles * args.nouns_per_article) % args.vocab
+    counts = Counter({f"단어{term_id}": int(count) for term_id, count in zip(*np.unique(ids, return_counts=True))})
+    for event_day in range(max(0, day - 2), day + 1):
+        counts[f"사건{event_day}"] += args.articles * 3
+    return counts
+
+
+def average_ms(durations):
+    return round(sum(durations) / len(durations) * 1000, 2) if durations else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--articles", type=int, default=50, help="하루에 새로 분석하는 기사 수")
+    parser.add_argument("--nouns-per-article", type=int, default=300)
+    parser.add_argument("--vocab", type=int, default=50000, help="가상 명사 종류 수")
+    parser.add_argument("--zipf", type=float, default=1.3, help="Zipf 분포 지수")
+    parser.add_argument("--db", help="SQLite DB 경로 (기본값: 임시 파일)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    db_path = args.db or os.path.join(tempfile.mkdtemp(prefix="simword-bench-"), "term_stats.sqlite3")
+    setup_django(db_path)
+
+    from simword.models import TermDailyCount
+    from simword.term_stats import record_counts, trending_terms
+
+    rng = np.random.default_rng(args.seed)
+    start = date(2025, 1, 1)
+    durations = []
+    for day in range(args.days):
+        counts = daily_counts(rng, day, args)
+        hashes = [f"{day:05d}{article:035d}" for article in range(args.articles)]
+
+        started = time.perf_counter()
+        record_counts(counts, hashes, start + timedelta(days=day))
+        durations.append(time.perf_counter() - started)
+
+        if (day + 1) % 30 == 0:
+            print(f"{day + 1:>4}일: 최근 30일 평균 갱신 {average_ms(durations[-30:])}ms")
+
+    until = start + timedelta(days=args.days - 1)
+    print(f"\nDB: {db_path} ({os.path.getsize(db_path) / 1024 / 1024:.1f}MB, {TermDailyCount.objects.count()}행)")
+    print(f"하루 갱신 평균: 처음 30일 {average_ms(durations[:30])}ms / 마지막 30일 {average_ms(durations[-30:])}ms")
+
+    print(f"\n{'method':<8} {'window':>7} {'time(ms)':>9}  top 5")
+    for method in ("count", "tfidf"):
+        for window in (7, 30):
+            started = time.perf_counter()
+            terms = trending_terms(days=window, limit=50, until=until, method=method)
+            elapsed = (time.perf_counter() - started) * 1000
+            print(f"{method:<8} {window:>7} {elapsed:>9.1f}  {', '.join(term for term, _ in terms[:5])}")
+
+
+if __name__ == "__main__":
+    main()
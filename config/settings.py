@@ -55,6 +55,7 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'simword.metrics.MetricsMiddleware',
 ]
 
 ROOT_URLCONF = 'config.urls'
@@ -88,6 +89,49 @@ DATABASES = {
 DATABASES["default"]["OPTIONS"] = {"init_command": "SET sql_mode='STRICT_TRANS_TABLES'"}
 
 
+# FastText 임베딩 모델 경로 (확장자 제외)
+SIMWORD_MODEL_PATH = env("SIMWORD_MODEL_PATH", default=os.path.join(BASE_DIR, "cc.ko.300"))
+
+
+# 캐시 (워커 간 공유를 위해 기본값은 파일 기반)
+CACHES = {
+    "default": env.cache("CACHE_URL", default=f"filecache://{os.path.join(BASE_DIR, 'cache')}"),
+}
+
+# 상위 100개 응답을 브라우저 / Nginx 가 재검증 없이 사용할 수 있는 시간 (초)
+SIMWORD_RANK_LIST_MAX_AGE = env.int("SIMWORD_RANK_LIST_MAX_AGE", default=60)
+
+# 추측 단어를 BaseWord 에 일괄 저장하는 주기 (초, 0 이면 자동 저장하지 않음)
+SIMWORD_BASEWORD_FLUSH_INTERVAL = env.float("SIMWORD_BASEWORD_FLUSH_INTERVAL", default=10)
+
+# ASGI(uvicorn) 로 실행할 때 비동기 뷰 사용 여부 / 유사도 계산 스레드 수
+SIMWORD_ASYNC_VIEWS = env.bool("SIMWORD_ASYNC_VIEWS", default=False)
+SIMWORD_ASYNC_THREADS = env.int("SIMWORD_ASYNC_THREADS", default=4)
+
+# 플레이어 추측 기록을 게임 세션에 일괄 저장하는 주기 (초, 0 이면 자동 저장하지 않음)
+SIMWORD_GUESS_FLUSH_INTERVAL = env.float("SIMWORD_GUESS_FLUSH_INTERVAL", default=2)
+
+# 기사별 명사 추출 결과 캐시 디렉터리 (빈 값이면 캐시하지 않음)
+SIMWORD_NOUN_CACHE_DIR = env("SIMWORD_NOUN_CACHE_DIR", default=os.path.join(BASE_DIR, "noun_cache"))
+
+# 미리 계산한 상위 100개 응답 스냅샷 디렉터리 (빈 값이면 사용하지 않음)
+SIMWORD_SNAPSHOT_DIR = env("SIMWORD_SNAPSHOT_DIR", default=os.path.join(BASE_DIR, "snapshots"))
+
+# /metrics 접근 토큰 (Prometheus 의 bearer_token, 빈 값이면 /metrics 를 제공하지 않음)
+SIMWORD_METRICS_TOKEN = env("SIMWORD_METRICS_TOKEN", default="")
+
+# 응답에 단계별 처리 시간(Server-Timing 헤더)을 붙일지 여부
+SIMWORD_SERVER_TIMING = env.bool("SIMWORD_SERVER_TIMING", default=False)
+
+# 관리 명령 작업(crawl_news 등)이 겹쳐 실행되지 않도록 잡는 잠금 파일 디렉터리
+SIMWORD_JOB_LOCK_DIR = env("SIMWORD_JOB_LOCK_DIR", default=os.path.join(BASE_DIR, "locks"))
+
+# 샘플링 프로파일러: 워커에 시그널을 보내면 켜고 끔 (빈 값이면 등록하지 않음)
+SIMWORD_PROFILE_SIGNAL = env("SIMWORD_PROFILE_SIGNAL", default="SIGUSR2")
+SIMWORD_PROFILE_INTERVAL = env.float("SIMWORD_PROFILE_INTERVAL", default=0.005)
+SIMWORD_PROFILE_DIR = env("SIMWORD_PROFILE_DIR", default=os.path.join(BASE_DIR, "profiles"))
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
 
@@ -157,4 +201,7 @@ CORS_ALLOW_HEADERS = [
     "user-agent",
     "x-csrftoken",
     "x-requested-with",
+    "x-player-id",
 ]
+
+CORS_EXPOSE_HEADERS = ["x-player-id"]  # 쿠키를 쓰지 않는 클라이언트용 플레이어 ID
@@ -16,8 +16,13 @@ Including another URLconf
 """
 from django.contrib import admin
 from django.urls import include, path
+from simword.metrics import metrics_view
+from simword.model_store import healthz, readyz
 
 urlpatterns = [
     path('api/admin/', admin.site.urls),
     path('api/simword/', include('simword.urls')),
+    path('metrics', metrics_view, name='metrics'),
+    path('healthz', healthz, name='healthz'),
+    path('readyz', readyz, name='readyz'),
 ]
\ No newline at end of file
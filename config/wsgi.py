@@ -14,3 +14,8 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
 
 application = get_wsgi_application()
+
+# 모델은 백그라운드에서 준비하고 진행 상황은 /readyz 로 확인 (관리 명령은 이 파일을 거치지 않음)
+from simword.model_store import model_store  # noqa: E402
+
+model_store.warm_up()
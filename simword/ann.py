@@ -0,0 +1,170 @@
+import json
+import os
+import time
+import numpy as np
+from django.conf import settings
+from .embedding import load_model
+
+# IVF-PQ 근사 최근접 이웃 색인
+#   - IVF : 정규화된 벡터를 구면 k-means 로 nlist 개 목록으로 나누고, 질의와 가까운 nprobe 개 목록만 탐색
+#   - PQ  : 벡터를 m 개 부분 공간으로 나눠 각각 256 개 중심점 번호(uint8)로 압축해 내적을 근사
+#   - 근사 점수 상위 후보만 원본 벡터로 다시 계산해 최종 순위를 정함
+INDEX_FILES = ("centroids", "offsets", "ids", "codebooks", "codes")
+ASSIGN_BATCH = 16384
+DEFAULT_NPROBE = 16
+
+
+def index_path(path):
+    """모델 경로에 대응하는 ANN 색인 디렉터리"""
+    return f"{path}.ann"
+
+
+def _normalize(vectors):
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    norms[norms == 0] = 1
+    return vectors / norms
+
+
+def _kmeans(data, k, iterations, rng, spherical=False):
+    """간단한 Lloyd k-means (spherical=True 면 내적 기준으로 중심점을 정규화)"""
+    centroids = data[rng.choice(len(data), k, replace=False)].copy()
+    for _ in range(iterations):
+        assignment = _assign(data, centroids, spherical)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, assignment, data)
+        counts = np.bincount(assignment, minlength=k)
+
+        empty = counts == 0
+        centroids[~empty] = sums[~empty] / counts[~empty, None]
+        # 비어 있는 목록은 임의의 데이터 점으로 다시 시작
+        centroids[empty] = data[rng.choice(len(data), int(empty.sum()), replace=False)]
+        if spherical:
+            centroids = _normalize(centroids)
+    return centroids
+
+
+def _assign(data, centroids, spherical):
+    """각 점에서 가장 가까운 중심점 번호"""
+    assignment = np.empty(len(data), dtype=np.int64)
+    squared = None if spherical else (centroids ** 2).sum(axis=1)
+    for start in range(0, len(data), ASSIGN_BATCH):
+        scores = data[start:start + ASSIGN_BATCH] @ centroids.T
+        if not spherical:
+            scores = 2 * scores - squared  # |x-c|^2 최소화 == 2x·c - |c|^2 최대화
+        assignment[start:start + ASSIGN_BATCH] = scores.argmax(axis=1)
+    return assignment
+
+
+class AnnIndex:
+    """전체 어휘에 대한 IVF-PQ 색인"""
+
+    def __init__(self, vectors, centroids, offsets, ids, codebooks, codes):
+        self.vectors = vectors  # 재정렬용 원본 벡터 (메모리 맵)
+        self.centroids = centroids  # (nlist, dims)
+        self.offsets = offsets  # (nlist + 1,) 목록별 ids / codes 시작 위치
+        self.ids = ids  # 목록 순서로 정렬된 행 번호
+        self.codebooks = codebooks  # (m, 256, dims / m)
+        self.codes = codes  # (rows, m) uint8, ids 와 같은 순서
+        self.model = None  # 행 번호 <-> 단어 변환용 KeyedVectors
+
+    @classmethod
+    def build(cls, vectors, nlist=1024, m=30, train_size=100000, iterations=10, seed=0, report=print):
+        """벡터 행렬로 색인을 학습하고 전체 벡터를 목록에 배정 / 압축"""
+        rows, dims = vectors.shape
+        if dims % m:
+            raise ValueError(f"차원 수({dims})가 부분 공간 수({m})로 나누어떨어져야 합니다.")
+
+        rng = np.random.default_rng(seed)
+        sample = _normalize(vectors[np.sort(rng.choice(rows, min(train_size, rows), replace=False))])
+
+        started = time.perf_counter()
+        centroids = _kmeans(sample, min(nlist, len(sample)), iterations, rng, spherical=True)
+        sub_dims = dims // m
+        codebooks = np.stack([
+            _kmeans(sample[:, j * sub_dims:(j + 1) * sub_dims], min(256, len(sample)), iterations, rng)
+            for j in range(m)
+        ])
+        report(f"학습 완료: {time.perf_counter() - started:.1f}초")
+
+        assignment = np.empty(rows, dtype=np.int64)
+        codes = np.empty((rows, m), dtype=np.uint8)
+        for start in range(0, rows, ASSIGN_BATCH):
+            chunk = _normalize(vectors[start:start + ASSIGN_BATCH])
+            assignment[start:start + len(chunk)] = _assign(chunk, centroids, spherical=True)
+            for j in range(m):
+                codes[start:start + len(chunk), j] = _assign(chunk[:, j * sub_dims:(j + 1) * sub_dims], codebooks[j], spherical=False)
+            report(f"{min(start + ASSIGN_BATCH, rows)}/{rows} 행 배정 ({time.perf_counter() - started:.1f}초)")
+
+        ids = np.argsort(assignment, kind="stable").astype(np.int64)
+        offsets = np.zeros(len(centroids) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(assignment, minlength=len(centroids)), out=offsets[1:])
+        return cls(vectors, centroids, offsets, ids, codebooks, codes[ids])
+
+    def save(self, directory):
+        os.makedirs(directory, exist_ok=True)
+        for name in INDEX_FILES:
+            np.save(os.path.join(directory, f"{name}.npy"), getattr(self, name))
+        with open(os.path.join(directory, "meta.json"), "w") as f:
+            json.dump({"rows": len(self.ids), "nlist": len(self.centroids), "m": len(self.codebooks)}, f)
+
+    @classmethod
+    def load(cls, directory, model):
+        """색인 파일을 메모리 맵으로 열기"""
+        arrays = {name: np.load(os.path.join(directory, f"{name}.npy"), mmap_mode="r") for name in INDEX_FILES}
+        if len(arrays["ids"]) != len(model.vectors):
+            raise ValueError("색인과 모델의 단어 수가 다릅니다. 색인을 다시 생성하세요.")
+        index = cls(model.vectors, **arrays)
+        index.model = model
+        return index
+
+    def search(self, query, k=100, nprobe=DEFAULT_NPROBE, rerank=10, exclude=()):
+        """질의 벡터와 내적이 큰 상위 k개 (행 번호 배열, 코사인 유사도 배열)"""
+        query = _normalize(query)
+        nprobe = min(nprobe, len(self.centroids))
+        lists = np.argpartition(-(self.centroids @ query), nprobe - 1)[:nprobe]
+        candidates = np.concatenate([np.arange(self.offsets[i], self.offsets[i + 1]) for i in lists])
+        if not len(candidates):
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+
+        # 부분 공간별 (질의 · 중심점) 표를 만들어 압축 코드로 내적을 근사
+        m, _, sub_dims = self.codebooks.shape
+        tables = np.einsum("jcd,jd->jc", self.codebooks, query.reshape(m, sub_dims))
+        approximate = tables[np.arange(m), self.codes[candidates]].sum(axis=1)
+
+        shortlist_size = min(len(candidates), k * rerank + len(exclude))
+        shortlist = candidates[np.argpartition(-approximate, shortlist_size - 1)[:shortlist_size]]
+        rows = np.sort(self.ids[shortlist])
+        if len(exclude):
+            rows = rows[~np.isin(rows, exclude)]
+
+        scores = _normalize(self.vectors[rows]) @ query
+        top = np.argsort(-scores, kind="stable")[:k]
+        return rows[top], scores[top]
+
+    def most_similar(self, word, k=100, nprobe=DEFAULT_NPROBE):
+        """단어와 가장 가까운 k개 [(단어, 코사인 유사도)] (단어 자신은 제외)"""
+        row = self.model.key_to_index[word]
+        rows, scores = self.search(self.vectors[row], k, nprobe, exclude=np.array([row]))
+        return [(self.model.index_to_key[int(row)], float(score)) for row, score in zip(rows, scores)]
+
+
+def load_index(path=None):
+    """전체 어휘 저장소와 짝이 되는 ANN 색인을 로드 (없으면 None)"""
+    path = path or settings.SIMWORD_MODEL_PATH
+    directory = index_path(path)
+    if not os.path.exists(os.path.join(directory, "meta.json")):
+        return None
+    return AnnIndex.load(directory, load_model(path, game=False))
+
+
+# 처음 요청 시 한 번 로드
+_index = None
+
+
+def get_index():
+    global _index
+
+    if _index is None:
+        _index = load_index()
+    return _index
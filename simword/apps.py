@@ -4,3 +4,10 @@ from django.apps import AppConfig
 class SimwordConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'simword'
+
+    def ready(self):
+        from . import catalogue  # noqa: F401  AnswerWord 변경 시그널 등록
+        from .profiler import install_signal_handler
+
+        # 워커마다 앱을 불러올 때 등록 (gunicorn --preload 는 워커 시작 시 시그널 처리가 초기화되므로 쓰지 않음)
+        install_signal_handler()
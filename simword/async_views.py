@@ -0,0 +1,152 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from django.conf import settings
+from django.db import close_old_connections
+from django.db.models import Max
+from django.http import Http404, HttpResponse, JsonResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from .caching import RANK_LIST_CACHE_TIMEOUT, get_or_fill, rank_list_etag, rank_list_key
+from .catalogue import answer_words
+from .model_store import model_store
+from .models import BaseWord
+from .ranking import build_similarity_rank_list, get_engine_or_error, get_rank_index
+from .similarity import to_percentage
+from .snapshots import snapshot_response
+from .suggestions import resolve
+from .views import record_guess, resolve_rank, unknown_word_error
+from .vocabulary import buffer as base_word_buffer
+
+# ASGI(uvicorn) 용 비동기 뷰
+#   - DB 조회는 비동기 ORM 으로 처리
+#   - NumPy 계산은 크기가 제한된 스레드 풀에서 실행 (BLAS 연산 중에는 GIL 이 풀림)
+#   - 같은 AnswerWord 에 대한 동시 계산은 하나로 합침
+#   - 풀 스레드의 DB 연결은 request_started / finished 가 정리하지 않으므로 작업마다 전후로 정리
+
+_executor = ThreadPoolExecutor(max_workers=settings.SIMWORD_ASYNC_THREADS, thread_name_prefix="simword")
+
+# 진행 중인 계산 (키 -> Future)
+_inflight = {}
+
+
+def _run_job(func, *args):
+    """오래되었거나 끊긴 DB 연결을 닫고 func 을 실행 (CONN_MAX_AGE 가 지난 연결도 여기서 닫힘)"""
+    close_old_connections()
+    try:
+        return func(*args)
+    finally:
+        close_old_connections()
+
+
+async def run_in_pool(func, *args):
+    """스레드 풀에서 동기 함수를 실행"""
+    return await asyncio.get_running_loop().run_in_executor(_executor, _run_job, func, *args)
+
+
+async def coalesce(key, func, *args):
+    """같은 키로 진행 중인 계산이 있으면 그 결과를 함께 기다림"""
+    future = _inflight.get(key)
+    if future is None:
+        future = asyncio.get_running_loop().run_in_executor(_executor, _run_job, func, *args)
+        _inflight[key] = future
+        future.add_done_callback(lambda _: _inflight.pop(key, None))
+    # 한 요청이 취소되어도 함께 기다리는 다른 요청의 계산은 계속되도록 보호
+    return await asyncio.shield(future)
+
+
+async def get_answer(id):
+    answer = (await answer_words.acurrent()).get(id)
+    if answer is None:
+        raise Http404("No AnswerWord matches the given query.")
+    return answer
+
+
+async def get_vocabulary_version():
+    return (await BaseWord.objects.aaggregate(version=Max("id")))["version"] or 0
+
+
+async def answer_word_count(request):
+    """전체 AnswerWord 개수를 반환"""
+    total_count = len(await answer_words.acurrent())
+    return JsonResponse({"total_count": total_count})
+
+
+async def get_similarity_rank_list(request, id):
+    """특정 AnswerWord와 BaseWord 간 유사도 랭킹 상위 100개를 반환"""
+    try:
+        answer = await get_answer(id)
+        version = await get_vocabulary_version()
+
+        etag = rank_list_etag(answer, version)
+        not_modified = get_conditional_response(request, etag=etag)
+        if not_modified is not None:
+            return not_modified
+
+        response = snapshot_response(request, answer.id)
+        if response is not None:
+            response["ETag"] = etag
+            patch_cache_control(response, public=True, max_age=settings.SIMWORD_RANK_LIST_MAX_AGE)
+            return response
+
+        status, content = await coalesce(
+            ("rank_list", answer.id, version),
+            get_or_fill,
+            rank_list_key(answer.id, version),
+            lambda: build_similarity_rank_list(answer, version),
+            lambda value: value[0] == 200,
+            RANK_LIST_CACHE_TIMEOUT,
+        )
+
+        response = HttpResponse(content, status=status, content_type="application/json")
+        if status == 200:
+            response["ETag"] = etag
+            patch_cache_control(response, public=True, max_age=settings.SIMWORD_RANK_LIST_MAX_AGE)
+        return response
+    except Exception as e:
+        return JsonResponse({"error": str(e)}, status=500)
+
+
+def prepare_rank_index(answer, version):
+    """엔진과 순위표를 준비 (오류가 있으면 오류 응답)"""
+    engine, error = get_engine_or_error(answer, version)
+    if error:
+        return None, None, error
+    return engine, get_rank_index(engine, answer), None
+
+
+def score_guess(engine, rank_index, answer, input_word):
+    score = engine.similarity(input_word, answer.answer_word)
+    similarity_percentage = to_percentage(score)
+    return score, similarity_percentage, resolve_rank(rank_index, input_word, similarity_percentage)
+
+
+async def calculate_similarity(request, id, input_word):
+    """입력 단어와 정답 단어의 유사도를 계산하고, 랭킹을 반환"""
+    try:
+        answer = await get_answer(id)
+
+        # NFC 정규화 / 공백 / 조사 제거 후에도 모델에 없으면 엔진 / 순위표 준비 전에 비슷한 단어만 제시하고 거절
+        vocab = (await model_store.aget()).key_to_index
+        # 조사를 떼어 봐야 하면 BaseWord 목록을 (처음이면 DB 에서) 확인하므로 스레드에서 실행
+        word = input_word if input_word in vocab else await run_in_pool(resolve, input_word, vocab, base_word_buffer)
+        if word is None:
+            return JsonResponse(await run_in_pool(unknown_word_error, input_word), status=400)
+
+        version = await get_vocabulary_version()
+        engine, rank_index, error = await coalesce(("rank_index", answer.id, version), prepare_rank_index, answer, version)
+        if error:
+            # 합쳐진 요청들이 같은 응답 객체를 공유하지 않도록 새로 만듦
+            return HttpResponse(error.content, status=error.status_code, content_type="application/json")
+
+        score, similarity_percentage, rank = await run_in_pool(score_guess, engine, rank_index, answer, word)
+
+        response = JsonResponse({
+            "id": id,
+            "input_word": input_word,
+            "normalized_word": word,
+            "similarity_percentage": similarity_percentage,
+            "rank": rank
+        })
+        record_guess(request, response, answer, word, similarity_percentage, similarity_percentage == 100)
+        return response
+    except Exception as e:
+        return JsonResponse({"error": str(e)}, status=500)
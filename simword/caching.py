@@ -0,0 +1,57 @@
+import hashlib
+import time
+from django.core.cache import cache
+
+# 캐시 형식이 바뀌면 올려서 기존 항목을 무효화
+CACHE_FORMAT = 1
+
+# 상위 100개 응답 캐시 유지 시간 (초)
+RANK_LIST_CACHE_TIMEOUT = 60 * 60 * 24
+
+# 다른 워커가 채우는 중인 캐시를 기다리는 최대 시간 / 확인 간격 (초)
+FILL_LOCK_TIMEOUT = 30
+FILL_WAIT = 10
+FILL_POLL_INTERVAL = 0.05
+
+
+def rank_list_key(answer_id, version):
+    """AnswerWord 와 어휘 버전별 상위 100개 응답 캐시 키"""
+    return f"simword:rank_list:{CACHE_FORMAT}:{answer_id}:{version}"
+
+
+def rank_list_etag(answer, version):
+    """
+    같은 정답 단어 / 어휘 버전이면 응답 내용이 같으므로 이 값으로 ETag 를 만듦
+
+    스냅샷은 gzip 그대로 / 압축을 푼 본문 / 새로 계산한 본문 중 하나로 나가 바이트가 같지 않으므로 약한 ETag 를 씀
+    """
+    source = f"{CACHE_FORMAT}:{answer.id}:{answer.answer_word}:{version}"
+    return f'W/"{hashlib.sha1(source.encode("utf-8")).hexdigest()}"'
+
+
+def get_or_fill(key, compute, should_cache=lambda value: True, timeout=None):
+    """캐시에 없으면 한 워커만 compute() 로 채우고 나머지는 채워질 때까지 기다림"""
+    value = cache.get(key)
+    if value is not None:
+        return value
+
+    lock_key = f"{key}:lock"
+    if cache.add(lock_key, 1, FILL_LOCK_TIMEOUT):
+        try:
+            value = compute()
+            if should_cache(value):
+                cache.set(key, value, timeout)
+            return value
+        finally:
+            cache.delete(lock_key)
+
+    deadline = time.monotonic() + FILL_WAIT
+    while time.monotonic() < deadline:
+        time.sleep(FILL_POLL_INTERVAL)
+        value = cache.get(key)
+        if value is not None:
+            return value
+        if cache.get(lock_key) is None:
+            break  # 채우던 워커가 캐시하지 않고 끝난 경우 (오류 응답 등)
+
+    return compute()
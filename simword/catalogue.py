@@ -0,0 +1,102 @@
+import threading
+import time
+import uuid
+from asgiref.sync import sync_to_async
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.http import Http404
+from .models import AnswerWord
+
+# 다른 워커의 변경 여부(공유 캐시의 세대 값)를 확인하는 최소 간격 (초)
+CHECK_INTERVAL = 5
+GENERATION_KEY = "simword:answer_words:generation"
+
+
+class AnswerWordCatalogue:
+    """AnswerWord 전체 목록 (id -> 단어)을 프로세스 안에 두고 개수 / 조회를 DB 없이 처리
+
+    AnswerWord 가 바뀌면 시그널로 자기 목록을 비우고 공유 캐시의 세대 값을 바꿔,
+    다른 워커도 CHECK_INTERVAL 안에 알아채고 다시 읽도록 한다.
+    """
+
+    def __init__(self):
+        self.answers = None  # id -> AnswerWord (id 오름차순, 처음 사용할 때 로드)
+        self.generation = None
+        self.checked_at = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def current_generation():
+        return cache.get_or_set(GENERATION_KEY, lambda: uuid.uuid4().hex, None)
+
+    def reset(self):
+        """이 프로세스의 목록을 비움 (다음 사용 시 DB 에서 다시 로드)"""
+        self.answers = None
+
+    def invalidate(self):
+        """목록을 비우고 다른 워커에도 변경을 알림"""
+        self.reset()
+        cache.set(GENERATION_KEY, uuid.uuid4().hex, None)
+
+    def _changed_elsewhere(self):
+        """CHECK_INTERVAL 마다 다른 워커가 AnswerWord 를 바꿨는지 확인"""
+        now = time.monotonic()
+        if now - self.checked_at < CHECK_INTERVAL:
+            return False
+        self.checked_at = now
+        return self.current_generation() != self.generation
+
+    def refresh(self):
+        generation = self.current_generation()
+        rows = AnswerWord.objects.order_by("id").values_list("id", "answer_word")
+        # DB 를 다시 조회하지 않도록 저장된 행과 같은 id 를 가진 인스턴스로 보관
+        answers = {answer_id: AnswerWord(id=answer_id, answer_word=word) for answer_id, word in rows}
+
+        with self._lock:
+            self.answers = answers
+            self.generation, self.checked_at = generation, time.monotonic()
+        return answers
+
+    def current(self):
+        """최신 id -> AnswerWord 사전 (id 오름차순)"""
+        answers = self.answers
+        if answers is None or self._changed_elsewhere():
+            answers = self.refresh()
+        return answers
+
+    async def acurrent(self):
+        """비동기 뷰용 current() (다시 읽을 때만 스레드에서 DB 조회)"""
+        answers = self.answers
+        if answers is None or self._changed_elsewhere():
+            answers = await sync_to_async(self.refresh)()
+        return answers
+
+    def count(self):
+        return len(self.current())
+
+    def get(self, answer_id):
+        """id 로 AnswerWord 를 찾음 (없으면 None)"""
+        return self.current().get(answer_id)
+
+    def get_or_404(self, answer_id):
+        answer = self.get(answer_id)
+        if answer is None:
+            raise Http404("No AnswerWord matches the given query.")
+        return answer
+
+    def all(self):
+        """id 오름차순 AnswerWord 목록"""
+        return list(self.current().values())
+
+
+answer_words = AnswerWordCatalogue()
+
+
+@receiver(post_save, sender=AnswerWord)
+@receiver(post_delete, sender=AnswerWord)
+def _answer_word_changed(sender, **kwargs):
+    # 이 프로세스는 바로 다시 읽고, 다른 워커에는 커밋된 뒤에 알림
+    answer_words.reset()
+    transaction.on_commit(answer_words.invalidate)
@@ -0,0 +1,146 @@
+import json
+import os
+import time
+import numpy as np
+from gensim.models import KeyedVectors
+from .embedding import store_paths
+from .vocab_index import VocabIndex
+
+# 한 번에 읽어 변환하는 줄 수
+CHUNK_SIZE = 20000
+
+
+def partial_paths(path):
+    """변환 중간 파일 경로 (벡터, 단어 목록, 체크포인트)"""
+    vectors_path, _ = store_paths(path)
+    return f"{vectors_path}.partial", f"{path}.words.partial", f"{path}.checkpoint.json"
+
+
+def _load_checkpoint(checkpoint_path):
+    if not os.path.exists(checkpoint_path):
+        return None
+    with open(checkpoint_path) as f:
+        return json.load(f)
+
+
+def _save_checkpoint(checkpoint_path, checkpoint):
+    """체크포인트를 임시 파일에 쓴 뒤 교체해 중단되어도 깨지지 않게 저장"""
+    with open(f"{checkpoint_path}.tmp", "w") as f:
+        json.dump(checkpoint, f)
+    os.replace(f"{checkpoint_path}.tmp", checkpoint_path)
+
+
+def _shrink_npy(path, rows, dims):
+    """건너뛴 줄만큼 .npy 헤더의 shape 를 줄이고 남는 영역을 잘라냄"""
+    with open(path, "r+b") as f:
+        np.lib.format.read_magic(f)
+        _, _, dtype = np.lib.format.read_array_header_1_0(f)
+        data_offset = f.tell()
+
+        header = "{'descr': '%s', 'fortran_order': False, 'shape': (%d, %d), }" % (dtype.str, rows, dims)
+        # 헤더 전체 길이는 그대로 두고 공백으로 채움 (magic 6 + 버전 2 + 길이 2 바이트 제외)
+        header = header.ljust(data_offset - 10 - 1) + "\n"
+        f.seek(10)
+        f.write(header.encode("latin1"))
+        f.truncate(data_offset + rows * dims * dtype.itemsize)
+
+
+def _parse_chunk(lines, dims):
+    """줄 목록을 (단어 목록, float16 행렬, 건너뛴 줄 수)로 변환"""
+    words, values, skipped = [], [], 0
+    for line in lines:
+        parts = line.decode("utf-8", errors="ignore").rstrip().rsplit(" ", dims)
+        if len(parts) != dims + 1 or not parts[0]:
+            skipped += 1
+            continue
+        words.append(parts[0])
+        values.extend(parts[1:])
+
+    vectors = np.array(values, dtype=np.float32).reshape(len(words), dims).astype(np.float16)
+    return words, vectors, skipped
+
+
+def convert_vec(vec_path, path, chunk_size=CHUNK_SIZE, report=print):
+    """fastText .vec 텍스트 파일을 메모리 맵 저장소로 스트리밍 변환
+
+    float16 행을 미리 할당한 .npy 메모리 맵에 바로 기록하고, 청크마다
+    체크포인트를 남겨 중단된 경우 이어서 변환한다.
+    """
+    vectors_partial, words_partial, checkpoint_path = partial_paths(path)
+    vectors_path, vocab_path = store_paths(path)
+
+    with open(vec_path, "rb") as vec_file:
+        count, dims = map(int, vec_file.readline().split())
+
+        checkpoint = _load_checkpoint(checkpoint_path)
+        if checkpoint and os.path.exists(vectors_partial) and os.path.exists(words_partial):
+            vectors = np.lib.format.open_memmap(vectors_partial, mode="r+")
+            vec_file.seek(checkpoint["vec_offset"])
+            words_file = open(words_partial, "r+b")
+            words_file.truncate(checkpoint["words_offset"])
+            words_file.seek(checkpoint["words_offset"])
+            report(f"{checkpoint['rows']}/{count} 행부터 이어서 변환합니다.")
+        else:
+            checkpoint = {"rows": 0, "skipped": 0, "vec_offset": vec_file.tell(), "words_offset": 0}
+            vectors = np.lib.format.open_memmap(vectors_partial, mode="w+", dtype=np.float16, shape=(count, dims))
+            words_file = open(words_partial, "wb")
+
+        started = time.perf_counter()
+        start_offset = checkpoint["vec_offset"]
+        total_bytes = os.path.getsize(vec_path)
+
+        with words_file:
+            while True:
+                lines = [line for line in (vec_file.readline() for _ in range(chunk_size)) if line]
+                if not lines:
+                    break
+
+                words, chunk, skipped = _parse_chunk(lines, dims)
+                rows = checkpoint["rows"]
+                vectors[rows:rows + len(words)] = chunk
+                words_file.write("".join(f"{word}\n" for word in words).encode("utf-8"))
+
+                # 벡터와 단어를 디스크에 반영한 뒤에 체크포인트를 갱신
+                vectors.flush()
+                words_file.flush()
+                checkpoint.update(
+                    rows=rows + len(words),
+                    skipped=checkpoint["skipped"] + skipped,
+                    vec_offset=vec_file.tell(),
+                    words_offset=words_file.tell(),
+                )
+                _save_checkpoint(checkpoint_path, checkpoint)
+
+                elapsed = time.perf_counter() - started
+                processed_mb = (checkpoint["vec_offset"] - start_offset) / 1024 / 1024
+                report(
+                    f"{checkpoint['rows']}/{count} 행 ({checkpoint['vec_offset'] / total_bytes:.1%}), "
+                    f"{processed_mb / elapsed:.1f}MB/s, 건너뜀 {checkpoint['skipped']}"
+                )
+
+    del vectors
+    if checkpoint["rows"] < count:
+        _shrink_npy(vectors_partial, checkpoint["rows"], dims)
+
+    with open(words_partial, encoding="utf-8") as f:
+        VocabIndex.write(f.read().split("\n")[:-1], vocab_path)
+    os.replace(vectors_partial, vectors_path)
+    os.remove(words_partial)
+    os.remove(checkpoint_path)
+    return checkpoint["rows"]
+
+
+def convert_kv(kv_path, path, chunk_size=CHUNK_SIZE * 10):
+    """gensim .kv 파일을 메모리 맵 저장소로 변환 (벡터는 메모리 맵으로 읽어 청크 단위 복사)"""
+    model = KeyedVectors.load(kv_path, mmap="r")
+    vectors_path, vocab_path = store_paths(path)
+
+    vectors = np.lib.format.open_memmap(f"{vectors_path}.partial", mode="w+", dtype=np.float16, shape=model.vectors.shape)
+    for start in range(0, len(model.vectors), chunk_size):
+        vectors[start:start + chunk_size] = model.vectors[start:start + chunk_size]
+    vectors.flush()
+    del vectors
+
+    VocabIndex.write(model.index_to_key, vocab_path)
+    os.replace(f"{vectors_path}.partial", vectors_path)
+    return len(model.index_to_key)
@@ -0,0 +1,110 @@
+import numpy as np
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+from .models import AnswerWord, AnswerWordStats
+from .ranking import TOP_N
+from .similarity import to_percentage
+
+# 저장할 유사도 분포 백분위 / 힌트로 제공할 순위
+PERCENTILES = (50, 90, 99, 99.9)
+HINT_RANKS = (1, 10, 100)
+
+# 상위 TOP_N 이웃의 평균 유사도가 이보다 낮으면 출제에 부적합으로 표시
+MIN_DENSITY = 0.3
+
+# 한 번에 계산할 유사도 행렬 크기 (정답 수 x 후보 수, float32 기준 128MB)
+BATCH_CELLS = 1 << 25
+
+
+def answer_stats(engine, words, batch_size=None):
+    """
+    정답 단어들과 후보 단어 전체의 유사도 분포 통계를 배치 행렬 곱으로 계산해 (단어, 통계)를 차례로 반환합니다.
+
+    통계: 후보 수, 1 / 10 / 100위 유사도, 분포 백분위, 이웃 밀도(상위 TOP_N 평균 유사도)
+    """
+    state = engine.state
+    if not len(state.words):
+        return
+
+    batch_size = batch_size or max(1, BATCH_CELLS // len(state.words))
+
+    for start in range(0, len(words), batch_size):
+        batch = words[start:start + batch_size]
+        vectors = engine.normalize(engine.model.vectors[[engine.model.key_to_index[word] for word in batch]])
+        scores = (vectors @ state.matrix.T).astype(np.float32)  # (정답 수, 후보 수)
+
+        for i, word in enumerate(batch):
+            yield word, score_stats(scores[i], state.index.get(word))
+
+
+def score_stats(scores, answer_row=None):
+    """
+    한 정답 단어와 후보 단어들의 유사도 배열로 통계를 계산합니다.
+
+    정답 단어 자신(answer_row)은 값을 바꾸지 않고 마스크로 빼며, 남은 후보가 없으면 백분위 / 순위 유사도는 비워 둡니다.
+    """
+    if answer_row is not None:
+        mask = np.ones(len(scores), dtype=bool)
+        mask[answer_row] = False
+        scores = scores[mask]
+
+    count = len(scores)
+    if not count:
+        return {"candidate_count": 0, **{f"top{rank}": None for rank in HINT_RANKS}, "percentiles": {}, "density": 0.0}
+
+    k = min(TOP_N, count)
+    neighbours = -np.sort(-np.partition(scores, count - k)[count - k:])
+    percentiles = np.percentile(scores, PERCENTILES)
+    return {
+        "candidate_count": count,
+        **{f"top{rank}": to_percentage(neighbours[rank - 1]) if rank <= k else None for rank in HINT_RANKS},
+        "percentiles": {str(p): to_percentage(value) for p, value in zip(PERCENTILES, percentiles)},
+        "density": round(float(neighbours.mean()), 4),
+    }
+
+
+def unusable_answer_ids(answer_ids):
+    """answer_ids 중 vet_answers 가 출제에 부적합으로 표시한 AnswerWord id 집합 (통계가 없으면 적합으로 봄)"""
+    return set(
+        AnswerWordStats.objects.filter(answer_word_id__in=answer_ids, usable=False).values_list("answer_word_id", flat=True)
+    )
+
+
+def stale_answers(version, missing_only=False):
+    """통계가 없거나 (missing_only 가 아니면) 어휘 버전이 지난 AnswerWord"""
+    condition = Q(stats__isnull=True)
+    if not missing_only:
+        condition |= Q(stats__vocab_version__lt=version)
+    return AnswerWord.objects.filter(condition).order_by("id")
+
+
+def vet_answers(engine, answers, version, min_density=MIN_DENSITY, batch_size=None, dry_run=False):
+    """
+    정답 단어 통계를 계산해 AnswerWordStats 에 저장하고, 모델에 없어 계산하지 못한 단어 목록과
+    저장한(dry_run 이면 계산한) 통계 목록을 반환합니다.
+    """
+    answers = list(answers)
+    missing = [answer for answer in answers if answer.answer_word not in engine.model.key_to_index]
+    by_word = {answer.answer_word: answer for answer in answers if answer.answer_word in engine.model.key_to_index}
+
+    results = []
+    for word, stats in answer_stats(engine, list(by_word), batch_size):
+        usable = stats["candidate_count"] >= TOP_N and stats["density"] >= min_density
+        results.append(AnswerWordStats(answer_word=by_word[word], vocab_version=version, usable=usable, **stats))
+
+    if not dry_run and results:
+        with transaction.atomic():
+            existing = dict(
+                AnswerWordStats.objects.filter(answer_word__in=[stats.answer_word for stats in results])
+                .values_list("answer_word_id", "id")
+            )
+            now = timezone.now()
+            for stats in results:
+                stats.id, stats.updated_at = existing.get(stats.answer_word.id), now
+
+            fields = ["vocab_version", "candidate_count", "top1", "top10", "top100", "percentiles", "density", "usable", "updated_at"]
+            AnswerWordStats.objects.bulk_update([stats for stats in results if stats.id], fields)
+            AnswerWordStats.objects.bulk_create([stats for stats in results if not stats.id])
+
+    return missing, results
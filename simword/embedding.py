@@ -0,0 +1,160 @@
+import json
+import mmap
+import os
+import struct
+import numpy as np
+from django.conf import settings
+from .vocab_index import VocabIndex
+
+# 게임용 축소 모델 파일 구조
+#   헤더 : 매직(8바이트) + JSON 메타데이터 길이(uint64) + JSON 메타데이터
+#   이후 ALIGNMENT 단위로 정렬된 어휘 색인, 벡터, (int8 인 경우) 행별 스케일
+ARTIFACT_MAGIC = b"SWGAME01"
+ARTIFACT_HEADER = struct.Struct("<8sQ")
+ALIGNMENT = 64
+QUANTIZATIONS = ("float32", "float16", "int8")
+
+
+def store_paths(path):
+    """임베딩 저장소 파일 경로 (벡터 .npy, 어휘 색인)"""
+    return f"{path}.vectors.npy", f"{path}.vocab"
+
+
+def store_exists(path):
+    return all(os.path.exists(file_path) for file_path in store_paths(path))
+
+
+def save_store(model, path):
+    """KeyedVectors 를 메모리 맵용 저장소(.npy + 어휘 색인)로 저장"""
+    vectors_path, vocab_path = store_paths(path)
+    np.save(vectors_path, np.ascontiguousarray(model.vectors))
+    VocabIndex.write(model.index_to_key, vocab_path)
+
+
+def make_keyed_vectors(vectors, vocab):
+    """메모리 맵 벡터와 어휘 색인을 KeyedVectors 인터페이스로 감쌈"""
+    # gensim 은 import 에만 1초 이상 걸리므로 어휘만 쓰는 스크립트에서는 불러오지 않음
+    from gensim.models import KeyedVectors
+
+    model = KeyedVectors(vectors.shape[1], dtype=vectors.dtype)
+    model.vectors = vectors
+    model.key_to_index = vocab
+    model.index_to_key = vocab.keys_by_row
+    return model
+
+
+def load_store(path):
+    """저장소를 읽기 전용 메모리 맵으로 열기 (워커 간 페이지 캐시 공유)"""
+    vectors_path, vocab_path = store_paths(path)
+    return make_keyed_vectors(np.load(vectors_path, mmap_mode="r"), VocabIndex.open(vocab_path))
+
+
+def artifact_path(path):
+    """게임용 축소 모델 파일 경로"""
+    return f"{path}.game"
+
+
+def quantize(vectors, quantization):
+    """벡터를 지정한 형식으로 양자화 (int8 은 행별 스케일을 함께 반환)"""
+    if quantization == "int8":
+        vectors = np.asarray(vectors, dtype=np.float32)
+        scales = np.abs(vectors).max(axis=1) / 127
+        scales[scales == 0] = 1
+        return np.round(vectors / scales[:, None]).astype(np.int8), scales.astype(np.float32)
+    return np.asarray(vectors, dtype=quantization), None
+
+
+def _align(position):
+    return (position + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+
+def save_artifact(words, vectors, path, quantization="float16"):
+    """단어 목록과 벡터를 한 파일짜리 게임용 모델로 저장"""
+    codes, scales = quantize(vectors, quantization)
+    vocab_bytes = VocabIndex.to_bytes(words)
+
+    sections = [("vocab", vocab_bytes), ("vectors", codes.tobytes())]
+    if scales is not None:
+        sections.append(("scales", scales.tobytes()))
+
+    metadata = {"rows": codes.shape[0], "dims": codes.shape[1], "dtype": codes.dtype.str, "quantization": quantization}
+    # 메타데이터 길이가 오프셋에 영향을 주므로 여유 공간을 두고 위치를 계산
+    position = _align(ARTIFACT_HEADER.size + 1024)
+    for name, data in sections:
+        metadata[f"{name}_offset"] = position
+        position = _align(position + len(data))
+
+    header = json.dumps(metadata).encode("utf-8")
+    if ARTIFACT_HEADER.size + len(header) > metadata["vocab_offset"]:
+        raise ValueError("메타데이터가 너무 큽니다.")
+
+    with open(path, "wb") as f:
+        f.write(ARTIFACT_HEADER.pack(ARTIFACT_MAGIC, len(header)) + header)
+        for name, data in sections:
+            f.seek(metadata[f"{name}_offset"])
+            f.write(data)
+
+
+def _open_artifact(path):
+    """게임용 축소 모델 파일을 메모리 맵으로 열어 (버퍼, 메타데이터)를 반환"""
+    with open(path, "rb") as f:
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    magic, header_size = ARTIFACT_HEADER.unpack_from(buffer)
+    if magic != ARTIFACT_MAGIC:
+        raise ValueError("올바른 게임용 모델 파일이 아닙니다.")
+    return buffer, json.loads(buffer[ARTIFACT_HEADER.size:ARTIFACT_HEADER.size + header_size])
+
+
+def load_artifact(path):
+    """게임용 축소 모델을 읽기 전용 메모리 맵으로 열기
+
+    int8 양자화 모델도 행별 스케일은 코사인 유사도에 영향을 주지 않으므로
+    정수 코드를 그대로 벡터로 사용한다.
+    """
+    buffer, metadata = _open_artifact(path)
+    vocab = VocabIndex(buffer, metadata["vocab_offset"])
+    vectors = np.frombuffer(
+        buffer, dtype=metadata["dtype"], count=metadata["rows"] * metadata["dims"], offset=metadata["vectors_offset"]
+    ).reshape(metadata["rows"], metadata["dims"])
+    return make_keyed_vectors(vectors, vocab)
+
+
+def load_model(path=None, game=True):
+    """FastText 모델을 로드
+
+    game=True 이고 게임용 축소 모델이 있으면 그것을 우선 사용한다.
+    .vec / .kv 원본 변환은 웹 프로세스에서 하지 않으며 convert_model 명령으로 미리 수행한다.
+    """
+    path = path or settings.SIMWORD_MODEL_PATH
+
+    if game and os.path.exists(artifact_path(path)):
+        return load_artifact(artifact_path(path))
+
+    if not store_exists(path):
+        raise FileNotFoundError(
+            f"임베딩 저장소({path}.vectors.npy)가 없습니다. "
+            f"'python manage.py convert_model --source {path}.vec' 로 먼저 변환하세요."
+        )
+    return load_store(path)
+
+
+def load_vocabulary(path=None, game=False):
+    """어휘 색인만 메모리 맵으로 열기 (단어 포함 여부만 확인하는 스크립트용)
+
+    벡터와 gensim 을 불러오지 않으므로 수 MB 메모리로 즉시 열린다.
+    game=True 이고 게임용 축소 모델이 있으면 그 모델의 어휘를 사용한다.
+    """
+    path = path or settings.SIMWORD_MODEL_PATH
+
+    if game and os.path.exists(artifact_path(path)):
+        buffer, metadata = _open_artifact(artifact_path(path))
+        return VocabIndex(buffer, metadata["vocab_offset"])
+
+    _, vocab_path = store_paths(path)
+    if not os.path.exists(vocab_path):
+        raise FileNotFoundError(
+            f"어휘 색인({vocab_path})이 없습니다. "
+            f"'python manage.py convert_model --source {path}.vec' 로 먼저 변환하세요."
+        )
+    return VocabIndex.open(vocab_path)
@@ -0,0 +1,229 @@
+import atexit
+import logging
+import re
+import struct
+import threading
+import time
+import uuid
+import numpy as np
+from django.conf import settings
+from django.db import close_old_connections, connection, transaction
+from django.utils import timezone
+from .leaderboard import record_solves
+from .models import GameSession
+
+logger = logging.getLogger(__name__)
+
+# 플레이어별 추측 기록
+#   - 로그인 없이 쿠키(또는 X-Player-Id 헤더)의 임의 ID 로 플레이어를 구분
+#   - 추측 하나는 단어(words 에 줄바꿈으로 구분)와 응답에 준 유사도(%)의 100배 int16 2바이트로, 세션 행 하나에 이어 붙여 저장
+#     (모델 행 번호는 모델 파일을 바꾸면 다른 단어를 가리키므로 단어 자체를 저장)
+#   - 요청 중에는 메모리에만 쌓고 백그라운드 스레드가 주기적으로 한 번에 저장
+GUESS_RECORD = struct.Struct("<h")
+GUESS_DTYPE = np.dtype("<i2")
+WORD_SEPARATOR = "\n"
+
+PLAYER_COOKIE = "simword_player"
+PLAYER_HEADER = "X-Player-Id"
+PLAYER_COOKIE_MAX_AGE = 60 * 60 * 24 * 365
+_PLAYER_ID = re.compile(r"^[0-9a-f]{32}$")
+
+# 한 번의 UPDATE / INSERT 문에 넣는 최대 행 수
+BATCH_SIZE = 500
+
+
+def get_player_id(request):
+    """요청의 플레이어 ID (없거나 형식이 틀리면 None)"""
+    player = request.headers.get(PLAYER_HEADER) or request.COOKIES.get(PLAYER_COOKIE)
+    return player if player and _PLAYER_ID.match(player) else None
+
+
+def new_player_id():
+    return uuid.uuid4().hex
+
+
+def set_player_id(response, player):
+    """새 플레이어 ID 를 쿠키와 응답 헤더로 전달"""
+    response.set_cookie(PLAYER_COOKIE, player, max_age=PLAYER_COOKIE_MAX_AGE, httponly=True, samesite="Lax")
+    response[PLAYER_HEADER] = player
+
+
+class _Pending:
+    __slots__ = ("words", "data", "count", "solved", "solved_at")
+
+    def __init__(self):
+        self.words = []
+        self.data = bytearray()
+        self.count = 0
+        self.solved = None  # 이 대기분 안에서 정답을 맞힌 추측 번호 (1부터)
+        self.solved_at = None
+
+
+class GuessRecorder:
+    """게임 세션별 추측 기록을 모았다가 주기적으로 세션 행에 일괄 추가
+
+    추측 한 번은 잠금 안에서 단어와 2바이트를 덧붙이는 것이 전부라 응답 시간에 영향을 주지 않는다.
+    다른 워커가 아직 저장하지 않은 추측은 다음 flush 까지 조회 결과에 보이지 않는다.
+    """
+
+    def __init__(self):
+        self.pending = {}  # (플레이어 ID, AnswerWord id) -> _Pending
+        self.flushing = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._thread = None
+
+    def reset(self):
+        with self._lock:
+            self.pending, self.flushing = {}, {}
+
+    def record(self, player, answer_id, word, similarity_percentage, solved=False):
+        """추측 하나(단어, 응답에 준 유사도 %)를 대기열에 추가 (DB 에는 flush 때 저장)"""
+        with self._lock:
+            entry = self.pending.get((player, answer_id))
+            if entry is None:
+                entry = self.pending[(player, answer_id)] = _Pending()
+            entry.words.append(word)
+            entry.data += GUESS_RECORD.pack(round(similarity_percentage * 100))
+            entry.count += 1
+            if solved and entry.solved is None:
+                entry.solved, entry.solved_at = entry.count, timezone.now()
+        self._start()
+
+    def flush(self):
+        """대기 중인 추측을 세션 행에 덧붙여 저장하고 저장한 추측 수를 반환"""
+        with self._flush_lock:
+            with self._lock:
+                self.flushing, self.pending = self.pending, {}
+            entries = self.flushing
+            if not entries:
+                return 0
+
+            try:
+                self._save(entries)
+            except Exception:
+                with self._lock:
+                    # 다음 flush 때 다시 시도 (그 사이 새로 쌓인 추측은 뒤에 붙임)
+                    for key, entry in self.pending.items():
+                        self._merge(entries, key, entry)
+                    self.pending, self.flushing = entries, {}
+                raise
+
+            with self._lock:
+                self.flushing = {}
+            return sum(entry.count for entry in entries.values())
+
+    @staticmethod
+    def _merge(entries, key, entry):
+        target = entries.get(key)
+        if target is None:
+            entries[key] = entry
+            return
+        if entry.solved is not None and target.solved is None:
+            target.solved, target.solved_at = target.count + entry.solved, entry.solved_at
+        target.words += entry.words
+        target.data += entry.data
+        target.count += entry.count
+
+    def _save(self, entries):
+        # 처음 보는 세션은 빈 행을 먼저 만들고 (동시에 만든 워커가 있어도 무시), 잠근 뒤 기록을 덧붙임
+        GameSession.objects.bulk_create(
+            [GameSession(player_id=player, answer_word_id=answer_id) for player, answer_id in entries],
+            batch_size=BATCH_SIZE, ignore_conflicts=True,
+        )
+
+        with transaction.atomic():
+            sessions = GameSession.objects.select_for_update().filter(
+                player_id__in={player for player, _ in entries}, answer_word_id__in={answer_id for _, answer_id in entries}
+            )
+            now = timezone.now()
+            updated, solves = [], []
+            for session in sessions:
+                entry = entries.get((session.player_id, session.answer_word_id))
+                if entry is None:
+                    continue
+                if entry.solved is not None and session.solved_guesses is None:
+                    session.solved_guesses = session.guess_count + entry.solved
+                    session.solved_at = entry.solved_at
+                    solves.append((session.answer_word_id, session.player_id, session.solved_guesses, session.solved_at))
+                session.words = WORD_SEPARATOR.join(([session.words] if session.words else []) + entry.words)
+                session.guesses = bytes(session.guesses) + bytes(entry.data)
+                session.guess_count += entry.count
+                session.updated_at = now
+                updated.append(session)
+
+            GameSession.objects.bulk_update(
+                updated, ["words", "guesses", "guess_count", "solved_guesses", "solved_at", "updated_at"], batch_size=BATCH_SIZE
+            )
+            record_solves(solves)  # 처음 정답을 맞힌 세션만 리더보드에 추가
+
+    def history(self, player, answer_id):
+        """
+        저장된 기록과 이 프로세스의 대기분을 합친 (추측 단어 목록, 유사도 배열(% x 100), 정답까지 추측 횟수 또는 None)을 반환합니다.
+
+        flush 와 겹쳐 같은 추측을 두 번 읽지 않도록 flush 잠금 안에서 읽습니다.
+        """
+        key = (player, answer_id)
+        with self._flush_lock:
+            session = GameSession.objects.filter(player_id=player, answer_word_id=answer_id).first()
+            with self._lock:
+                entry = self.pending.get(key)
+                words = list(entry.words) if entry else []
+                data = bytes(entry.data) if entry else b""
+                pending_solved = entry.solved if entry else None
+
+        stored = bytes(session.guesses) if session else b""
+        stored_words = session.words.split(WORD_SEPARATOR) if session and session.words else []
+        solved = session.solved_guesses if session else None
+        if solved is None and pending_solved is not None:
+            solved = (session.guess_count if session else 0) + pending_solved
+        return stored_words + words, np.frombuffer(stored + data, dtype=GUESS_DTYPE), solved
+
+    def _start(self):
+        """주기적으로 flush 하는 백그라운드 스레드를 (워커 프로세스마다 한 번) 시작"""
+        interval = settings.SIMWORD_GUESS_FLUSH_INTERVAL
+        if not interval or self._thread is not None:
+            return
+
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, args=(interval,), name="guess-flush", daemon=True)
+                self._thread.start()
+
+    def _run(self, interval):
+        while True:
+            time.sleep(interval)
+            close_old_connections()
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("추측 기록 저장 실패")
+            finally:
+                connection.close()
+
+
+def sorted_guesses(words, percentages):
+    """
+    추측 기록에서 단어별 첫 추측만 남겨 유사도 내림차순 (단어, 유사도 %, 추측 번호) 목록을 반환합니다.
+
+    유사도가 같으면 먼저 추측한 단어가 앞에 옵니다.
+    """
+    if not words:
+        return []
+    unique, first = np.unique(np.array(words), return_index=True)
+    scores = percentages[first].astype(np.int32)
+    order = np.lexsort((first, -scores))
+    return [(str(unique[i]), int(scores[i]) / 100, int(first[i]) + 1) for i in order]
+
+
+recorder = GuessRecorder()
+
+
+@atexit.register
+def _flush_on_exit():
+    # 워커 종료 시 남은 추측을 저장
+    if recorder.pending:
+        try:
+            recorder.flush()
+        except Exception:
+            logger.exception("추측 기록 저장 실패")
@@ -0,0 +1,58 @@
+import time
+from django.db import transaction
+from .catalogue import answer_words
+from .models import AnswerWord, BaseWord
+from .ranking import clear_rank_indexes
+from .snapshots import invalidate as invalidate_snapshots
+
+# 한 번의 INSERT 문에 넣는 최대 행 수
+BATCH_SIZE = 1000
+
+
+def ingest_words(words, model_class, field_name, vocabulary, dry_run=False, report=print):
+    """
+    단어 목록 중 임베딩 어휘에 있고 아직 저장되지 않은 단어만 한 트랜잭션에서 일괄 저장하고 저장한 개수를 반환합니다.
+
+    vocabulary 는 `in` 으로 포함 여부를 확인할 수 있는 객체 (KeyedVectors.key_to_index 등) 이며,
+    서버가 게임용 축소 모델을 쓰면 그 어휘(load_vocabulary(game=True))를 넘겨야 점수를 계산할 수 없는 단어가 저장되지 않습니다.
+    dry_run=True 이면 저장하지 않고 저장할 단어 수만 계산합니다.
+    """
+    started = time.perf_counter()
+    max_length = model_class._meta.get_field(field_name).max_length
+
+    # 중복 제거 (순서 유지) 후 점수를 계산할 수 없는 단어는 제외
+    words = list(dict.fromkeys(word for word in words if word))
+    valid_words = [word for word in words if word in vocabulary and len(word) <= max_length]
+
+    created = 0
+    if valid_words:
+        with transaction.atomic():
+            existing = set(
+                model_class.objects.filter(**{f"{field_name}__in": valid_words}).values_list(field_name, flat=True)
+            )
+            new_words = [word for word in valid_words if word not in existing]
+            if dry_run:
+                created = len(new_words)
+            elif new_words:
+                # 동시에 다른 프로세스가 같은 단어를 넣어도 실패하지 않도록 충돌은 무시하고,
+                # 무시된 행은 빼고 실제로 저장된 행 수를 셈 (트랜잭션 안이라 다른 프로세스가 커밋한 행은 보이지 않음)
+                model_class.objects.bulk_create(
+                    [model_class(**{field_name: word}) for word in new_words], batch_size=BATCH_SIZE, ignore_conflicts=True,
+                )
+                created = model_class.objects.filter(**{f"{field_name}__in": new_words}).count()
+
+    if created and model_class is BaseWord and not dry_run:
+        # 공유 캐시 / RankTable 은 어휘 버전(최대 id)이 키라 다음 요청 때 새로 계산 / 증분 갱신되고,
+        # 이 프로세스 안에 남은 이전 버전 순위표만 비움 (스냅샷은 새 단어가 상위 100개에 들어가는 것만 지움)
+        clear_rank_indexes()
+        invalidate_snapshots(new_words)
+    if created and model_class is AnswerWord and not dry_run:
+        answer_words.invalidate()  # bulk_create 는 post_save 시그널을 보내지 않음
+
+    elapsed = time.perf_counter() - started
+    if report:
+        report(
+            f"{model_class.__name__}: {len(words)}개 중 어휘에 있는 단어 {len(valid_words)}개, "
+            f"새 단어 {created}개 {'저장 예정' if dry_run else '저장'} ({elapsed * 1000:.1f}ms, {len(words) / max(elapsed, 1e-9):.0f}단어/초)"
+        )
+    return created
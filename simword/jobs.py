@@ -0,0 +1,224 @@
+import fcntl
+import gzip
+import os
+import time
+import schedule
+from contextlib import contextmanager
+from django.conf import settings
+from django.utils import timezone
+from .caching import RANK_LIST_CACHE_TIMEOUT, get_or_fill, rank_list_key
+from .model_store import model_store
+from .models import AnswerWord, BaseWord, JobRun, RankTable
+from .ranking import TOP_N, build_similarity_rank_list, get_engine_or_error, get_rank_index, get_vocabulary_version
+from .similarity import SYNC_OVERLAP, get_engine
+from .snapshots import generation_dir, invalidate, manifest_entry, publish, read_manifest, snapshot_path, write_manifest, write_snapshot
+
+
+class JobLocked(Exception):
+    """같은 이름의 작업이 이미 실행 중"""
+
+
+class Job:
+    """실행 중인 작업 (단계별 소요 시간 / 처리 결과를 JobRun 에 기록)"""
+
+    def __init__(self, run, report=print):
+        self.run = run
+        self.report = report
+        self.elapsed = {}  # 단계 -> 누적 소요 시간 (초, 반올림 전)
+
+    @property
+    def dry_run(self):
+        return self.run.dry_run
+
+    def _add_time(self, name, elapsed):
+        self.elapsed[name] = self.elapsed.get(name, 0) + elapsed
+        self.run.timings[name] = round(self.elapsed[name], 3)
+        self.report(f"[{self.run.name}] {name}: {elapsed:.2f}초")
+
+    @contextmanager
+    def stage(self, name, exclude=()):
+        """with 블록의 소요 시간을 name 단계 시간으로 기록 (그 사이 exclude 단계에 기록된 시간은 뺌)"""
+        started = time.perf_counter()
+        excluded = sum(self.elapsed.get(other, 0) for other in exclude)
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            elapsed -= sum(self.elapsed.get(other, 0) for other in exclude) - excluded
+            self._add_time(name, elapsed)
+
+    def timed(self, name, iterable, count=None):
+        """
+        iterable 의 다음 항목을 기다린 시간만 name 단계 시간으로 기록하면서 항목을 그대로 넘겨 줍니다.
+
+        수집하면서 바로 분석하는 스트리밍 단계용이며, count 를 주면 넘겨 준 항목 수를 그 이름으로 기록합니다.
+        """
+        iterator = iter(iterable)
+        elapsed, items = 0, 0
+        try:
+            while True:
+                started = time.perf_counter()
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+                finally:
+                    elapsed += time.perf_counter() - started
+                items += 1
+                yield item
+        finally:
+            self._add_time(name, elapsed)
+            if count:
+                self.record(**{count: items})
+
+    def record(self, **stats):
+        self.run.stats.update(stats)
+
+
+@contextmanager
+def job_lock(name):
+    """
+    작업 이름별 잠금 파일에 flock 을 겁니다. 이미 다른 프로세스가 잡고 있으면 JobLocked 를 발생시킵니다.
+
+    잠금은 파일을 닫거나 프로세스가 죽으면 OS 가 바로 풀며, 같은 호스트(같은 SIMWORD_JOB_LOCK_DIR)에서 실행하는 작업끼리만 막습니다.
+    """
+    os.makedirs(settings.SIMWORD_JOB_LOCK_DIR, exist_ok=True)
+    with open(os.path.join(settings.SIMWORD_JOB_LOCK_DIR, f"{name}.lock"), "a") as f:
+        try:
+            fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            raise JobLocked(f"'{name}' 작업이 이미 실행 중입니다.")
+        yield
+
+
+@contextmanager
+def run_job(name, dry_run=False, report=print):
+    """
+    작업 잠금을 잡고 JobRun 을 기록하면서 작업을 실행합니다. 이미 실행 중이면 JobLocked 를 발생시킵니다.
+    """
+    with job_lock(name):
+        run = JobRun.objects.create(name=name, dry_run=dry_run)
+        job = Job(run, report)
+        try:
+            yield job
+            run.status = "success"
+        except Exception as e:
+            run.status, run.error = "failed", str(e)
+            raise
+        finally:
+            run.finished_at = timezone.now()
+            run.save()
+
+
+def precompute_rankings(answers=None, report=print):
+    """
+    AnswerWord 순위표와 상위 100개 응답 캐시를 최신 어휘 버전으로 미리 계산하고 계산한 개수를 반환합니다.
+
+    answers 를 주지 않으면 순위표가 있지만 어휘 버전이 지난 AnswerWord(이미 출제된 단어)만 갱신합니다.
+    """
+    version = get_vocabulary_version()
+    if answers is None:
+        answers = [table.answer_word for table in RankTable.objects.filter(vocab_version__lt=version).select_related("answer_word")]
+
+    count = 0
+    for answer in answers:
+        if precompute_answer(answer, version, report) is not None:
+            count += 1
+    return count
+
+
+def precompute_answer(answer, version, report=print):
+    """AnswerWord 하나의 순위표와 상위 100개 응답 캐시를 채우고 응답 본문을 반환 (계산할 수 없으면 None)"""
+    engine, error = get_engine_or_error(answer, version)
+    if error:
+        report(f"{answer.answer_word}: 순위표를 계산할 수 없습니다.")
+        return None
+
+    get_rank_index(engine, answer)  # RankTable 생성 / 증분 갱신
+    status, content = get_or_fill(
+        rank_list_key(answer.id, version),
+        lambda: build_similarity_rank_list(answer, version),
+        should_cache=lambda value: value[0] == 200,
+        timeout=RANK_LIST_CACHE_TIMEOUT,
+    )
+    return content if status == 200 else None
+
+
+def upcoming_answers(count, start_id=None):
+    """
+    곧 출제될 AnswerWord count 개를 id 순으로 반환합니다 (출제 부적합으로 표시된 단어 제외).
+
+    정답 단어는 id 순서로 출제된다고 보고, start_id 가 없으면 지난 prewarm_snapshots 실행이 기록한 다음 id(커서)부터,
+    기록도 없으면 첫 정답 단어부터 고릅니다. 순위표가 있는지(누가 풀었는지)와는 관계가 없습니다.
+    """
+    if start_id is None:
+        start_id = prewarm_cursor()
+    answers = AnswerWord.objects.exclude(stats__usable=False).order_by("id")
+    if start_id is not None:
+        answers = answers.filter(id__gte=start_id)
+    return list(answers[:count])
+
+
+def prewarm_cursor():
+    """마지막으로 성공한 prewarm_snapshots 실행이 기록한 다음 시작 id (없으면 None)"""
+    run = JobRun.objects.filter(name="prewarm_snapshots", status="success", dry_run=False).order_by("-started_at", "-id").first()
+    return run.stats.get("next_id") if run else None
+
+
+def prewarm_snapshots(answers, report=print):
+    """
+    AnswerWord 들의 순위표 / 상위 100개 응답을 현재 어휘 버전 세대의 스냅샷 파일로 모두 다시 저장하고 current 로 공개합니다.
+    새로 저장한 스냅샷 수를 반환합니다.
+
+    같은 세대에 이미 있는 (지난 창의) 스냅샷은 manifest 에 그대로 남겨 새 단어가 들어오면 계속 무효화되게 합니다.
+
+    공개한 뒤에는 계산하는 동안 (또는 id 순서와 다르게 늦게) 커밋되어 엔진에 없던 BaseWord 로 스냅샷을 다시 확인합니다.
+    """
+    version = get_vocabulary_version()
+
+    count, entries = 0, {}
+    for answer_id, entry in read_manifest(generation_dir(version)).items():
+        if os.path.exists(snapshot_path(answer_id, version)):
+            entries[int(answer_id)] = entry
+    for answer in answers:
+        path = snapshot_path(answer.id, version)
+        if os.path.exists(path):
+            with open(path, "rb") as f:
+                content = gzip.decompress(f.read())  # 같은 어휘 버전에서 다시 실행한 경우
+        else:
+            content = precompute_answer(answer, version, report)
+            if content is None:
+                continue
+            write_snapshot(answer.id, version, content)
+            count += 1
+        entries[answer.id] = manifest_entry(content, TOP_N)
+
+    if not answers or not entries:
+        return count
+
+    write_manifest(version, entries)
+    publish(version, [answer.id for answer in answers])
+
+    engine = get_engine(model_store.get(), version)
+    late_words = BaseWord.objects.filter(id__gt=max(0, version - SYNC_OVERLAP)).values_list("base_word", flat=True)
+    removed = invalidate([word for word in late_words if word not in engine.index])
+    if removed:
+        report(f"늦게 추가된 단어로 스냅샷 {removed}개를 지웠습니다.")
+    return count
+
+
+def run_daily(at, func, report=print):
+    """매일 at(HH:MM) 에 func 을 실행하며 대기 (실패해도 다음 날 다시 실행)"""
+    def run():
+        try:
+            func()
+        except JobLocked as e:
+            report(str(e))
+        except Exception as e:
+            report(f"작업 실패: {e}")
+
+    schedule.every().day.at(at).do(run)
+    report(f"스케줄러 실행 중... 매일 {at} 에 실행 (Ctrl+C로 종료)")
+    while True:
+        schedule.run_pending()
+        time.sleep(1)
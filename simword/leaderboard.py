@@ -0,0 +1,179 @@
+import bisect
+import threading
+import time
+import numpy as np
+from django.utils import timezone
+from .difficulty import unusable_answer_ids
+from .models import LeaderboardEntry, LeaderboardSnapshot
+
+# 정답 단어별 리더보드 (정답까지 추측 횟수가 적을수록 높은 순위)
+#   - 정답 기록은 게임 세션 저장(flush) 때 LeaderboardEntry 로 추가
+#   - 각 워커는 추측 횟수별 Fenwick 트리와 상위 기록 목록을 메모리에 두고 새 기록만 읽어 갱신
+#   - 주기적으로 트리를 LeaderboardSnapshot 에 저장해 새 워커는 스냅샷 이후 기록만 읽음
+MAX_GUESSES = 10000  # 이보다 많이 추측한 기록은 MAX_GUESSES 로 셈
+TOP_K = 100  # 메모리에 유지하는 상위 기록 수
+
+# 다른 워커가 추가한 기록을 확인하는 최소 간격 / 스냅샷 저장 간격 (초)
+SYNC_INTERVAL = 2
+SNAPSHOT_INTERVAL = 60
+
+# 커밋 순서가 id 순서와 다를 수 있어 매번 다시 확인하는 최근 기록 id 범위
+SYNC_OVERLAP = 100
+
+
+class FenwickTree:
+    """추측 횟수(1..size)별 기록 수의 누적 합을 O(log n) 으로 갱신 / 조회"""
+
+    def __init__(self, size, tree=None):
+        self.size = size
+        self.tree = tree if tree is not None else [0] * (size + 1)
+
+    def add(self, index, amount=1):
+        while index <= self.size:
+            self.tree[index] += amount
+            index += index & -index
+
+    def prefix(self, index):
+        """1..index 의 기록 수 합"""
+        index = min(index, self.size)
+        total = 0
+        while index > 0:
+            total += self.tree[index]
+            index -= index & -index
+        return total
+
+    def to_bytes(self):
+        return np.asarray(self.tree, dtype="<u4").tobytes()
+
+    @classmethod
+    def from_bytes(cls, data):
+        tree = np.frombuffer(bytes(data), dtype="<u4").tolist()
+        return cls(len(tree) - 1, tree)
+
+
+class Leaderboard:
+    """정답 단어 하나의 리더보드 (추측 횟수별 누적 트리 + 상위 TOP_K 기록)"""
+
+    def __init__(self, answer_id):
+        self.answer_id = answer_id
+        self.counts = FenwickTree(MAX_GUESSES)
+        self.top = []  # (추측 횟수, 정답 시각 timestamp, 플레이어 ID) 오름차순
+        self.last_entry_id = 0
+        self.seen = set()  # 최근 SYNC_OVERLAP 범위에서 이미 반영한 기록 id
+        self.synced_at = 0
+        self.snapshot_at = time.monotonic()
+        self.lock = threading.Lock()
+
+    @property
+    def total(self):
+        return self.counts.prefix(MAX_GUESSES)
+
+    def add(self, player, guesses, solved_at):
+        self.counts.add(min(guesses, MAX_GUESSES))
+        item = (guesses, solved_at, player)
+        if len(self.top) < TOP_K or item < self.top[-1]:
+            bisect.insort(self.top, item)
+            del self.top[TOP_K:]
+
+    def rank(self, guesses):
+        """guesses 번 만에 맞힌 기록의 순위 (더 적게 추측한 기록 수 + 1, 같은 횟수는 같은 순위)"""
+        return self.counts.prefix(min(guesses, MAX_GUESSES) - 1) + 1
+
+    def top_percent(self, guesses):
+        """guesses 번 만에 맞힌 기록이 상위 몇 % 인지 (같은 횟수 포함)"""
+        total = self.total
+        return round(self.counts.prefix(min(guesses, MAX_GUESSES)) / total * 100, 2) if total else None
+
+
+class LeaderboardService:
+    """프로세스 안의 정답 단어별 Leaderboard (처음 조회할 때 스냅샷 + 이후 기록으로 생성)"""
+
+    def __init__(self):
+        self.boards = {}
+        self._lock = threading.Lock()
+
+    def reset(self):
+        self.boards = {}
+
+    def get(self, answer_id):
+        """최신 기록까지 반영한 Leaderboard (SYNC_INTERVAL 안에서는 다시 확인하지 않음)"""
+        board = self.boards.get(answer_id)
+        if board is None:
+            with self._lock:
+                board = self.boards.get(answer_id)
+                if board is None:
+                    board = self.boards[answer_id] = self._load(answer_id)
+        if time.monotonic() - board.synced_at >= SYNC_INTERVAL:
+            self.sync(board)
+        return board
+
+    @staticmethod
+    def _load(answer_id):
+        board = Leaderboard(answer_id)
+        snapshot = LeaderboardSnapshot.objects.filter(answer_word_id=answer_id).first()
+        if snapshot is not None:
+            board.counts = FenwickTree.from_bytes(snapshot.tree)
+            board.top = [tuple(item) for item in snapshot.top]
+            board.last_entry_id = snapshot.last_entry_id
+            board.seen = set(snapshot.recent_ids)
+        return board
+
+    def sync(self, board):
+        """마지막으로 반영한 기록 이후 추가된 기록만 읽어 반영"""
+        with board.lock:
+            since = max(0, board.last_entry_id - SYNC_OVERLAP)
+            rows = (
+                LeaderboardEntry.objects.filter(answer_word_id=board.answer_id, id__gt=since)
+                .order_by("id").values_list("id", "player_id", "guesses", "solved_at")
+            )
+            added = 0
+            for entry_id, player, guesses, solved_at in rows:
+                if entry_id in board.seen:
+                    continue
+                board.add(player, guesses, solved_at.timestamp())
+                board.seen.add(entry_id)
+                board.last_entry_id = max(board.last_entry_id, entry_id)
+                added += 1
+
+            board.seen = {entry_id for entry_id in board.seen if entry_id > board.last_entry_id - SYNC_OVERLAP}
+            board.synced_at = time.monotonic()
+
+        if added and board.synced_at - board.snapshot_at >= SNAPSHOT_INTERVAL:
+            self.snapshot(board)
+
+    @staticmethod
+    def snapshot(board):
+        """트리와 상위 기록을 DB 에 저장 (더 최신 스냅샷이 이미 있으면 덮어쓰지 않음)"""
+        with board.lock:
+            values = {
+                "tree": board.counts.to_bytes(),
+                "top": [list(item) for item in board.top],
+                "recent_ids": sorted(board.seen),
+                "last_entry_id": board.last_entry_id,
+                "updated_at": timezone.now(),
+            }
+            board.snapshot_at = time.monotonic()
+
+        updated = LeaderboardSnapshot.objects.filter(
+            answer_word_id=board.answer_id, last_entry_id__lt=values["last_entry_id"]
+        ).update(**values)
+        if not updated:
+            LeaderboardSnapshot.objects.get_or_create(answer_word_id=board.answer_id, defaults=values)
+
+
+def record_solves(solves):
+    """정답 기록 [(AnswerWord id, 플레이어 ID, 추측 횟수, 정답 시각), ...] 을 리더보드에 추가 (출제 부적합 단어는 제외)"""
+    if not solves:
+        return
+    unusable = unusable_answer_ids({answer_id for answer_id, _, _, _ in solves})
+    LeaderboardEntry.objects.bulk_create(
+        [
+            LeaderboardEntry(answer_word_id=answer_id, player_id=player, guesses=guesses, solved_at=solved_at)
+            for answer_id, player, guesses, solved_at in solves
+            if answer_id not in unusable
+        ],
+        ignore_conflicts=True,
+    )
+
+
+leaderboards = LeaderboardService()
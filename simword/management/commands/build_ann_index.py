@@ -0,0 +1,36 @@
+import time
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from simword.ann import AnnIndex, index_path
+from simword.embedding import load_model
+
+
+class Command(BaseCommand):
+    help = "전체 어휘에 대한 IVF-PQ 근사 최근접 이웃 색인을 생성합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--source", default=None, help="모델 저장소 경로 (확장자 제외, 기본값: SIMWORD_MODEL_PATH)")
+        parser.add_argument("--nlist", type=int, default=1024, help="IVF 목록 수")
+        parser.add_argument("--m", type=int, default=30, help="PQ 부분 공간 수 (차원 수의 약수)")
+        parser.add_argument("--train-size", type=int, default=100000, help="학습에 사용할 표본 벡터 수")
+        parser.add_argument("--iterations", type=int, default=10, help="k-means 반복 횟수")
+
+    def handle(self, *args, **options):
+        source = options["source"] or settings.SIMWORD_MODEL_PATH
+        started = time.perf_counter()
+
+        model = load_model(source, game=False)
+        index = AnnIndex.build(
+            model.vectors,
+            nlist=options["nlist"],
+            m=options["m"],
+            train_size=options["train_size"],
+            iterations=options["iterations"],
+            report=self.stdout.write,
+        )
+        index.save(index_path(source))
+
+        self.stdout.write(self.style.SUCCESS(
+            f"{index_path(source)} 생성 완료: {len(index.ids)}개 단어, 목록 {len(index.centroids)}개, "
+            f"{time.perf_counter() - started:.1f}초"
+        ))
@@ -0,0 +1,40 @@
+import os
+import time
+import numpy as np
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from simword.embedding import QUANTIZATIONS, artifact_path, load_model, save_artifact
+from simword.models import AnswerWord, BaseWord
+
+
+class Command(BaseCommand):
+    help = "빈도 상위 단어와 DB 의 모든 단어만 담은 게임용 축소 임베딩 모델을 생성합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--source", default=None, help="원본 모델 경로 (확장자 제외, 기본값: SIMWORD_MODEL_PATH)")
+        parser.add_argument("--output", default=None, help="출력 파일 경로 (기본값: <source>.game)")
+        parser.add_argument("--top-n", type=int, default=200000, help="포함할 빈도 상위 단어 수")
+        parser.add_argument("--quantize", choices=QUANTIZATIONS, default="float16", help="벡터 저장 형식")
+
+    def handle(self, *args, **options):
+        source = options["source"] or settings.SIMWORD_MODEL_PATH
+        output = options["output"] or artifact_path(source)
+        started = time.perf_counter()
+
+        model = load_model(source, game=False)
+
+        # fastText .vec 파일은 빈도순으로 정렬되어 있으므로 앞쪽 행이 빈도 상위 단어
+        top_n = min(options["top_n"], len(model.index_to_key))
+        db_words = set(AnswerWord.objects.values_list("answer_word", flat=True))
+        db_words.update(BaseWord.objects.values_list("base_word", flat=True))
+        extra_rows = sorted({model.key_to_index[word] for word in db_words if word in model.key_to_index} - set(range(top_n)))
+
+        rows = np.concatenate([np.arange(top_n), np.asarray(extra_rows, dtype=np.int64)])
+        words = [model.index_to_key[row] for row in rows]
+        save_artifact(words, model.vectors[rows], output, options["quantize"])
+
+        self.stdout.write(self.style.SUCCESS(
+            f"{output} 생성 완료: 단어 {len(words)}개 (상위 {top_n}개 + DB 단어 {len(extra_rows)}개), "
+            f"{options['quantize']}, {os.path.getsize(output) / 1024 / 1024:.1f}MB, "
+            f"{time.perf_counter() - started:.1f}초"
+        ))
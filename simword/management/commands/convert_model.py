@@ -0,0 +1,30 @@
+import time
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from simword.conversion import CHUNK_SIZE, convert_kv, convert_vec
+
+
+class Command(BaseCommand):
+    help = "fastText .vec / gensim .kv 파일을 메모리 맵 임베딩 저장소로 변환합니다. (중단 시 이어서 변환)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--source", required=True, help="원본 .vec 또는 .kv 파일 경로")
+        parser.add_argument("--output", default=None, help="저장소 경로 (확장자 제외, 기본값: SIMWORD_MODEL_PATH)")
+        parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE, help="한 번에 변환할 줄 수")
+
+    def handle(self, *args, **options):
+        source = options["source"]
+        output = options["output"] or settings.SIMWORD_MODEL_PATH
+        started = time.perf_counter()
+
+        if source.endswith(".vec"):
+            rows = convert_vec(source, output, options["chunk_size"], report=self.stdout.write)
+        elif source.endswith(".kv"):
+            rows = convert_kv(source, output)
+        else:
+            raise CommandError("원본 파일은 .vec 또는 .kv 여야 합니다.")
+
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(
+            f"{output} 저장소 생성 완료: {rows}개 단어, {elapsed:.1f}초 ({rows / elapsed:.0f} 단어/초)"
+        ))
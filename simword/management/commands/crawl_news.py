@@ -0,0 +1,67 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from simword.embedding import load_vocabulary
+from simword.ingestion import ingest_words
+from simword.jobs import JobLocked, precompute_rankings, run_daily, run_job
+from simword.models import BaseWord
+from simword.news_word_analysis import MAX_ARTICLES, RANKING_URL, iter_popular_articles
+from simword.term_stats import TREND_DAYS, record_articles, trending_terms
+
+
+class Command(BaseCommand):
+    help = "네이버 뉴스 인기 기사에서 유행 단어를 찾아 BaseWord 에 저장하고 순위표를 미리 계산합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--ranking-url", default=RANKING_URL, help="인기 기사 랭킹 페이지 URL")
+        parser.add_argument("--dry-run", action="store_true", help="수집 / 분석만 하고 DB 에는 저장하지 않음")
+        parser.add_argument("--max-articles", type=int, default=MAX_ARTICLES, help="수집할 최대 기사 수")
+        parser.add_argument("--days", type=int, default=TREND_DAYS, help="유행 단어를 고를 최근 기간 (일)")
+        parser.add_argument("--limit", type=int, default=50, help="저장할 유행 단어 수")
+        parser.add_argument("--at", help="지정하면 종료하지 않고 매일 이 시각(HH:MM)에 실행")
+
+    def handle(self, *args, **options):
+        if options["at"]:
+            run_daily(options["at"], lambda: self.crawl(options), report=self.stdout.write)
+            return
+
+        try:
+            self.crawl(options)
+        except JobLocked as e:
+            raise CommandError(str(e))
+
+    def crawl(self, options):
+        with run_job("crawl_news", dry_run=options["dry_run"], report=self.stdout.write) as job:
+            # 도착하는 기사부터 바로 분석 (수집 대기 시간은 fetch, 나머지는 analyse 로 따로 기록)
+            articles = job.timed(
+                "fetch", iter_popular_articles(options["ranking_url"], max_articles=options["max_articles"]), count="articles",
+            )
+            with job.stage("analyse", exclude=["fetch"]):
+                new_article_count, _ = record_articles(
+                    articles, cache_directory=settings.SIMWORD_NOUN_CACHE_DIR or None, dry_run=job.dry_run
+                )
+            job.record(new_articles=new_article_count)
+            if not job.run.stats["articles"]:
+                self.stdout.write("기사를 가져오지 못했습니다.")
+                return
+
+            with job.stage("trend"):
+                frequent_words = trending_terms(days=options["days"], limit=options["limit"])
+
+            self.stdout.write(f"\n최근 {options['days']}일 유행 단어 순위 리스트 (TOP {options['limit']}):")
+            for rank, (word, score) in enumerate(frequent_words, start=1):
+                self.stdout.write(f"{rank}. {word} ({score}점)")
+
+            with job.stage("ingest"):
+                # 서버가 점수를 계산할 수 있는 단어만 저장하도록 서버와 같은 어휘 사용 (벡터는 불러오지 않음)
+                created = ingest_words(
+                    [word for word, score in frequent_words], BaseWord, "base_word", load_vocabulary(game=True),
+                    dry_run=job.dry_run, report=self.stdout.write,
+                )
+            job.record(base_words=created)
+
+            if created and not job.dry_run:
+                # 첫 요청이 기다리지 않도록 이미 출제된 정답 단어의 순위표를 바로 갱신
+                with job.stage("rerank"):
+                    job.record(reranked=precompute_rankings(report=self.stdout.write))
+
+        self.stdout.write(self.style.SUCCESS(f"완료: {job.run.timings}"))
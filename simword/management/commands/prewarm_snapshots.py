@@ -0,0 +1,39 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from simword.jobs import JobLocked, prewarm_cursor, prewarm_snapshots, run_daily, run_job, upcoming_answers
+
+# 한 번 실행할 때마다 새로 준비할 정답 단어 수 (매일 실행하면 하루에 출제하는 정답 단어 수와 같게)
+PREWARM_COUNT = 1
+
+
+class Command(BaseCommand):
+    help = "곧 출제될 정답 단어의 순위표와 상위 100개 응답을 미리 계산해 스냅샷 파일로 저장합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--count", type=int, default=PREWARM_COUNT, help="이번 실행에서 준비할 정답 단어 수 (다음 실행은 그다음 단어부터)")
+        parser.add_argument("--start-id", type=int, help="이 id 부터 준비 (기본: 지난 실행이 준비한 마지막 단어 다음, 처음이면 첫 정답 단어)")
+        parser.add_argument("--at", help="지정하면 종료하지 않고 매일 이 시각(HH:MM)에 실행")
+
+    def handle(self, *args, **options):
+        if not settings.SIMWORD_SNAPSHOT_DIR:
+            raise CommandError("SIMWORD_SNAPSHOT_DIR 이 설정되지 않았습니다.")
+
+        if options["at"]:
+            run_daily(options["at"], lambda: self.prewarm(options), report=self.stdout.write)
+            return
+
+        try:
+            self.prewarm(options)
+        except JobLocked as e:
+            raise CommandError(str(e))
+
+    def prewarm(self, options):
+        with run_job("prewarm_snapshots", report=self.stdout.write) as job:
+            answers = upcoming_answers(options["count"], options["start_id"])
+            with job.stage("snapshots"):
+                created = prewarm_snapshots(answers, report=self.stdout.write)
+            # 다음 실행은 이번에 준비한 마지막 단어 다음부터 (준비할 단어가 없으면 커서를 그대로 둠)
+            next_id = answers[-1].id + 1 if answers else (options["start_id"] or prewarm_cursor())
+            job.record(next_id=next_id, answers=[answer.id for answer in answers], snapshots=created)
+
+        self.stdout.write(self.style.SUCCESS(f"완료: 스냅샷 {created}개, {job.run.timings}"))
@@ -0,0 +1,58 @@
+from django.core.management.base import BaseCommand, CommandError
+from simword.difficulty import stale_answers, vet_answers
+from simword.embedding import load_vocabulary
+from simword.jobs import JobLocked, precompute_rankings, run_daily, run_job
+from simword.model_store import model_store
+from simword.models import AnswerWord, BaseWord
+from simword.ranking import get_vocabulary_version
+from simword.similarity import get_engine
+from simword.word_scraper import WIKTIONARY_URL, fetch_words_from_wiktionary, save_new_words_to_database
+
+
+class Command(BaseCommand):
+    help = "위키낱말사전에서 단어를 가져와 AnswerWord / BaseWord 에 저장하고 순위표를 미리 계산합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--url", default=WIKTIONARY_URL, help="단어 목록 페이지 URL")
+        parser.add_argument("--dry-run", action="store_true", help="수집만 하고 DB 에는 저장하지 않음")
+        parser.add_argument("--at", help="지정하면 종료하지 않고 매일 이 시각(HH:MM)에 실행")
+
+    def handle(self, *args, **options):
+        if options["at"]:
+            run_daily(options["at"], lambda: self.scrape(options), report=self.stdout.write)
+            return
+
+        try:
+            self.scrape(options)
+        except JobLocked as e:
+            raise CommandError(str(e))
+
+    def scrape(self, options):
+        with run_job("scrape_wiktionary", dry_run=options["dry_run"], report=self.stdout.write) as job:
+            with job.stage("fetch"):
+                words = fetch_words_from_wiktionary(options["url"])
+            job.record(words=len(words))
+            if not words:
+                self.stdout.write("단어를 가져오지 못했습니다.")
+                return
+
+            with job.stage("ingest"):
+                # 서버가 점수를 계산할 수 있는 단어만 저장하도록 서버와 같은 어휘 사용 (벡터는 불러오지 않음)
+                vocabulary = load_vocabulary(game=True)
+                answer_words = save_new_words_to_database(words, AnswerWord, "answer_word", vocabulary, job.dry_run)
+                base_words = save_new_words_to_database(words, BaseWord, "base_word", vocabulary, job.dry_run)
+            job.record(answer_words=answer_words, base_words=base_words)
+
+            if base_words and not job.dry_run:
+                # 첫 요청이 기다리지 않도록 이미 출제된 정답 단어의 순위표를 바로 갱신
+                with job.stage("rerank"):
+                    job.record(reranked=precompute_rankings(report=self.stdout.write))
+
+            if answer_words and not job.dry_run:
+                # 새 정답 단어의 힌트 기준 / 출제 적합 여부를 계산 (전체 재계산은 vet_answers 명령)
+                with job.stage("vet"):
+                    version = get_vocabulary_version()
+                    _, results = vet_answers(get_engine(model_store.get(), version), stale_answers(version, missing_only=True), version)
+                job.record(unusable_answers=sum(not stats.usable for stats in results))
+
+        self.stdout.write(self.style.SUCCESS(f"완료: {job.run.timings}"))
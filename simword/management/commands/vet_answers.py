@@ -0,0 +1,44 @@
+from django.core.management.base import BaseCommand, CommandError
+from simword.difficulty import MIN_DENSITY, stale_answers, vet_answers
+from simword.jobs import JobLocked, run_job
+from simword.model_store import model_store
+from simword.models import AnswerWord
+from simword.ranking import get_vocabulary_version
+from simword.similarity import get_engine
+
+
+class Command(BaseCommand):
+    help = "정답 단어별 유사도 분포 / 힌트 기준 / 이웃 밀도를 일괄 계산하고 출제에 부적합한 단어를 표시합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--all", action="store_true", help="최신 통계가 있는 단어까지 모두 다시 계산")
+        parser.add_argument("--min-density", type=float, default=MIN_DENSITY, help="출제 적합으로 볼 최소 이웃 밀도")
+        parser.add_argument("--batch-size", type=int, help="한 번에 계산할 정답 단어 수 (기본: 후보 수에 맞춰 자동)")
+        parser.add_argument("--dry-run", action="store_true", help="계산만 하고 DB 에는 저장하지 않음")
+
+    def handle(self, *args, **options):
+        try:
+            with run_job("vet_answers", dry_run=options["dry_run"], report=self.stdout.write) as job:
+                version = get_vocabulary_version()
+                if not version:
+                    raise CommandError("BaseWord 가 없습니다.")
+
+                with job.stage("engine"):
+                    engine = get_engine(model_store.get(), version)
+
+                answers = AnswerWord.objects.order_by("id") if options["all"] else stale_answers(version)
+                with job.stage("stats"):
+                    missing, results = vet_answers(
+                        engine, answers, version, options["min_density"], options["batch_size"], job.dry_run
+                    )
+
+                unusable = [stats for stats in results if not stats.usable]
+                job.record(answers=len(results), missing=len(missing), unusable=len(unusable))
+        except JobLocked as e:
+            raise CommandError(str(e))
+
+        for answer in missing:
+            self.stdout.write(f"{answer.answer_word}: 모델에 없는 단어입니다.")
+        for stats in unusable:
+            self.stdout.write(f"{stats.answer_word.answer_word}: 후보 {stats.candidate_count}개, 이웃 밀도 {stats.density} (부적합)")
+        self.stdout.write(self.style.SUCCESS(f"완료: {len(results)}개 계산, 부적합 {len(unusable)}개, {job.run.timings}"))
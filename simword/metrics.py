@@ -0,0 +1,197 @@
+import hmac
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import connection
+from django.http import Http404, HttpResponse
+
+# 요청 / 단계별 지표 (Prometheus 텍스트 형식으로 /metrics 에 노출)
+#   - 지표는 워커 프로세스마다 따로 쌓이며, 응답에 pid 레이블을 붙여 워커를 구분한다
+#   - 뷰 안의 단계 시간은 stage() 로 재고, 요청 단위 합계는 Server-Timing 헤더로도 내보낸다
+BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+# 현재 요청의 단계별 소요 시간 (단계 -> 초), 미들웨어 밖에서는 None
+_request_stages = ContextVar("simword_request_stages", default=None)
+
+
+def _format_labels(labels):
+    return "{" + ",".join(f'{name}="{value}"' for name, value in labels) + "}" if labels else ""
+
+
+class Counter:
+    def __init__(self, name, documentation):
+        self.name = name
+        self.documentation = documentation
+        self.values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount=1, **labels):
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            self.values[key] = self.values.get(key, 0) + amount
+
+    def render(self, extra_labels=()):
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            for key, value in sorted(self.values.items()):
+                lines.append(f"{self.name}{_format_labels(key + extra_labels)} {value}")
+        return lines
+
+
+class Histogram:
+    def __init__(self, name, documentation, buckets=BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.buckets = buckets
+        self.values = {}  # 레이블 -> [버킷별 개수..., 합계, 개수]
+        self._lock = threading.Lock()
+
+    def observe(self, value, **labels):
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            counts = self.values.get(key)
+            if counts is None:
+                counts = self.values[key] = [0] * (len(self.buckets) + 2)
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[index] += 1
+                    break
+            counts[-2] += value
+            counts[-1] += 1
+
+    def render(self, extra_labels=()):
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            for key, counts in sorted(self.values.items()):
+                labels = key + extra_labels
+                cumulative = 0
+                for bound, count in zip(self.buckets, counts):
+                    cumulative += count
+                    lines.append(f"{self.name}_bucket{_format_labels(labels + (('le', bound),))} {cumulative}")
+                lines.append(f"{self.name}_bucket{_format_labels(labels + (('le', '+Inf'),))} {counts[-1]}")
+                lines.append(f"{self.name}_sum{_format_labels(labels)} {counts[-2]:.6f}")
+                lines.append(f"{self.name}_count{_format_labels(labels)} {counts[-1]}")
+        return lines
+
+
+requests_total = Counter("simword_requests_total", "처리한 요청 수")
+request_duration = Histogram("simword_request_duration_seconds", "요청 처리 시간")
+stage_duration = Histogram("simword_stage_duration_seconds", "뷰 내부 단계별 처리 시간")
+db_queries_total = Counter("simword_db_queries_total", "요청 처리 중 실행한 DB 쿼리 수")
+db_duration_total = Counter("simword_db_duration_seconds_total", "요청 처리 중 DB 쿼리에 쓴 시간")
+
+REGISTRY = (requests_total, request_duration, stage_duration, db_queries_total, db_duration_total)
+
+
+@contextmanager
+def stage(name):
+    """with 블록의 소요 시간을 단계 지표와 현재 요청의 Server-Timing 에 기록"""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - started
+        stage_duration.observe(elapsed, stage=name)
+        stages = _request_stages.get()
+        if stages is not None:
+            stages[name] = stages.get(name, 0) + elapsed
+
+
+def render_metrics():
+    extra_labels = (("pid", os.getpid()),)
+    lines = []
+    for metric in REGISTRY:
+        lines.extend(metric.render(extra_labels))
+    return "\n".join(lines) + "\n"
+
+
+def metrics_view(request):
+    """
+    이 워커의 지표를 Prometheus 텍스트 형식으로 반환합니다.
+
+    SIMWORD_METRICS_TOKEN 이 비어 있으면 404, 설정되어 있으면 `Authorization: Bearer <토큰>` 이 맞을 때만 응답합니다.
+    """
+    token = settings.SIMWORD_METRICS_TOKEN
+    if not token:
+        raise Http404("Metrics are disabled.")
+    if not hmac.compare_digest(request.headers.get("Authorization", ""), f"Bearer {token}"):
+        return HttpResponse("Unauthorized", status=401, headers={"WWW-Authenticate": "Bearer"})
+    return HttpResponse(render_metrics(), content_type="text/plain; version=0.0.4; charset=utf-8")
+
+
+class QueryRecorder:
+    """connection.execute_wrapper 로 요청 중 실행한 쿼리 수와 시간을 셈"""
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.count += 1
+            self.seconds += time.perf_counter() - started
+
+
+class MetricsMiddleware:
+    """요청별 처리 시간 / DB 쿼리 수 / 단계별 시간을 기록하고 Server-Timing 헤더를 붙임
+
+    비동기 뷰는 ORM 이 다른 스레드에서 실행되므로 DB 쿼리 수는 동기 요청만 센다.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        stages = {}
+        token = _request_stages.set(stages)
+        recorder = QueryRecorder()
+        started = time.perf_counter()
+        try:
+            with connection.execute_wrapper(recorder):
+                response = self.get_response(request)
+        finally:
+            _request_stages.reset(token)
+        return self.finish(request, response, time.perf_counter() - started, stages, recorder)
+
+    async def __acall__(self, request):
+        stages = {}
+        token = _request_stages.set(stages)
+        started = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            _request_stages.reset(token)
+        return self.finish(request, response, time.perf_counter() - started, stages, None)
+
+    def finish(self, request, response, elapsed, stages, recorder):
+        match = request.resolver_match
+        view = match.url_name if match and match.url_name else "unknown"
+
+        requests_total.inc(view=view, method=request.method, status=response.status_code)
+        request_duration.observe(elapsed, view=view)
+        if recorder is not None:
+            db_queries_total.inc(recorder.count, view=view)
+            db_duration_total.inc(recorder.seconds, view=view)
+
+        if settings.SIMWORD_SERVER_TIMING:
+            metrics = [f"{name};dur={seconds * 1000:.2f}" for name, seconds in stages.items()]
+            if recorder is not None:
+                metrics.append(f'db;dur={recorder.seconds * 1000:.2f};desc="{recorder.count} queries"')
+            metrics.append(f"total;dur={elapsed * 1000:.2f}")
+            response["Server-Timing"] = ", ".join(metrics)
+        return response
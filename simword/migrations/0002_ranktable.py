@@ -0,0 +1,25 @@
+# Generated by Django 5.1.5 on 2026-10-17 13:37
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('simword', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RankTable',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('vocab_version', models.BigIntegerField(default=0, verbose_name='어휘 버전')),
+                ('ranking', models.JSONField(default=list, verbose_name='유사도 순위')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='등록 날짜')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='수정 날짜')),
+                ('answer_word', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='rank_table', to='simword.answerword', verbose_name='정답 단어')),
+            ],
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.1.5 on 2026-10-17 13:46
+
+from django.db import migrations, models
+from django.db.models import Count, Min
+
+
+def delete_duplicate_base_words(apps, schema_editor):
+    """unique 제약을 걸기 전에 같은 단어는 가장 먼저 등록된 행만 남김"""
+    BaseWord = apps.get_model('simword', 'BaseWord')
+    duplicates = (
+        BaseWord.objects.values('base_word')
+        .annotate(first_id=Min('id'), count=Count('id'))
+        .filter(count__gt=1)
+    )
+    for duplicate in duplicates:
+        BaseWord.objects.filter(base_word=duplicate['base_word']).exclude(id=duplicate['first_id']).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('simword', '0002_ranktable'),
+    ]
+
+    operations = [
+        migrations.RunPython(delete_duplicate_base_words, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='baseword',
+            name='base_word',
+            field=models.CharField(max_length=100, unique=True, verbose_name='비교 단어'),
+        ),
+    ]
@@ -0,0 +1,50 @@
+# Generated by Django 5.1.5 on 2026-10-17 13:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('simword', '0003_baseword_unique'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AnalyzedArticle',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('content_hash', models.CharField(max_length=40, unique=True, verbose_name='본문 해시')),
+                ('date', models.DateField(verbose_name='수집 날짜')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='등록 날짜')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='TermStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('term', models.CharField(max_length=100, unique=True, verbose_name='단어')),
+                ('days', models.PositiveIntegerField(default=0, verbose_name='등장 일수')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='TermDay',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField(unique=True, verbose_name='날짜')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='TermDailyCount',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField(verbose_name='날짜')),
+                ('term', models.CharField(max_length=100, verbose_name='단어')),
+                ('count', models.PositiveIntegerField(default=0, verbose_name='출현 횟수')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['term', 'date'], name='term_daily_count_term_idx')],
+                'constraints': [models.UniqueConstraint(fields=('date', 'term'), name='unique_term_daily_count')],
+            },
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.1.5 on 2026-10-17 14:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('simword', '0004_term_stats'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='JobRun',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=50, verbose_name='작업 이름')),
+                ('status', models.CharField(choices=[('running', '실행 중'), ('success', '성공'), ('failed', '실패')], default='running', max_length=10, verbose_name='상태')),
+                ('dry_run', models.BooleanField(default=False, verbose_name='시험 실행')),
+                ('timings', models.JSONField(default=dict, verbose_name='단계별 소요 시간(초)')),
+                ('stats', models.JSONField(default=dict, verbose_name='처리 결과')),
+                ('error', models.TextField(blank=True, default='', verbose_name='오류')),
+                ('started_at', models.DateTimeField(auto_now_add=True, verbose_name='시작 시각')),
+                ('finished_at', models.DateTimeField(blank=True, null=True, verbose_name='종료 시각')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['name', '-started_at'], name='job_run_name_idx')],
+            },
+        ),
+    ]
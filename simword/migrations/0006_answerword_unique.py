@@ -0,0 +1,47 @@
+# Generated by Django 5.1.5 on 2026-10-17 14:04
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def check_duplicate_answer_words(apps, schema_editor):
+    """
+    unique 제약을 걸기 전에 같은 단어가 여러 번 등록되어 있는지 확인합니다.
+
+    AnswerWord id 는 공유 링크에 쓰이는 공개 문제 번호이고 삭제하면 순위표 등 연결된 행도 함께 지워지므로
+    자동으로 정리하지 않고, 중복 목록을 보여 주며 마이그레이션을 멈춥니다 (운영자가 정리한 뒤 다시 실행).
+    """
+    AnswerWord = apps.get_model('simword', 'AnswerWord')
+    words = list(
+        AnswerWord.objects.values('answer_word')
+        .annotate(count=Count('id'))
+        .filter(count__gt=1)
+        .values_list('answer_word', flat=True)
+    )
+    if not words:
+        return
+
+    ids = {}
+    for answer_id, word in AnswerWord.objects.filter(answer_word__in=words).order_by('id').values_list('id', 'answer_word'):
+        ids.setdefault(word, []).append(str(answer_id))
+    raise RuntimeError(
+        "같은 단어의 AnswerWord 가 여러 개 있어 unique 제약을 걸 수 없습니다. "
+        "남길 문제 번호를 정해 나머지를 정리한 뒤 다시 migrate 하세요.\n"
+        + "\n".join(f"  {word}: id {', '.join(word_ids)}" for word, word_ids in ids.items())
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('simword', '0005_jobrun'),
+    ]
+
+    operations = [
+        migrations.RunPython(check_duplicate_answer_words, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='answerword',
+            name='answer_word',
+            field=models.CharField(max_length=100, unique=True, verbose_name='정답 단어'),
+        ),
+    ]
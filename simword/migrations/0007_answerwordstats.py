@@ -0,0 +1,30 @@
+# Generated by Django 5.1.5 on 2026-10-17 14:11
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('simword', '0006_answerword_unique'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AnswerWordStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('vocab_version', models.BigIntegerField(default=0, verbose_name='어휘 버전')),
+                ('candidate_count', models.PositiveIntegerField(default=0, verbose_name='후보 단어 수')),
+                ('top1', models.FloatField(null=True, verbose_name='1위 유사도(%)')),
+                ('top10', models.FloatField(null=True, verbose_name='10위 유사도(%)')),
+                ('top100', models.FloatField(null=True, verbose_name='100위 유사도(%)')),
+                ('percentiles', models.JSONField(default=dict, verbose_name='유사도 분포 백분위(%)')),
+                ('density', models.FloatField(default=0, verbose_name='이웃 밀도')),
+                ('usable', models.BooleanField(default=True, verbose_name='출제 적합 여부')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='수정 날짜')),
+                ('answer_word', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='stats', to='simword.answerword', verbose_name='정답 단어')),
+            ],
+        ),
+    ]
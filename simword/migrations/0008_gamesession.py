@@ -0,0 +1,32 @@
+# Generated by Django 5.1.5 on 2026-10-17 14:16
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('simword', '0007_answerwordstats'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='GameSession',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('player_id', models.CharField(max_length=32, verbose_name='플레이어 ID')),
+                ('words', models.TextField(blank=True, default='', verbose_name='추측 단어')),
+                ('guesses', models.BinaryField(default=bytes, verbose_name='추측 기록')),
+                ('guess_count', models.PositiveIntegerField(default=0, verbose_name='추측 횟수')),
+                ('solved_guesses', models.PositiveIntegerField(null=True, verbose_name='정답까지 추측 횟수')),
+                ('solved_at', models.DateTimeField(null=True, verbose_name='정답 시각')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='시작 시각')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='수정 날짜')),
+                ('answer_word', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='sessions', to='simword.answerword', verbose_name='정답 단어')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('player_id', 'answer_word'), name='unique_game_session')],
+            },
+        ),
+    ]
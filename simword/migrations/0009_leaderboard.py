@@ -0,0 +1,39 @@
+# Generated by Django 5.1.5 on 2026-10-17 14:18
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('simword', '0008_gamesession'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LeaderboardSnapshot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('last_entry_id', models.BigIntegerField(default=0, verbose_name='마지막 반영 기록 ID')),
+                ('tree', models.BinaryField(verbose_name='추측 횟수별 누적 트리')),
+                ('top', models.JSONField(default=list, verbose_name='상위 기록')),
+                ('recent_ids', models.JSONField(default=list, verbose_name='최근 반영 기록 ID')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='수정 날짜')),
+                ('answer_word', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='leaderboard_snapshot', to='simword.answerword', verbose_name='정답 단어')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='LeaderboardEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('player_id', models.CharField(max_length=32, verbose_name='플레이어 ID')),
+                ('guesses', models.PositiveIntegerField(verbose_name='정답까지 추측 횟수')),
+                ('solved_at', models.DateTimeField(verbose_name='정답 시각')),
+                ('answer_word', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='leaderboard_entries', to='simword.answerword', verbose_name='정답 단어')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('answer_word', 'player_id'), name='unique_leaderboard_entry')],
+            },
+        ),
+    ]
@@ -0,0 +1,135 @@
+import threading
+import time
+from asgiref.sync import sync_to_async
+from django.db import connection
+from django.http import JsonResponse
+from .embedding import load_model
+
+# 워커가 쓰는 임베딩 모델의 로드 / 준비 상태
+#   - import 시에는 아무것도 읽지 않으며, 처음 get() 할 때 또는 warm_up() 으로 백그라운드에서 로드
+#   - warm_up() 은 WSGI / ASGI 진입점에서만 호출하므로 migrate 등 관리 명령은 모델을 건드리지 않는다
+#   - 로드 진행 상황은 /readyz 로 확인 (로드밸런서는 200 이 될 때까지 새 워커로 요청을 보내지 않음)
+
+
+class ModelStore:
+    """프로세스당 하나인 임베딩 모델과 준비 단계(모델 로드 → 유사도 엔진 → 오타 후보 색인)의 상태"""
+
+    STEPS = ("model", "engine", "suggestions")
+
+    def __init__(self):
+        self.model = None
+        self.state = "pending"  # pending → loading → ready / failed
+        self.error = None
+        self.started_at = None
+        self.timings = {}  # 완료한 단계 -> 소요 시간 (초)
+        self._lock = threading.Lock()
+        self._thread = None
+
+    @property
+    def ready(self):
+        return self.state == "ready"
+
+    def reset(self):
+        """로드한 모델을 버림 (다음 get() / warm_up() 때 다시 로드)"""
+        with self._lock:
+            self.model = None
+            self.state, self.error, self.started_at, self.timings = "pending", None, None, {}
+
+    def _step(self, name, func):
+        started = time.perf_counter()
+        result = func()
+        self.timings[name] = round(time.perf_counter() - started, 3)
+        return result
+
+    def _load_model(self):
+        """모델만 로드 (이미 로드되어 있으면 그대로 반환)"""
+        with self._lock:
+            if self.model is None:
+                if self.started_at is None:
+                    self.started_at = time.time()
+                self.state, self.error = "loading", None
+                try:
+                    self.model = self._step("model", load_model)
+                except Exception as e:
+                    self.state, self.error = "failed", str(e)
+                    raise
+                if self._thread is None:
+                    # warm_up() 없이 바로 불러온 경우 (관리 명령 / 테스트), 엔진은 첫 요청 때 생성
+                    self.state = "ready"
+            return self.model
+
+    def get(self):
+        """임베딩 모델을 반환 (아직 로드 전이면 이 자리에서 로드하거나 진행 중인 로드를 기다림)"""
+        model = self.model
+        if model is None:
+            model = self._load_model()
+        return model
+
+    async def aget(self):
+        """비동기 뷰용 get() (로드를 기다려야 할 때만 스레드에서 실행)"""
+        model = self.model
+        if model is None:
+            model = await sync_to_async(self._load_model, thread_sensitive=False)()
+        return model
+
+    def warm_up(self):
+        """백그라운드 스레드에서 모델과 유사도 엔진을 미리 준비 (이미 시작했으면 무시)"""
+        with self._lock:
+            if self._thread is not None or self.ready:
+                return
+            self._thread = threading.Thread(target=self._warm_up, name="simword-warm-up", daemon=True)
+        self._thread.start()
+
+    def _warm_up(self):
+        from .ranking import get_vocabulary_version
+        from .similarity import get_engine
+        from .suggestions import get_index
+
+        try:
+            model = self._load_model()
+            version = get_vocabulary_version()
+            if version:
+                engine = self._step("engine", lambda: get_engine(model, version))
+                self._step("suggestions", lambda: get_index(engine))
+            self.state = "ready"
+        except Exception as e:
+            self.state, self.error = "failed", str(e)
+        finally:
+            self._thread = None
+            connection.close()  # 이 스레드 전용 DB 연결 정리
+
+    def wait(self, timeout=None):
+        """진행 중인 warm_up() 이 끝날 때까지 대기"""
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+        return self.ready
+
+    def status(self):
+        return {
+            "state": self.state,
+            "steps": {name: self.timings.get(name) for name in self.STEPS},
+            "elapsed": round(time.time() - self.started_at, 3) if self.started_at else None,
+            "error": self.error,
+        }
+
+
+model_store = ModelStore()
+
+
+def healthz(request):
+    """프로세스가 요청을 처리할 수 있는지 (모델 로드 여부와 무관)"""
+    return JsonResponse({"status": "ok"})
+
+
+def readyz(request):
+    """모델 / 유사도 엔진 준비와 DB 연결이 끝났으면 200, 아니면 503 과 진행 상황을 반환"""
+    status = model_store.status()
+    try:
+        connection.ensure_connection()
+        status["database"] = "ok"
+    except Exception as e:
+        status["database"] = str(e)
+
+    ready = model_store.ready and status["database"] == "ok"
+    return JsonResponse(status, status=200 if ready else 503)
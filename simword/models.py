@@ -1,7 +1,7 @@
 from django.db import models
 
 class AnswerWord(models.Model):
-    answer_word = models.CharField(max_length=100, verbose_name="정답 단어")
+    answer_word = models.CharField(max_length=100, unique=True, verbose_name="정답 단어")
     created_at = models.DateTimeField(auto_now_add=True, verbose_name="등록 날짜")
     updated_at = models.DateTimeField(auto_now=True, verbose_name="수정 날짜")
 
@@ -9,9 +9,139 @@ class AnswerWord(models.Model):
         return self.answer_word
 
 class BaseWord(models.Model):
-    base_word = models.CharField(max_length=100, verbose_name="비교 단어")
+    base_word = models.CharField(max_length=100, unique=True, verbose_name="비교 단어")
     created_at = models.DateTimeField(auto_now_add=True, verbose_name="등록 날짜")
     updated_at = models.DateTimeField(auto_now=True, verbose_name="수정 날짜")
 
     def __str__(self):
-        return self.base_word
\ No newline at end of file
+        return self.base_word
+
+class RankTable(models.Model):
+    answer_word = models.OneToOneField(AnswerWord, on_delete=models.CASCADE, related_name="rank_table", verbose_name="정답 단어")
+    vocab_version = models.BigIntegerField(default=0, verbose_name="어휘 버전")
+    ranking = models.JSONField(default=list, verbose_name="유사도 순위")
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="등록 날짜")
+    updated_at = models.DateTimeField(auto_now=True, verbose_name="수정 날짜")
+
+    def __str__(self):
+        return f"{self.answer_word} (v{self.vocab_version})"
+
+class AnswerWordStats(models.Model):
+    answer_word = models.OneToOneField(AnswerWord, on_delete=models.CASCADE, related_name="stats", verbose_name="정답 단어")
+    vocab_version = models.BigIntegerField(default=0, verbose_name="어휘 버전")
+    candidate_count = models.PositiveIntegerField(default=0, verbose_name="후보 단어 수")
+    top1 = models.FloatField(null=True, verbose_name="1위 유사도(%)")
+    top10 = models.FloatField(null=True, verbose_name="10위 유사도(%)")
+    top100 = models.FloatField(null=True, verbose_name="100위 유사도(%)")
+    percentiles = models.JSONField(default=dict, verbose_name="유사도 분포 백분위(%)")
+    density = models.FloatField(default=0, verbose_name="이웃 밀도")
+    usable = models.BooleanField(default=True, verbose_name="출제 적합 여부")
+    updated_at = models.DateTimeField(auto_now=True, verbose_name="수정 날짜")
+
+    def __str__(self):
+        return f"{self.answer_word} (v{self.vocab_version}, 밀도 {self.density:.3f})"
+
+class GameSession(models.Model):
+    player_id = models.CharField(max_length=32, verbose_name="플레이어 ID")
+    answer_word = models.ForeignKey(AnswerWord, on_delete=models.CASCADE, related_name="sessions", verbose_name="정답 단어")
+    words = models.TextField(default="", blank=True, verbose_name="추측 단어")  # 줄바꿈으로 구분
+    guesses = models.BinaryField(default=bytes, verbose_name="추측 기록")  # 단어별 유사도(%) x 100 int16 반복
+    guess_count = models.PositiveIntegerField(default=0, verbose_name="추측 횟수")
+    solved_guesses = models.PositiveIntegerField(null=True, verbose_name="정답까지 추측 횟수")
+    solved_at = models.DateTimeField(null=True, verbose_name="정답 시각")
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="시작 시각")
+    updated_at = models.DateTimeField(auto_now=True, verbose_name="수정 날짜")
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["player_id", "answer_word"], name="unique_game_session"),
+        ]
+
+    def __str__(self):
+        return f"{self.player_id} - {self.answer_word} ({self.guess_count}회)"
+
+class LeaderboardEntry(models.Model):
+    answer_word = models.ForeignKey(AnswerWord, on_delete=models.CASCADE, related_name="leaderboard_entries", verbose_name="정답 단어")
+    player_id = models.CharField(max_length=32, verbose_name="플레이어 ID")
+    guesses = models.PositiveIntegerField(verbose_name="정답까지 추측 횟수")
+    solved_at = models.DateTimeField(verbose_name="정답 시각")
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["answer_word", "player_id"], name="unique_leaderboard_entry"),
+        ]
+
+    def __str__(self):
+        return f"{self.answer_word} - {self.player_id} ({self.guesses}회)"
+
+class LeaderboardSnapshot(models.Model):
+    answer_word = models.OneToOneField(AnswerWord, on_delete=models.CASCADE, related_name="leaderboard_snapshot", verbose_name="정답 단어")
+    last_entry_id = models.BigIntegerField(default=0, verbose_name="마지막 반영 기록 ID")
+    tree = models.BinaryField(verbose_name="추측 횟수별 누적 트리")  # Fenwick 트리 (uint32 배열)
+    top = models.JSONField(default=list, verbose_name="상위 기록")
+    recent_ids = models.JSONField(default=list, verbose_name="최근 반영 기록 ID")
+    updated_at = models.DateTimeField(auto_now=True, verbose_name="수정 날짜")
+
+    def __str__(self):
+        return f"{self.answer_word} (기록 {self.last_entry_id}까지)"
+
+class AnalyzedArticle(models.Model):
+    content_hash = models.CharField(max_length=40, unique=True, verbose_name="본문 해시")
+    date = models.DateField(verbose_name="수집 날짜")
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="등록 날짜")
+
+    def __str__(self):
+        return f"{self.content_hash} ({self.date})"
+
+class TermDailyCount(models.Model):
+    date = models.DateField(verbose_name="날짜")
+    term = models.CharField(max_length=100, verbose_name="단어")
+    count = models.PositiveIntegerField(default=0, verbose_name="출현 횟수")
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["date", "term"], name="unique_term_daily_count"),
+        ]
+        indexes = [
+            models.Index(fields=["term", "date"], name="term_daily_count_term_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.term} ({self.date}: {self.count})"
+
+class TermStats(models.Model):
+    term = models.CharField(max_length=100, unique=True, verbose_name="단어")
+    days = models.PositiveIntegerField(default=0, verbose_name="등장 일수")
+
+    def __str__(self):
+        return f"{self.term} ({self.days}일)"
+
+class TermDay(models.Model):
+    date = models.DateField(unique=True, verbose_name="날짜")  # 통계가 있는 날짜 (IDF 의 문서 수)
+
+    def __str__(self):
+        return str(self.date)
+
+class JobRun(models.Model):
+    STATUS_CHOICES = [
+        ("running", "실행 중"),
+        ("success", "성공"),
+        ("failed", "실패"),
+    ]
+
+    name = models.CharField(max_length=50, verbose_name="작업 이름")
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default="running", verbose_name="상태")
+    dry_run = models.BooleanField(default=False, verbose_name="시험 실행")
+    timings = models.JSONField(default=dict, verbose_name="단계별 소요 시간(초)")
+    stats = models.JSONField(default=dict, verbose_name="처리 결과")
+    error = models.TextField(blank=True, default="", verbose_name="오류")
+    started_at = models.DateTimeField(auto_now_add=True, verbose_name="시작 시각")
+    finished_at = models.DateTimeField(null=True, blank=True, verbose_name="종료 시각")
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["name", "-started_at"], name="job_run_name_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.name} ({self.started_at}, {self.status})"
@@ -1,137 +1,129 @@
 import requests
+import threading
 from bs4 import BeautifulSoup
-from collections import Counter
-from konlpy.tag import Okt
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from requests.adapters import HTTPAdapter
+from urllib.parse import urljoin, urlsplit
+from urllib3.util.retry import Retry
 import time
-import os
-import django
-import schedule
 
 
-def setup_django_environment():
-    """Django 환경을 설정합니다."""
-    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")  # 정확한 경로 설정
-    django.setup()
-
-
-setup_django_environment()
-
-
-from simword.models import BaseWord
-
-
-def get_popular_articles():
+# 네이버 뉴스 랭킹 페이지 및 요청 설정
+RANKING_URL = "https://news.naver.com/main/ranking/popularDay.naver"
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+}
+MAX_ARTICLES = 50
+MAX_WORKERS = 8  # 동시에 기사를 가져오는 스레드 수
+PER_HOST_CONCURRENCY = 4  # 호스트별 동시 요청 수
+PER_HOST_RATE = 5.0  # 호스트별 초당 요청 수
+REQUEST_TIMEOUT = (5, 15)  # (연결, 읽기) 제한 시간
+MAX_RETRIES = 3
+BACKOFF_FACTOR = 0.5
+
+
+class HostRateLimiter:
+    """호스트별 동시 요청 수와 초당 요청 수를 제한"""
+
+    def __init__(self, concurrency=PER_HOST_CONCURRENCY, rate=PER_HOST_RATE):
+        self.concurrency = concurrency
+        self.interval = 1 / rate if rate else 0
+        self._lock = threading.Lock()
+        self._semaphores = {}
+        self._next_start = {}
+
+    @contextmanager
+    def limit(self, url):
+        host = urlsplit(url).netloc
+        with self._lock:
+            semaphore = self._semaphores.setdefault(host, threading.BoundedSemaphore(self.concurrency))
+
+        with semaphore:
+            # 요청 시작 시각을 interval 간격으로 예약
+            with self._lock:
+                now = time.monotonic()
+                start = max(now, self._next_start.get(host, now))
+                self._next_start[host] = start + self.interval
+            time.sleep(max(0, start - now))
+            yield
+
+
+def create_session(pool_size=MAX_WORKERS):
+    """연결을 재사용하고 실패 시 지수 백오프로 재시도하는 세션"""
+    retry = Retry(
+        total=MAX_RETRIES,
+        backoff_factor=BACKOFF_FACTOR,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=("GET",),
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+
+    session = requests.Session()
+    session.headers.update(HEADERS)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def fetch(session, limiter, url):
+    """페이지 원문 (인코딩은 BeautifulSoup 이 meta charset 으로 판별)"""
+    with limiter.limit(url):
+        response = session.get(url, timeout=REQUEST_TIMEOUT)
+    response.raise_for_status()
+    return response.content
+
+
+def fetch_article_text(session, limiter, article_url):
+    """기사 본문 텍스트 (본문이 없으면 None)"""
+    article_soup = BeautifulSoup(fetch(session, limiter, article_url), "html.parser")
+    content = article_soup.select_one("#dic_area")
+    return content.get_text(strip=True) if content else None
+
+
+def iter_popular_articles(ranking_url=RANKING_URL, max_articles=MAX_ARTICLES, session=None, limiter=None, max_workers=MAX_WORKERS):
     """
-    네이버 뉴스 인기 기사 페이지에서 최대 50개의 기사를 수집합니다.
+    네이버 뉴스 인기 기사 본문을 도착하는 순서대로 최대 max_articles 개 반환합니다.
     """
-    url = "https://news.naver.com/main/ranking/popularDay.naver"
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-    }
-    articles = []
-    visited_urls = set()  # 중복 링크 확인용 집합
+    session = session or create_session(max_workers)
+    limiter = limiter or HostRateLimiter()
 
     try:
-        print(f"요청 URL: {url}")
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
+        print(f"요청 URL: {ranking_url}")
+        ranking_html = fetch(session, limiter, ranking_url)
     except requests.RequestException as e:
         print(f"페이지 로드 실패: {e}")
-        return articles
+        return
 
-    soup = BeautifulSoup(response.text, "html.parser")
+    soup = BeautifulSoup(ranking_html, "html.parser")
     news_links = soup.select("div.rankingnews_box a.list_title[href]")  # 인기 기사 링크 선택자
+    # 중복 링크 제거 (순서 유지)
+    article_urls = list(dict.fromkeys(urljoin(ranking_url, link["href"]) for link in news_links))
 
-    for link in news_links:
-        article_url = link["href"]
-        if not article_url.startswith("http"):
-            article_url = "https://news.naver.com" + article_url
-
-        # 중복 링크 확인 및 건너뛰기
-        if article_url in visited_urls:
-            continue
-
-        visited_urls.add(article_url)  # 고유 링크 추가
-
+    seen_texts = set()  # 중복된 기사 내용 확인용
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(fetch_article_text, session, limiter, url): url for url in article_urls}
         try:
-            print("article_url : " + article_url)
-            article_response = requests.get(article_url, headers=headers)
-            article_response.raise_for_status()
-        except requests.RequestException as e:
-            print(f"기사 로드 실패: {e}")
-            continue
-
-        article_soup = BeautifulSoup(article_response.text, "html.parser")
-        content = article_soup.select_one("#dic_area")
-
-        if content:
-            article_text = content.get_text(strip=True)
-            if article_text not in articles:  # 중복된 기사 내용 확인
-                articles.append(article_text)
+            for future in as_completed(futures):
+                try:
+                    article_text = future.result()
+                except requests.RequestException as e:
+                    print(f"기사 로드 실패: {futures[future]} ({e})")
+                    continue
 
-        # 최대 50개의 기사만 수집
-        if len(articles) >= 50:
-            break
+                if article_text and article_text not in seen_texts:
+                    seen_texts.add(article_text)
+                    yield article_text
 
-        # 요청 간격 유지
-        time.sleep(1)
+                    if len(seen_texts) >= max_articles:
+                        break
+        finally:
+            for future in futures:
+                future.cancel()
 
-    return articles
-
-
-def extract_frequent_words(texts):
-    """
-    수집한 텍스트에서 빈도수가 높은 단어를 추출합니다.
-    """
-    okt = Okt()
-    all_words = []
 
-    for text in texts:
-        nouns = okt.nouns(text)  # 명사 추출
-        filtered_nouns = [noun for noun in nouns if len(noun) > 1]  # 한 글자 단어 제외
-        all_words.extend(filtered_nouns)
-
-    # 단어 빈도 계산
-    word_counts = Counter(all_words)
-
-    # 상위 50개 단어 반환
-    return word_counts.most_common(50)
-
-
-def save_words_to_baseword(words):
+def get_popular_articles():
     """
-    상위 50개의 단어를 BaseWord 모델에 저장합니다.
+    네이버 뉴스 인기 기사 페이지에서 최대 50개의 기사를 수집합니다.
     """
-    for word, count in words:
-        BaseWord.objects.get_or_create(base_word=word)
-    print("크롤링한 단어를 BaseWord 모델에 저장했습니다.")
-
-
-def main():
-    print("네이버 뉴스 인기 기사에서 데이터를 수집 중입니다...")
-    articles = get_popular_articles()
-
-    if not articles:
-        print("기사를 가져오지 못했습니다.")
-        return
-
-    print(f"총 {len(articles)}개의 기사를 분석합니다.")
-    frequent_words = extract_frequent_words(articles)
-
-    # 단어 순위 출력
-    print("\n단어 순위 리스트 (TOP 50):")
-    for rank, (word, count) in enumerate(frequent_words, start=1):
-        print(f"{rank}. {word} ({count}회)")
-
-    save_words_to_baseword(frequent_words)
-
-
-# 스케줄링 설정
-schedule.every().day.at("00:00").do(main)  # 매일 자정에 실행
-
-
-if __name__ == "__main__":
-    print("스케줄러 실행 중... (Ctrl+C로 종료)")
-    while True:
-        schedule.run_pending()
-        time.sleep(1)
+    return list(iter_popular_articles())
@@ -0,0 +1,141 @@
+import hashlib
+import multiprocessing
+import os
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+# 명사 추출 단계
+#   - Okt 는 JVM 기반이라 느리므로 프로세스 풀의 각 워커가 미리 만들어 둔 Okt 로 기사 묶음을 분석
+#   - 워커는 묶음별 Counter 만 돌려주고, 부모 프로세스는 도착하는 대로 합침 (전체 단어 목록을 만들지 않음)
+#   - 캐시 디렉터리를 주면 기사 본문 해시별 명사 목록을 저장해 다시 실행할 때 분석을 건너뜀
+NOUN_WORKERS = max(1, (os.cpu_count() or 2) - 1)
+CHUNK_SIZE = 8  # 워커에 한 번에 넘기는 기사 수
+MIN_NOUN_LENGTH = 2  # 한 글자 단어 제외
+
+# 추출 규칙이 바뀌면 올려서 기존 캐시를 무효화
+CACHE_FORMAT = 1
+
+_okt = None
+
+
+def _init_worker():
+    """워커마다 Okt 를 한 번 만들고 첫 호출로 미리 예열"""
+    global _okt
+    from konlpy.tag import Okt
+
+    _okt = Okt()
+    _okt.nouns("형태소 분석기 예열")
+
+
+def extract_nouns(text):
+    if _okt is None:
+        _init_worker()
+    return [noun for noun in _okt.nouns(text) if len(noun) >= MIN_NOUN_LENGTH]
+
+
+class NounCache:
+    """기사 본문 해시 -> 명사 목록 디스크 캐시 (줄마다 명사 하나)"""
+
+    def __init__(self, directory):
+        self.directory = directory
+
+    @staticmethod
+    def key(text):
+        return hashlib.sha1(f"{CACHE_FORMAT}:{text}".encode("utf-8")).hexdigest()
+
+    def path(self, key):
+        return os.path.join(self.directory, key[:2], f"{key}.txt")
+
+    def get(self, key):
+        try:
+            with open(self.path(key), encoding="utf-8") as f:
+                content = f.read()
+        except FileNotFoundError:
+            return None
+        return content.split("\n") if content else []
+
+    def set(self, key, nouns):
+        """임시 파일에 쓴 뒤 교체해 여러 워커가 동시에 써도 깨지지 않게 저장"""
+        path = self.path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            f.write("\n".join(nouns))
+        os.replace(temp_path, path)
+
+
+def count_chunk(texts, cache_directory=None):
+    """기사 묶음의 명사 빈도 (캐시 디렉터리가 있으면 명사 목록도 저장)"""
+    cache = NounCache(cache_directory) if cache_directory else None
+    counts = Counter()
+    for text in texts:
+        nouns = extract_nouns(text)
+        if cache:
+            cache.set(NounCache.key(text), nouns)
+        counts.update(nouns)
+    return counts
+
+
+def count_nouns(texts, workers=NOUN_WORKERS, chunk_size=CHUNK_SIZE, cache_directory=None):
+    """
+    기사 본문 목록(또는 도착하는 대로 내보내는 제너레이터)의 명사 빈도를 계산합니다.
+    """
+    cache = NounCache(cache_directory) if cache_directory else None
+    counts = Counter()
+
+    if workers <= 1:
+        # 워커 없이 현재 프로세스에서 분석 (캐시 확인은 동일)
+        pending = []
+        for text in texts:
+            nouns = cache.get(NounCache.key(text)) if cache else None
+            if nouns is None:
+                pending.append(text)
+            else:
+                counts.update(nouns)
+        if pending:
+            counts.update(count_chunk(pending, cache_directory))
+        return counts
+
+    executor = None
+    running = set()
+    chunk = []
+
+    def submit(chunk):
+        nonlocal executor
+        if executor is None:
+            # JVM 은 fork 후 사용할 수 없으므로 spawn 으로 워커를 만듦 (모두 캐시에 있으면 풀을 띄우지 않음)
+            executor = ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("spawn"), initializer=_init_worker,
+            )
+        running.add(executor.submit(count_chunk, chunk, cache_directory))
+
+        # 분석이 밀리면 새 묶음을 넣기 전에 끝난 결과부터 합쳐 메모리를 제한
+        while len(running) >= workers * 2:
+            collect(wait(running, return_when=FIRST_COMPLETED).done)
+
+    def collect(done):
+        for future in done:
+            running.discard(future)
+            counts.update(future.result())
+
+    try:
+        for text in texts:
+            nouns = cache.get(NounCache.key(text)) if cache else None
+            if nouns is not None:
+                counts.update(nouns)
+                continue
+
+            chunk.append(text)
+            if len(chunk) >= chunk_size:
+                submit(chunk)
+                chunk = []
+
+        if chunk:
+            submit(chunk)
+        while running:
+            collect(wait(running, return_when=FIRST_COMPLETED).done)
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+    return counts
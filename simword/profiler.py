@@ -0,0 +1,90 @@
+import os
+import signal
+import sys
+import threading
+import time
+from collections import Counter
+from django.conf import settings
+
+
+class SamplingProfiler:
+    """일정 간격으로 모든 스레드의 호출 스택을 모아 collapsed stack 형식(flamegraph 입력)으로 저장
+
+    요청 처리 스레드를 멈추지 않고 별도 스레드에서 sys._current_frames() 만 읽으므로
+    운영 중인 워커 하나에 잠깐 켜 두어도 부담이 작다.
+    """
+
+    def __init__(self):
+        self.samples = Counter()
+        self.started_at = None
+        self._stop = None
+        self._thread = None
+
+    @property
+    def running(self):
+        return self._thread is not None
+
+    def start(self, interval):
+        if self.running:
+            return
+        self.samples = Counter()
+        self.started_at = time.time()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, args=(interval, self._stop), name="simword-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self, directory):
+        """수집을 멈추고 결과 파일 경로를 반환"""
+        if not self.running:
+            return None
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, f"profile-{os.getpid()}-{time.strftime('%Y%m%d-%H%M%S')}.txt")
+        with open(path, "w") as f:
+            for stack, count in self.samples.most_common():
+                f.write(f"{stack} {count}\n")
+        return path
+
+    def _run(self, interval, stop):
+        own_id = threading.get_ident()
+        while not stop.wait(interval):
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{frame.f_lineno})")
+                    frame = frame.f_back
+                self.samples[";".join(reversed(stack))] += 1
+
+
+profiler = SamplingProfiler()
+
+
+def toggle(*args):
+    """프로파일러를 켜거나 끔 (끌 때 결과를 SIMWORD_PROFILE_DIR 에 저장)"""
+    if profiler.running:
+        path = profiler.stop(settings.SIMWORD_PROFILE_DIR)
+        print(f"[{os.getpid()}] 프로파일 저장: {path}", file=sys.stderr)
+    else:
+        profiler.start(settings.SIMWORD_PROFILE_INTERVAL)
+        print(f"[{os.getpid()}] 프로파일링 시작", file=sys.stderr)
+
+
+def install_signal_handler():
+    """SIMWORD_PROFILE_SIGNAL 을 받으면 이 워커의 프로파일러를 켜고 끄도록 등록
+
+        kill -USR2 <워커 pid>   # 시작, 한 번 더 보내면 중지 후 저장
+    """
+    name = settings.SIMWORD_PROFILE_SIGNAL
+    if not name or not hasattr(signal, name):
+        return False
+    try:
+        signal.signal(getattr(signal, name), toggle)
+    except ValueError:
+        return False  # 메인 스레드가 아니면 시그널을 등록할 수 없음
+    return True
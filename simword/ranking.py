@@ -0,0 +1,128 @@
+import heapq
+from django.db import IntegrityError
+from django.db.models import Max
+from django.http import JsonResponse
+from django.utils import timezone
+from .metrics import stage
+from .model_store import model_store
+from .models import BaseWord, RankTable
+from .similarity import get_engine, to_percentage
+
+# 응답에 노출하는 상위 순위 개수
+TOP_N = 100
+
+# 프로세스 내 순위표 캐시 (AnswerWord id -> RankIndex)
+_rank_indexes = {}
+
+
+class RankIndex:
+    """정렬된 전체 후보 순위와 단어→순위 색인"""
+
+    def __init__(self, ranking, version):
+        self.ranking = ranking  # [[단어, 유사도(%)], ...] 유사도 내림차순
+        self.version = version
+        self.rank_of = {word: rank for rank, (word, _) in enumerate(ranking, start=1)}
+
+    def top(self, n=TOP_N):
+        return [
+            {"word": word, "similarity_percentage": percentage, "rank": rank}
+            for rank, (word, percentage) in enumerate(self.ranking[:n], start=1)
+        ]
+
+
+def clear_rank_indexes():
+    """프로세스 내 순위표 캐시를 비움"""
+    _rank_indexes.clear()
+
+
+def get_vocabulary_version():
+    """BaseWord 어휘 버전 (가장 마지막으로 추가된 BaseWord 의 id)"""
+    return BaseWord.objects.aggregate(version=Max("id"))["version"] or 0
+
+
+def extend_ranking(engine, answer_word, ranking):
+    """
+    엔진 후보 단어 중 순위표에 없는 단어만 계산해 기존 순위표에 병합합니다.
+
+    id 순서와 다르게 늦게 커밋된 BaseWord 도 빠지지 않도록 어휘 버전이 아니라 단어로 비교합니다.
+    """
+    ranked = {word for word, _ in ranking}
+    rows = [row for row, word in enumerate(engine.words) if word not in ranked]
+    new_ranking = engine.ranking(answer_word, rows) if rows else []
+    if not new_ranking:
+        return ranking
+    return list(heapq.merge(ranking, new_ranking, key=lambda item: item[1], reverse=True))
+
+
+def get_rank_index(engine, answer):
+    """
+    AnswerWord 의 최신 순위표를 반환합니다 (없으면 생성, 엔진에 순위표에 없는 후보 단어가 있으면 증분 갱신).
+
+    저장된 순위표는 처음 읽을 때 항상 엔진 후보 단어와 비교하므로, 지난 엔진으로 만든 순위표도 다음 조회 때 채워집니다.
+    """
+    version = engine.version
+    candidates = len(engine.words) - (answer.answer_word in engine.index)
+
+    cached = _rank_indexes.get(answer.id)
+    if cached is not None and cached.version >= version and len(cached.ranking) >= candidates:
+        return cached
+
+    table = RankTable.objects.filter(answer_word=answer).first()
+    if table is None:
+        ranking = engine.ranking(answer.answer_word)
+        try:
+            RankTable.objects.create(answer_word=answer, vocab_version=version, ranking=ranking)
+        except IntegrityError:
+            pass  # 다른 워커가 먼저 저장한 경우
+    else:
+        ranking = extend_ranking(engine, answer.answer_word, table.ranking)
+        if len(ranking) > len(table.ranking) or table.vocab_version < version:
+            version = max(version, table.vocab_version)
+            RankTable.objects.filter(pk=table.pk, vocab_version=table.vocab_version).update(
+                vocab_version=version, ranking=ranking, updated_at=timezone.now()
+            )
+        else:
+            version = table.vocab_version
+
+    rank_index = RankIndex(ranking, version)
+    _rank_indexes[answer.id] = rank_index
+    return rank_index
+
+
+def get_engine_or_error(answer, version=None):
+    """유사도 엔진을 가져오고, 계산할 수 없으면 오류 응답을 함께 반환"""
+    if version is None:
+        version = get_vocabulary_version()
+    if not version:
+        return None, JsonResponse({"error": "No candidate words found in the database."}, status=404)
+
+    model = model_store.get()
+    if answer.answer_word not in model.key_to_index:
+        return None, JsonResponse({"error": f"Answer word '{answer.answer_word}' not found in the model."}, status=400)
+
+    with stage("engine"):
+        engine = get_engine(model, version)
+    if len(engine.words) - (answer.answer_word in engine.index) <= 0:
+        return None, JsonResponse({"error": "No valid candidate words found for similarity calculation."}, status=404)
+
+    return engine, None
+
+
+def build_similarity_rank_list(answer, version):
+    """상위 100개 응답의 (상태 코드, 본문)을 생성"""
+    engine, error = get_engine_or_error(answer, version)
+    if error:
+        return error.status_code, error.content
+
+    with stage("top_k"):
+        top_similarities = [
+            {"word": engine.words[row], "similarity_percentage": to_percentage(score), "rank": rank}
+            for rank, (row, score) in enumerate(engine.top_k(answer.answer_word, TOP_N), start=1)
+        ]
+
+    with stage("json"):
+        return 200, JsonResponse({
+            "id": answer.id,
+            "answer_word": answer.answer_word,
+            "top_100_similarities": top_similarities
+        }).content
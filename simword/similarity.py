@@ -0,0 +1,162 @@
+import threading
+from collections import namedtuple
+import numpy as np
+from .models import BaseWord
+
+# 동시에 bulk_create 한 워커들의 행은 id 순서와 다르게 커밋될 수 있어
+# 동기화할 때마다 이미 반영한 최대 id 아래 이 범위를 다시 읽음 (이미 있는 단어는 건너뜀)
+SYNC_OVERLAP = 5000
+
+# 후보 단어 행렬 / BaseWord id / 단어 목록 / 단어→행 번호 (항상 한 번에 교체)
+EngineState = namedtuple("EngineState", ["matrix", "ids", "words", "index"])
+
+
+class SimilarityEngine:
+    """BaseWord 후보 단어들의 정규화된 임베딩 행렬로 유사도를 일괄 계산
+
+    후보 단어는 추가만 되며, 잠금 없이 읽는 요청이 행렬과 단어 목록의 길이가 다른 중간 상태를
+    보지 않도록 동기화할 때 새 EngineState 를 만들어 통째로 교체한다.
+    """
+
+    def __init__(self, model, dtype=np.float32):
+        self.model = model
+        self.dtype = dtype
+        self.version = 0
+        self.state = EngineState(np.empty((0, model.vector_size), dtype=dtype), np.empty(0, dtype=np.int64), [], {})
+        self._lock = threading.Lock()
+
+    @property
+    def matrix(self):
+        return self.state.matrix
+
+    @property
+    def ids(self):
+        return self.state.ids
+
+    @property
+    def words(self):
+        return self.state.words
+
+    @property
+    def index(self):
+        return self.state.index
+
+    def sync(self, version):
+        """version(BaseWord 최대 id) 까지 새로 추가된 후보 단어를 행렬에 덧붙임"""
+        if version <= self.version:
+            return
+
+        with self._lock:
+            if version <= self.version:
+                return
+
+            state = self.state
+            since = max(0, self.version - SYNC_OVERLAP)
+            rows = BaseWord.objects.filter(id__gt=since, id__lte=version).order_by("id").values_list("id", "base_word")
+            new_ids, new_rows = [], {}
+            for word_id, word in rows:
+                # BaseWord 는 단어가 유일하므로 이미 색인한 단어면 이미 반영한 행
+                if word in state.index or word in new_rows or word not in self.model.key_to_index:
+                    continue
+                new_rows[word] = len(state.words) + len(new_rows)
+                new_ids.append(word_id)
+
+            if new_rows:
+                vectors = self.normalize(self.model.vectors[[self.model.key_to_index[word] for word in new_rows]])
+                index = dict(state.index)
+                index.update(new_rows)
+                self.state = EngineState(
+                    np.ascontiguousarray(np.vstack([state.matrix, vectors])),
+                    np.concatenate([state.ids, np.asarray(new_ids, dtype=np.int64)]),
+                    state.words + list(new_rows),
+                    index,
+                )
+            self.version = version
+
+    def normalize(self, vectors):
+        """벡터(또는 행렬)를 float32 로 변환해 길이 1로 정규화"""
+        vectors = np.asarray(vectors, dtype=np.float32)
+        norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+        norms[norms == 0] = 1
+        return (vectors / norms).astype(self.dtype)
+
+    def vector(self, word, state=None):
+        """단어의 정규화된 벡터 (후보 단어가 아니면 모델에서 가져옴)"""
+        state = state or self.state
+        row = state.index.get(word)
+        if row is not None:
+            return state.matrix[row]
+        return self.normalize(self.model.get_vector(word))
+
+    def similarity(self, word1, word2):
+        """두 단어의 코사인 유사도 (내적 한 번)"""
+        return float(np.dot(self.vector(word1).astype(np.float32), self.vector(word2).astype(np.float32)))
+
+    def similarities(self, words, answer_word):
+        """여러 단어와 정답 단어의 코사인 유사도를 행렬-벡터 곱 한 번으로 계산"""
+        if not words:
+            return np.empty(0, dtype=np.float32)
+        vectors = np.stack([self.vector(word) for word in words]).astype(np.float32)
+        return vectors @ self.vector(answer_word).astype(np.float32)
+
+    def scores(self, answer_word, rows=None, state=None):
+        """정답 단어와 후보 단어(행) 전체의 유사도를 행렬-벡터 곱 한 번으로 계산"""
+        state = state or self.state
+        matrix = state.matrix if rows is None else state.matrix[rows]
+        return (matrix @ self.vector(answer_word, state)).astype(np.float32)
+
+    def top_k(self, answer_word, k):
+        """정답 단어를 제외한 유사도 상위 k개 (행 번호, 유사도) 목록"""
+        state = self.state
+        scores = self.scores(answer_word, state=state)
+        answer_row = state.index.get(answer_word)
+        if answer_row is not None:
+            scores[answer_row] = -np.inf
+
+        k = min(k, len(scores))
+        if k <= 0:
+            return []
+
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.lexsort((top, -scores[top]))]
+        return [(int(row), float(scores[row])) for row in top if np.isfinite(scores[row])]
+
+    def ranking(self, answer_word, rows=None):
+        """정답 단어를 제외한 후보 단어 전체(또는 일부 행)의 [단어, 유사도(%)] 내림차순 목록"""
+        state = self.state
+        rows = np.arange(len(state.words)) if rows is None else np.asarray(rows, dtype=np.int64)
+        answer_row = state.index.get(answer_word)
+        if answer_row is not None:
+            rows = rows[rows != answer_row]
+
+        scores = self.scores(answer_word, rows, state)
+        order = np.argsort(-scores, kind="stable")
+        return [[state.words[rows[i]], to_percentage(scores[i])] for i in order]
+
+
+def to_percentage(score):
+    """유사도를 응답용 백분율로 변환"""
+    return round(float(score) * 100, 2)
+
+
+# 프로세스당 하나의 엔진을 사용
+_engine = None
+_engine_lock = threading.Lock()
+
+
+def get_engine(model, version):
+    """전역 SimilarityEngine 을 version 까지 동기화해 반환"""
+    global _engine
+
+    if _engine is None or _engine.model is not model:
+        with _engine_lock:
+            if _engine is None or _engine.model is not model:
+                _engine = SimilarityEngine(model)
+    _engine.sync(version)
+    return _engine
+
+
+def reset_engine():
+    """전역 엔진을 버림 (다음 요청 때 처음부터 다시 생성)"""
+    global _engine
+    _engine = None
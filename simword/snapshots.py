@@ -0,0 +1,236 @@
+import gzip
+import json
+import os
+import re
+import shutil
+import tempfile
+import numpy as np
+from django.conf import settings
+from django.http import FileResponse, HttpResponse
+from django.utils.cache import patch_vary_headers
+from .model_store import model_store
+
+# 상위 100개 응답 스냅샷 (미리 계산해 gzip 으로 저장한 응답 본문)
+#   <SIMWORD_SNAPSHOT_DIR>/v<세대>/<AnswerWord id>.json.gz   한 번 쓰면 바뀌지 않음 (무효가 되면 삭제)
+#   <SIMWORD_SNAPSHOT_DIR>/v<세대>/manifest.json             정답 단어별 100위 기준 유사도 / 상위 단어
+#   <SIMWORD_SNAPSHOT_DIR>/current -> v<세대>                Nginx 가 직접 제공할 때 사용
+#
+# 세대는 prewarm_snapshots 를 실행한 시점의 어휘 버전이며, 어휘 버전(BaseWord 최대 id)이 바뀌어도 그대로 유지한다.
+# 대신 BaseWord 를 저장하는 쪽에서 invalidate() 로 새 단어가 상위 100개에 들어가는 정답 단어의 스냅샷만 지워
+# Nginx 와 뷰가 그 단어만 다시 계산하게 한다.
+#
+#   location ~ ^/api/simword/(\d+)/$ {
+#       root <SIMWORD_SNAPSHOT_DIR>/current;
+#       gzip_static always; gunzip on;
+#       try_files /$1.json @django;
+#   }
+CURRENT = "current"
+MANIFEST = "manifest.json"
+VERSION_DIR = re.compile(r"^v(\d+)$")
+
+# 응답의 유사도(%)는 소수 둘째 자리로 반올림되므로 100위 기준을 이만큼 낮춰 비교 (애매하면 다시 계산하는 쪽으로)
+THRESHOLD_MARGIN = 0.00005
+
+
+def snapshot_root():
+    return settings.SIMWORD_SNAPSHOT_DIR
+
+
+def generation_dir(version):
+    return os.path.join(snapshot_root(), f"v{version}")
+
+
+def snapshot_path(answer_id, version):
+    return os.path.join(generation_dir(version), f"{answer_id}.json.gz")
+
+
+def _write_atomic(path, data, mode=0o644):
+    """임시 파일에 쓴 뒤 교체 (읽는 쪽은 완성된 파일만 봄)"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return path
+
+
+def write_snapshot(answer_id, version, content):
+    """응답 본문을 gzip 으로 압축해 저장"""
+    return _write_atomic(snapshot_path(answer_id, version), gzip.compress(content, compresslevel=9, mtime=0))
+
+
+def manifest_entry(content, top_n):
+    """
+    응답 본문에서 무효화 판단에 쓰는 값 (정답 단어, 100위 기준 유사도, 상위 단어)을 만듭니다.
+
+    상위 목록이 top_n 개보다 적으면 어떤 새 단어든 목록에 들어가므로 기준을 None 으로 둡니다.
+    """
+    data = json.loads(content)
+    top = data["top_100_similarities"]
+    threshold = top[-1]["similarity_percentage"] / 100 - THRESHOLD_MARGIN if len(top) >= top_n else None
+    return {"answer_word": data["answer_word"], "threshold": threshold, "words": [item["word"] for item in top]}
+
+
+def write_manifest(version, entries):
+    """세대의 manifest ({AnswerWord id: manifest_entry}) 저장"""
+    data = json.dumps({"version": version, "answers": {str(answer_id): entry for answer_id, entry in entries.items()}})
+    return _write_atomic(os.path.join(generation_dir(version), MANIFEST), data.encode("utf-8"))
+
+
+def read_manifest(directory):
+    try:
+        with open(os.path.join(directory, MANIFEST), encoding="utf-8") as f:
+            return json.load(f)["answers"]
+    except (OSError, ValueError, KeyError):
+        return {}
+
+
+def generations():
+    """스냅샷 세대 디렉터리 [(세대, 경로), ...] (최신 세대부터)"""
+    root = snapshot_root()
+    try:
+        names = os.listdir(root)
+    except OSError:
+        return []
+    found = []
+    for name in names:
+        match = VERSION_DIR.match(name)
+        if match:
+            found.append((int(match.group(1)), os.path.join(root, name)))
+    return sorted(found, reverse=True)
+
+
+def current_version():
+    """current 링크가 가리키는 세대 (없으면 None)"""
+    try:
+        match = VERSION_DIR.match(os.readlink(os.path.join(snapshot_root(), CURRENT)))
+    except OSError:
+        return None
+    return int(match.group(1)) if match else None
+
+
+def publish(version, answer_ids=()):
+    """
+    current 링크를 version 세대로 바꾸고, 바로 전 current 세대(지난 창 = 지금 출제 중인 단어)와
+    answer_ids(곧 출제될 정답 단어) 중 새 세대에 없는 단어의 스냅샷이 남아 있는 세대를 뺀 이전 세대를 삭제합니다.
+    """
+    root = snapshot_root()
+    previous = current_version()
+    link = os.path.join(root, CURRENT)
+    tmp_link = f"{link}.{os.getpid()}.tmp"
+    os.symlink(f"v{version}", tmp_link)
+    os.replace(tmp_link, link)
+
+    published = generation_dir(version)
+    missing = [answer_id for answer_id in answer_ids if not os.path.exists(os.path.join(published, f"{answer_id}.json.gz"))]
+    for generation, directory in generations():
+        if generation in (version, previous):
+            continue
+        if not any(os.path.exists(os.path.join(directory, f"{answer_id}.json.gz")) for answer_id in missing):
+            shutil.rmtree(directory, ignore_errors=True)
+
+
+def _normalize(vectors):
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    norms[norms == 0] = 1
+    return vectors / norms
+
+
+def invalidate(words):
+    """
+    새로 추가된 BaseWord 단어 중 스냅샷 상위 100개에 들어갈 단어가 있으면 그 정답 단어의 스냅샷 파일을 지우고
+    지운 파일 수를 반환합니다.
+
+    BaseWord 를 저장한 프로세스가 자기가 저장한 단어로 호출하므로 id 가 커밋 순서와 달라도 빠지는 단어가 없습니다.
+    """
+    if not snapshot_root() or not words:
+        return 0
+    manifests = [(directory, read_manifest(directory)) for _, directory in generations()]
+    if not any(entries for _, entries in manifests):
+        return 0
+
+    model = model_store.get()
+    words = [word for word in dict.fromkeys(words) if word in model.key_to_index]
+    if not words:
+        return 0
+    vectors = _normalize(model.vectors[[model.key_to_index[word] for word in words]])
+
+    removed = 0
+    for directory, entries in manifests:
+        for answer_id, entry in entries.items():
+            path = os.path.join(directory, f"{answer_id}.json.gz")
+            ranked = set(entry["words"])
+            rows = [i for i, word in enumerate(words) if word != entry["answer_word"] and word not in ranked]
+            if not rows or not os.path.exists(path) or entry["answer_word"] not in model.key_to_index:
+                continue
+
+            if entry["threshold"] is not None:
+                scores = vectors[rows] @ _normalize(model.get_vector(entry["answer_word"]))
+                if scores.max() <= entry["threshold"]:
+                    continue
+            try:
+                os.unlink(path)
+                removed += 1
+            except FileNotFoundError:
+                pass
+    return removed
+
+
+def find_snapshot(answer_id):
+    """정답 단어의 스냅샷 파일 경로 (current 세대 우선, 없으면 남아 있는 이전 세대, 모두 없으면 None)"""
+    if not snapshot_root():
+        return None
+    path = os.path.join(snapshot_root(), CURRENT, f"{answer_id}.json.gz")
+    if os.path.exists(path):
+        return path
+    for _, directory in generations():
+        path = os.path.join(directory, f"{answer_id}.json.gz")
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def accepts_gzip(request):
+    """Accept-Encoding 의 gzip (없으면 *) q 값이 0 보다 큰지"""
+    qualities = {}
+    for item in request.headers.get("Accept-Encoding", "").split(","):
+        coding, *params = [part.strip() for part in item.split(";")]
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if coding:
+            qualities[coding.lower()] = quality
+    quality = qualities.get("gzip", qualities.get("x-gzip", qualities.get("*", 0.0)))
+    return quality > 0
+
+
+def snapshot_response(request, answer_id):
+    """스냅샷이 있으면 다시 계산하지 않고 파일 그대로(또는 압축을 풀어) 응답, 없으면 None"""
+    path = find_snapshot(answer_id)
+    if path is None:
+        return None
+    try:
+        f = open(path, "rb")
+    except FileNotFoundError:
+        return None  # 그 사이 무효화된 경우
+
+    if accepts_gzip(request):
+        response = FileResponse(f, content_type="application/json")
+        response["Content-Encoding"] = "gzip"
+        response.headers.pop("Content-Disposition", None)
+    else:
+        with f:
+            response = HttpResponse(gzip.decompress(f.read()), content_type="application/json")
+    patch_vary_headers(response, ("Accept-Encoding",))
+    return response
@@ -0,0 +1,166 @@
+import threading
+import unicodedata
+
+# 입력 단어 정규화 / 오타 교정 후보
+#   - NFC 정규화, 공백 제거, 끝에 붙은 조사 제거 순으로 모델 어휘에 있는 형태를 찾음
+#     (조사를 뗀 형태는 이미 등록된 후보 단어(BaseWord)일 때만 인정해 '먹다' 를 '먹' 처럼 엉뚱한 단어로 바꾸지 않음)
+#   - 그래도 없으면 후보 단어(BaseWord)의 자모 분해 문자열로 만든 SymSpell 식 삭제 색인에서
+#     편집 거리 MAX_EDIT_DISTANCE 이내의 단어를 "혹시 이 단어?" 후보로 제시
+#   - 색인은 모델 어휘 전체(수백만 단어)가 아니라 BaseWord 만 담으므로, BaseWord 가 아닌 단어의 오타에는 후보가 없음
+#     (전체 어휘의 삭제형은 단어당 수십 개라 워커마다 수 GB 가 필요함)
+
+# 명사 뒤에 붙는 조사 (서술격 조사 '이다' / 어미 '다' 는 동사 / 형용사 기본형과 구분할 수 없어 제외)
+# 길이가 긴 것부터 확인 (예: '에서' 를 '서' 보다 먼저)
+PARTICLES = sorted(
+    ["은", "는", "이", "가", "을", "를", "의", "에", "에서", "에게", "께", "께서", "한테", "으로", "로",
+     "와", "과", "도", "만", "까지", "부터", "이랑", "랑", "하고", "이나", "나", "보다", "처럼", "요"],
+    key=len, reverse=True,
+)
+
+# 자모 단위 최대 편집 거리 (2 로 올리면 색인 크기가 단어당 수십 배로 커짐)
+MAX_EDIT_DISTANCE = 1
+MAX_SUGGESTIONS = 5
+
+_HANGUL_BASE, _HANGUL_END = 0xAC00, 0xD7A3
+
+
+def decompose(word):
+    """한글 음절을 초성 / 중성 / 종성 자모로 분해 (오타가 대부분 자모 하나 단위로 생기므로)"""
+    letters = []
+    for char in word:
+        code = ord(char) - _HANGUL_BASE
+        if 0 <= code <= _HANGUL_END - _HANGUL_BASE:
+            letters.append(chr(0x1100 + code // 588))
+            letters.append(chr(0x1161 + code % 588 // 28))
+            if code % 28:
+                letters.append(chr(0x11A7 + code % 28))
+        else:
+            letters.append(char)
+    return "".join(letters)
+
+
+def normalize(word):
+    """NFC 정규화 후 모든 공백 제거"""
+    return "".join(unicodedata.normalize("NFC", word).split())
+
+
+def resolve(word, vocabulary, nouns=None):
+    """
+    입력 단어를 정규화해 vocabulary 에 있는 형태를 반환합니다 (없으면 None).
+
+    정규화한 단어가 없으면 끝에 붙은 조사를 하나 떼어 다시 확인하며, nouns 를 주면 뗀 형태가 nouns 에도 있을 때만 인정합니다.
+    """
+    if word in vocabulary:
+        return word
+
+    word = normalize(word)
+    if word in vocabulary:
+        return word
+
+    for particle in PARTICLES:
+        stem = word[:-len(particle)]
+        if len(word) > len(particle) and word.endswith(particle) and stem in vocabulary and (nouns is None or stem in nouns):
+            return stem
+    return None
+
+
+def _deletes(letters, distance):
+    """letters 에서 distance 개 이하의 글자를 지운 문자열 집합 (자기 자신 포함)"""
+    results = {letters}
+    frontier = {letters}
+    for _ in range(distance):
+        frontier = {item[:i] + item[i + 1:] for item in frontier for i in range(len(item))}
+        results |= frontier
+    return results
+
+
+def edit_distance(a, b, limit):
+    """인접 전치를 포함한 편집 거리 (limit 을 넘으면 limit + 1)"""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+
+    previous2, previous = None, list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = a[i - 1] != b[j - 1]
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], previous2[j - 2] + 1)
+        if min(current) > limit:
+            return limit + 1
+        previous2, previous = previous, current
+    return previous[-1]
+
+
+class SuggestionIndex:
+    """후보 단어의 자모 분해 문자열로 만든 삭제 색인 (삭제형 -> 후보 단어 번호 목록)
+
+    입력 단어의 삭제형 몇 개만 사전에서 찾고 후보만 편집 거리를 확인하므로
+    어휘 크기와 관계없이 1ms 안에 후보를 찾는다.
+    """
+
+    def __init__(self, source=None, distance=MAX_EDIT_DISTANCE):
+        self.source = source  # 색인한 후보 단어 목록의 주인 (유사도 엔진)
+        self.distance = distance
+        self.words = []
+        self.letters = []
+        self.deletes = {}
+        self._lock = threading.Lock()
+
+    def sync(self, words):
+        """words(추가만 되는 후보 단어 목록) 중 아직 색인하지 않은 뒤쪽 단어를 추가"""
+        if len(words) <= len(self.words):
+            return
+
+        with self._lock:
+            for word in words[len(self.words):]:
+                number = len(self.letters)
+                letters = decompose(word)
+                self.letters.append(letters)
+                for key in _deletes(letters, self.distance):
+                    self.deletes.setdefault(key, []).append(number)
+                self.words.append(word)  # 색인을 모두 마친 뒤 추가 (동시에 조회하는 스레드가 번호를 확인할 수 있도록)
+
+    def suggest(self, word, limit=MAX_SUGGESTIONS, order=None):
+        """
+        편집 거리가 가까운 후보 단어를 최대 limit 개 반환합니다.
+
+        거리가 같으면 order(단어 -> 정렬 값, 예: 모델 행 번호 = 빈도 순)가 작은 단어를 앞에 둡니다.
+        """
+        letters = decompose(normalize(word))
+        candidates = set()
+        for key in _deletes(letters, self.distance):
+            candidates.update(self.deletes.get(key, ()))
+
+        scored = []
+        for number in candidates:
+            if number >= len(self.words):
+                continue  # 다른 스레드가 색인 중인 단어
+            distance = edit_distance(letters, self.letters[number], self.distance)
+            if distance <= self.distance:
+                candidate = self.words[number]
+                scored.append((distance, order(candidate) if order else 0, candidate))
+        return [candidate for _, _, candidate in sorted(scored)[:limit]]
+
+
+# 프로세스당 하나의 색인을 유사도 엔진의 후보 단어 목록에 맞춰 유지
+_index = None
+_index_lock = threading.Lock()
+
+
+def get_index(engine):
+    """엔진의 후보 단어 목록까지 색인한 SuggestionIndex (엔진이 바뀌면 새로 만듦)"""
+    global _index
+
+    if _index is None or _index.source is not engine:
+        with _index_lock:
+            if _index is None or _index.source is not engine:
+                _index = SuggestionIndex(engine)
+    _index.sync(engine.words)
+    return _index
+
+
+def suggest(engine, word, limit=MAX_SUGGESTIONS):
+    """엔진의 후보 단어(BaseWord) 중 word 와 비슷한 단어 (모델 어휘에서 자주 나오는 단어 우선)"""
+    return get_index(engine).suggest(word, limit, order=engine.model.key_to_index.get)
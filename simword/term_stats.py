@@ -0,0 +1,129 @@
+import hashlib
+import heapq
+import math
+from collections import Counter
+from datetime import timedelta
+from django.db import transaction
+from django.db.models import F, Sum
+from django.utils import timezone
+from .models import AnalyzedArticle, TermDailyCount, TermDay, TermStats
+from .nouns import count_nouns
+
+# 누적 단어 통계
+#   - 날짜별 단어 출현 횟수(TermDailyCount)를 계속 쌓고, 분석한 기사는 본문 해시로 기록
+#   - 한 번 실행할 때는 새 기사만 분석해 그날의 행에 더하므로 비용은 새 기사 수에 비례
+#   - 단어별 등장 일수(TermStats)와 통계가 있는 날짜(TermDay)도 함께 갱신해 두고, 최근 N일 합계(rolling window)와
+#     날짜를 문서로 보는 TF-IDF 로 유행 단어를 고름
+TREND_DAYS = 7
+BATCH_SIZE = 1000
+MAX_TERM_LENGTH = 100
+
+
+def article_hash(text):
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+def is_analyzed(content_hash):
+    return AnalyzedArticle.objects.filter(content_hash=content_hash).exists()
+
+
+@transaction.atomic
+def record_counts(counts, article_hashes, date=None):
+    """새로 분석한 기사 해시와 명사 빈도를 해당 날짜 통계에 더함"""
+    date = date or timezone.localdate()
+
+    AnalyzedArticle.objects.bulk_create(
+        [AnalyzedArticle(content_hash=content_hash, date=date) for content_hash in article_hashes],
+        batch_size=BATCH_SIZE,
+    )
+
+    # 그날의 기존 행만 읽어 갱신 / 추가 (과거 날짜의 행은 건드리지 않음)
+    existing = {row.term: row for row in TermDailyCount.objects.filter(date=date)}
+    updated, created = [], []
+    for term, count in counts.items():
+        if len(term) > MAX_TERM_LENGTH:
+            continue
+        row = existing.get(term)
+        if row is None:
+            created.append(TermDailyCount(date=date, term=term, count=count))
+        else:
+            row.count += count
+            updated.append(row)
+
+    TermDailyCount.objects.bulk_update(updated, ["count"], batch_size=BATCH_SIZE)
+    TermDailyCount.objects.bulk_create(created, batch_size=BATCH_SIZE)
+
+    # 그날 처음 나온 단어만 등장 일수를 1 늘리고, 그날의 첫 단어면 날짜도 기록
+    new_terms = [row.term for row in created]
+    if new_terms:
+        TermDay.objects.bulk_create([TermDay(date=date)], ignore_conflicts=True)
+    TermStats.objects.bulk_create([TermStats(term=term) for term in new_terms], batch_size=BATCH_SIZE, ignore_conflicts=True)
+    for start in range(0, len(new_terms), BATCH_SIZE):
+        TermStats.objects.filter(term__in=new_terms[start:start + BATCH_SIZE]).update(days=F("days") + 1)
+
+
+def record_articles(texts, date=None, cache_directory=None, dry_run=False):
+    """
+    기사 본문 중 처음 보는 기사만 명사를 추출해 통계에 더하고 (새 기사 수, 명사 빈도)를 반환합니다.
+    dry_run=True 이면 명사 빈도만 계산하고 통계에는 더하지 않습니다.
+    """
+    article_hashes = []
+
+    def new_articles():
+        seen = set()
+        for text in texts:
+            content_hash = article_hash(text)
+            if content_hash in seen or is_analyzed(content_hash):
+                continue
+            seen.add(content_hash)
+            article_hashes.append(content_hash)
+            yield text
+
+    counts = count_nouns(new_articles(), cache_directory=cache_directory)
+    if article_hashes and not dry_run:
+        record_counts(counts, article_hashes, date)
+    return len(article_hashes), counts
+
+
+def window_counts(days=TREND_DAYS, until=None):
+    """until 까지 최근 days 일 동안의 단어별 출현 횟수 합계"""
+    until = until or timezone.localdate()
+    rows = (
+        TermDailyCount.objects
+        .filter(date__range=(until - timedelta(days=days - 1), until))
+        .values("term")
+        .annotate(total=Sum("count"))
+        .values_list("term", "total")
+    )
+    return Counter(dict(rows))
+
+
+def _top(scores, limit):
+    """점수 내림차순 (같으면 단어 순) 상위 limit 개"""
+    return heapq.nsmallest(limit, scores.items(), key=lambda item: (-item[1], item[0]))
+
+
+def trending_terms(days=TREND_DAYS, limit=50, until=None, method="tfidf"):
+    """
+    최근 days 일의 유행 단어 상위 limit 개를 (단어, 점수) 목록으로 반환합니다.
+
+    method="count" 는 기간 내 출현 횟수 합계, "tfidf" 는 합계에 날짜 단위 IDF 를 곱한 값으로
+    매일 나오는 단어(기자, 오늘 등)보다 최근에 갑자기 많이 나온 단어를 위로 올립니다.
+    """
+    until = until or timezone.localdate()
+    counts = window_counts(days, until)
+    if method == "count":
+        return _top(counts, limit)
+    if method != "tfidf":
+        raise ValueError(f"Unknown ranking method '{method}'.")
+
+    # IDF 는 전체 기록 기준 (문서 수 = 통계가 있는 날짜 수, 문서 빈도 = 단어 등장 일수)
+    total_days = TermDay.objects.count()
+    window_terms = TermDailyCount.objects.filter(date__range=(until - timedelta(days=days - 1), until)).values("term")
+    document_days = dict(TermStats.objects.filter(term__in=window_terms).values_list("term", "days"))
+
+    scores = {
+        term: round(count * (math.log((1 + total_days) / (1 + document_days.get(term, 0))) + 1), 4)
+        for term, count in counts.items()
+    }
+    return _top(scores, limit)
@@ -1,11 +1,53 @@
-from django.test import TestCase
+import asyncio
+import gzip
+import json
+import os
+import tempfile
+import threading
+import unicodedata
+from collections import Counter
+from datetime import date
+from functools import partial
+from io import StringIO
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+import numpy as np
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import AsyncRequestFactory, SimpleTestCase, TestCase, TransactionTestCase, override_settings
 from django.urls import reverse
+from django.utils import timezone
 from rest_framework.test import APIClient
-from .models import AnswerWord, BaseWord
+from . import ann, async_views
+from .ann import AnnIndex
+from .catalogue import answer_words
+from .conversion import convert_vec, partial_paths
+from .difficulty import score_stats, stale_answers, vet_answers
+from .embedding import artifact_path, load_artifact, load_model, load_store, load_vocabulary, save_artifact, save_store, store_exists
+from .game_sessions import PLAYER_COOKIE, recorder as guess_recorder
+from .ingestion import ingest_words
+from .jobs import JobLocked, precompute_rankings, prewarm_snapshots, run_job, upcoming_answers
+from .leaderboard import leaderboards
+from .model_store import model_store
+from .models import AnalyzedArticle, AnswerWord, AnswerWordStats, BaseWord, GameSession, JobRun, LeaderboardEntry, RankTable, TermDailyCount, TermDay
+from .nouns import NounCache, count_nouns
+from .ranking import clear_rank_indexes, get_rank_index, get_vocabulary_version
+from .similarity import get_engine, reset_engine
+from .snapshots import current_version, find_snapshot, invalidate, write_manifest, write_snapshot
+from .term_stats import article_hash, record_articles, record_counts, trending_terms
+from .vocab_index import VocabIndex
+from .vocabulary import buffer as base_word_buffer
 
+@override_settings(SIMWORD_BASEWORD_FLUSH_INTERVAL=0, SIMWORD_GUESS_FLUSH_INTERVAL=0)
 class SimilarityViewTests(TestCase):
     def setUp(self):
         self.client = APIClient()
+        clear_rank_indexes()
+        cache.clear()
+        base_word_buffer.reset()
+        guess_recorder.reset()
+        leaderboards.reset()
+        answer_words.reset()
+        reset_engine()
 
         # 정답 단어와 후보 단어 설정
         self.answer_word = AnswerWord.objects.create(answer_word="신문")
@@ -25,6 +67,19 @@ class SimilarityViewTests(TestCase):
         self.assertTrue("top_100_similarities" in data)
         self.assertGreater(len(data["top_100_similarities"]), 0)
 
+    def test_similarity_rank_list_not_modified(self):
+        url = reverse("get_similarity_rank_list", kwargs={"id": self.answer_word.id})
+        response = self.client.get(url)
+        etag = response["ETag"]
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        BaseWord.objects.create(base_word="사과")
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
     def test_calculate_similarity(self):
         input_word = "기사"
         url = reverse("calculate_similarity", kwargs={"id": self.answer_word.id, "input_word": input_word})
@@ -37,3 +92,682 @@ class SimilarityViewTests(TestCase):
         self.assertTrue("similarity_percentage" in data)
         self.assertTrue(isinstance(data["similarity_percentage"], float))
         self.assertIn("rank", data)
+
+    def test_answer_word_catalogue(self):
+        self.client.get(reverse("answer_word_count"))
+
+        # 목록을 한 번 읽은 뒤에는 DB 를 조회하지 않음
+        with self.assertNumQueries(0):
+            response = self.client.get(reverse("answer_word_count"))
+        self.assertEqual(response.json(), {"total_count": 1})
+
+        AnswerWord.objects.create(answer_word="학교")
+        AnswerWord.objects.create(answer_word="사과")
+        response = self.client.get(reverse("list_answer_words"), {"page": 2, "page_size": 2})
+        self.assertEqual(response.json(), {
+            "count": 3,
+            "page": 2,
+            "num_pages": 2,
+            "results": [{"id": AnswerWord.objects.get(answer_word="사과").id, "answer_word": "사과"}]
+        })
+
+    def test_calculate_similarity_unknown_word(self):
+        url = reverse("calculate_similarity", kwargs={"id": self.answer_word.id, "input_word": "없는단어없는단어"})
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, 400)
+        self.assertNotIn("없는단어없는단어", load_vocabulary())
+        self.assertIn("신문", load_vocabulary())
+
+    def test_calculate_similarity_normalizes_and_suggests(self):
+        # 조사 / 공백 / NFD 입력은 모델 어휘의 형태로 바꿔 계산
+        for input_word in ["기사를", " 기사 ", unicodedata.normalize("NFD", "기사")]:
+            url = reverse("calculate_similarity", kwargs={"id": self.answer_word.id, "input_word": input_word})
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.json()["normalized_word"], "기사")
+
+        # 어미를 떼거나, 뗀 형태가 후보 단어(BaseWord)가 아니면 바꾸지 않음
+        for input_word in ["사과다", "사과를"]:
+            url = reverse("calculate_similarity", kwargs={"id": self.answer_word.id, "input_word": input_word})
+            self.assertEqual(self.client.get(url).status_code, 400)
+
+        # 자모 하나가 틀린 단어는 비슷한 후보 단어를 제시
+        url = reverse("calculate_similarity", kwargs={"id": self.answer_word.id, "input_word": "잡짛"})
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()["suggestions"], ["잡지"])
+
+    @override_settings(SIMWORD_SERVER_TIMING=True, SIMWORD_METRICS_TOKEN="secret")
+    def test_metrics(self):
+        url = reverse("calculate_similarity", kwargs={"id": self.answer_word.id, "input_word": "기사"})
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("similarity;dur=", response["Server-Timing"])
+        self.assertIn("total;dur=", response["Server-Timing"])
+
+        self.assertEqual(self.client.get(reverse("metrics")).status_code, 401)
+        with override_settings(SIMWORD_METRICS_TOKEN=""):
+            self.assertEqual(self.client.get(reverse("metrics"), HTTP_AUTHORIZATION="Bearer secret").status_code, 404)
+
+        metrics = self.client.get(reverse("metrics"), HTTP_AUTHORIZATION="Bearer secret").content.decode()
+        self.assertIn('simword_requests_total{method="GET",status="200",view="calculate_similarity"', metrics)
+        self.assertIn('simword_stage_duration_seconds_count{stage="rank_index"', metrics)
+        self.assertIn('simword_db_queries_total{view="calculate_similarity"', metrics)
+
+    def test_my_guesses(self):
+        for word in ["종이", "기사", "종이"]:
+            self.client.get(reverse("calculate_similarity", kwargs={"id": self.answer_word.id, "input_word": word}))
+        self.assertIn(PLAYER_COOKIE, self.client.cookies)
+        url = reverse("get_my_guesses", kwargs={"id": self.answer_word.id})
+
+        # 저장 전에도 이 프로세스의 대기분으로 조회
+        data = self.client.get(url).json()
+        self.assertEqual(data["guess_count"], 3)
+        self.assertEqual(sorted(guess["word"] for guess in data["guesses"]), ["기사", "종이"])
+
+        self.assertEqual(guess_recorder.flush(), 3)
+        self.client.get(reverse("calculate_similarity", kwargs={"id": self.answer_word.id, "input_word": "신문"}))
+        self.assertEqual(guess_recorder.flush(), 1)
+
+        session = GameSession.objects.get(answer_word=self.answer_word)
+        self.assertEqual((session.guess_count, session.solved_guesses), (4, 4))
+        self.assertEqual(session.words.split("\n"), ["종이", "기사", "종이", "신문"])
+        self.assertEqual(len(session.guesses), 4 * 2)
+
+        data = self.client.get(url).json()
+        self.assertEqual(data["solved_guesses"], 4)
+        self.assertEqual([guess["word"] for guess in data["guesses"]][0], "신문")
+        self.assertEqual(data["guesses"][0]["rank"], "정답!")
+        percentages = [guess["similarity_percentage"] for guess in data["guesses"]]
+        self.assertEqual(percentages, sorted(percentages, reverse=True))
+        # 기록한 유사도는 계산 응답과 같은 값
+        for guess in data["guesses"]:
+            scored = self.client.get(reverse("calculate_similarity", kwargs={"id": self.answer_word.id, "input_word": guess["word"]})).json()
+            self.assertEqual(guess["similarity_percentage"], scored["similarity_percentage"])
+        self.assertEqual({guess["word"]: guess["guess_number"] for guess in data["guesses"]}, {"종이": 1, "기사": 2, "신문": 4})
+
+    def test_leaderboard(self):
+        players = {"a" * 32: ["기사", "신문"], "b" * 32: ["신문"], "c" * 32: ["종이", "잡지", "신문"]}
+        for player, words in players.items():
+            for word in words:
+                url = reverse("calculate_similarity", kwargs={"id": self.answer_word.id, "input_word": word})
+                self.client.get(url, HTTP_X_PLAYER_ID=player)
+        guess_recorder.flush()
+
+        url = reverse("get_leaderboard", kwargs={"id": self.answer_word.id})
+        data = self.client.get(url, HTTP_X_PLAYER_ID="a" * 32).json()
+        self.assertEqual(data["total"], 3)
+        self.assertEqual([(entry["rank"], entry["guesses"]) for entry in data["top"]], [(1, 1), (2, 2), (3, 3)])
+        self.assertTrue(data["top"][1]["is_me"])
+        self.assertEqual(data["me"], {"guesses": 2, "rank": 2, "top_percent": 66.67})
+
+        # 스냅샷에서 다시 읽은 뒤 이후 기록만 더해도 같은 결과
+        leaderboards.snapshot(leaderboards.get(self.answer_word.id))
+        leaderboards.reset()
+        LeaderboardEntry.objects.create(answer_word=self.answer_word, player_id="d" * 32, guesses=2, solved_at=timezone.now())
+
+        data = self.client.get(url, HTTP_X_PLAYER_ID="c" * 32).json()
+        self.assertEqual(data["total"], 4)
+        self.assertEqual([entry["guesses"] for entry in data["top"]], [1, 2, 2, 3])
+        self.assertEqual(data["me"], {"guesses": 3, "rank": 4, "top_percent": 100.0})
+
+    def test_hints_from_vetted_stats(self):
+        url = reverse("get_hints", kwargs={"id": self.answer_word.id})
+        self.assertEqual(self.client.get(url).status_code, 404)
+
+        version = get_vocabulary_version()
+        engine = get_engine(model_store.get(), version)
+        missing, results = vet_answers(engine, stale_answers(version), version, batch_size=1)
+        self.assertEqual(missing, [])
+        self.assertFalse(results[0].usable)  # 후보가 TOP_N 개보다 적음
+        self.assertFalse(stale_answers(version).exists())
+        self.assertEqual(self.client.get(url).status_code, 404)
+        self.assertEqual(self.client.get(reverse("get_leaderboard", kwargs={"id": self.answer_word.id})).status_code, 404)
+
+        AnswerWordStats.objects.filter(answer_word=self.answer_word).update(usable=True)
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        hints = response.json()
+
+        top = self.client.get(reverse("get_similarity_rank_list", kwargs={"id": self.answer_word.id})).json()
+        self.assertEqual(hints["top1"], top["top_100_similarities"][0]["similarity_percentage"])
+        self.assertEqual(hints["candidate_count"], len(self.base_words))
+        self.assertIsNone(hints["top100"])
+        self.assertGreaterEqual(hints["percentiles"]["90"], hints["percentiles"]["50"])
+
+    def test_rank_table_extended_with_new_base_words(self):
+        url = reverse("calculate_similarity", kwargs={"id": self.answer_word.id, "input_word": "기사"})
+        self.client.get(url)
+
+        table = RankTable.objects.get(answer_word=self.answer_word)
+        ranked_words = {word for word, _ in table.ranking}
+        self.assertEqual(ranked_words, set(self.base_words))
+
+        new_word = BaseWord.objects.create(base_word="사과")
+        self.client.get(url)
+
+        table.refresh_from_db()
+        self.assertEqual(table.vocab_version, new_word.id)
+        self.assertIn("사과", {word for word, _ in table.ranking})
+        percentages = [percentage for _, percentage in table.ranking]
+        self.assertEqual(percentages, sorted(percentages, reverse=True))
+
+    def test_rank_table_repaired_when_missing_candidates(self):
+        # 늦게 커밋된 단어를 못 본 엔진이 같은 어휘 버전으로 저장한 순위표
+        version = get_vocabulary_version()
+        stale = [[word, 0.0] for word in self.base_words if word != "잡지"]
+        RankTable.objects.create(answer_word=self.answer_word, vocab_version=version, ranking=stale)
+
+        engine = get_engine(model_store.get(), version)
+        rank_index = get_rank_index(engine, self.answer_word)
+
+        self.assertIn("잡지", rank_index.rank_of)
+        self.assertIn("잡지", {word for word, _ in RankTable.objects.get(answer_word=self.answer_word).ranking})
+
+    def test_answer_stats_exclude_answer_without_sentinel(self):
+        stats = score_stats(np.array([1.0, 0.5], dtype=np.float32), answer_row=0)
+        self.assertEqual(stats["candidate_count"], 1)
+        self.assertEqual(stats["top1"], 50.0)
+        self.assertEqual(set(stats["percentiles"].values()), {50.0})
+
+        stats = score_stats(np.array([1.0], dtype=np.float32), answer_row=0)
+        self.assertEqual((stats["candidate_count"], stats["top1"], stats["percentiles"]), (0, None, {}))
+
+    def test_engine_picks_up_rows_committed_out_of_order(self):
+        engine = get_engine(model_store.get(), get_vocabulary_version())
+        late_id = get_vocabulary_version() + 1
+
+        # 먼저 id 를 받은 워커의 행이 나중에 커밋된 경우
+        newer = BaseWord.objects.create(id=late_id + 1, base_word="학교")
+        engine.sync(newer.id)
+        BaseWord.objects.create(id=late_id, base_word="학생")
+        latest = BaseWord.objects.create(base_word="하늘")
+        engine.sync(latest.id)
+
+        self.assertEqual(set(engine.words), set(self.base_words) | {"학교", "학생", "하늘"})
+        self.assertEqual(len(engine.words), len(engine.matrix))
+
+    def test_new_guess_word_is_buffered(self):
+        url = reverse("calculate_similarity", kwargs={"id": self.answer_word.id, "input_word": "사과"})
+        response = self.client.get(url)
+
+        self.assertEqual(response.json()["rank"], "?")
+        self.assertFalse(BaseWord.objects.filter(base_word="사과").exists())
+
+        self.assertEqual(base_word_buffer.flush(), 1)
+        self.assertTrue(BaseWord.objects.filter(base_word="사과").exists())
+        self.assertIsInstance(self.client.get(url).json()["rank"], int)
+
+    def test_calculate_similarity_batch(self):
+        url = reverse("calculate_similarity_batch", kwargs={"id": self.answer_word.id})
+        response = self.client.post(url, {"words": ["기사", "신문", "없는단어"]}, format="json")
+
+        self.assertEqual(response.status_code, 200)
+        results = response.json()["results"]
+
+        single = self.client.get(
+            reverse("calculate_similarity", kwargs={"id": self.answer_word.id, "input_word": "기사"})
+        ).json()
+        self.assertEqual(results[0]["similarity_percentage"], single["similarity_percentage"])
+        self.assertEqual(results[0]["rank"], single["rank"])
+        self.assertEqual(results[1]["rank"], "정답!")
+        self.assertIn("error", results[2])
+
+
+class ReadinessTests(TransactionTestCase):
+    # 준비 작업은 별도 스레드에서 DB 를 읽으므로 트랜잭션으로 감싸지 않는 테스트 사용
+    def setUp(self):
+        self.client = APIClient()
+        model_store.reset()
+        reset_engine()
+        BaseWord.objects.create(base_word="기사")
+
+    def test_readyz_reports_warm_up(self):
+        response = self.client.get(reverse("readyz"))
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response.json()["state"], "pending")
+        self.assertEqual(self.client.get(reverse("healthz")).status_code, 200)
+
+        model_store.warm_up()
+        self.assertTrue(model_store.wait(timeout=60), model_store.error)
+
+        response = self.client.get(reverse("readyz"))
+        self.assertEqual(response.status_code, 200)
+        self.assertIsNotNone(response.json()["steps"]["engine"])
+
+
+class EmbeddingStoreTests(SimpleTestCase):
+    # 모델 파일 대신 임시 디렉터리에 작은 저장소를 만들어 확인
+    words = ["사과", "사과나무", "apple", "바나나", "학교"]
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "model")
+        self.vectors = np.random.default_rng(0).standard_normal((len(self.words), 8)).astype(np.float32)
+
+    def test_store_is_memory_mapped(self):
+        from gensim.models import KeyedVectors
+
+        model = KeyedVectors(8)
+        model.add_vectors(self.words, self.vectors)
+        save_store(model, self.path)
+
+        loaded = load_store(self.path)
+        self.assertIsInstance(loaded.vectors, np.memmap)
+        np.testing.assert_array_equal(loaded.vectors, self.vectors)
+        self.assertAlmostEqual(loaded.similarity("사과", "학교"), model.similarity("사과", "학교"), places=5)
+        self.assertEqual(load_model(self.path, game=False).key_to_index["학교"], 4)
+
+    def test_vocab_index_lookups(self):
+        VocabIndex.write(self.words, f"{self.path}.vocab")
+        vocab = VocabIndex.open(f"{self.path}.vocab")
+
+        self.assertEqual(len(vocab), len(self.words))
+        for row, word in enumerate(self.words):
+            self.assertEqual(vocab[word], row)
+            self.assertEqual(vocab.keys_by_row[row], word)
+        # 접두어가 같은 단어 / 없는 단어 / 문자열이 아닌 키
+        self.assertNotIn("사", vocab)
+        self.assertNotIn("사과나", vocab)
+        self.assertNotIn(1, vocab)
+        with self.assertRaises(KeyError):
+            vocab["없는단어"]
+        self.assertEqual(vocab.keys_by_row[-1], "학교")
+        self.assertEqual(vocab.keys_by_row[1:3], ["사과나무", "apple"])
+        self.assertEqual(list(vocab), self.words)
+        self.assertEqual(load_vocabulary(self.path).get("바나나"), 3)
+
+    def test_game_artifact_round_trip(self):
+        def cosine(vectors):
+            vectors = np.asarray(vectors, dtype=np.float32)
+            vectors = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+            return vectors @ vectors.T
+
+        # 양자화 형식별 코사인 유사도 허용 오차
+        for quantization, tolerance in [("float32", 1e-6), ("float16", 1e-3), ("int8", 2e-2)]:
+            with self.subTest(quantization=quantization):
+                save_artifact(self.words, self.vectors, artifact_path(self.path), quantization)
+                model = load_model(self.path)
+
+                self.assertEqual(model.vectors.dtype, np.dtype(quantization))
+                self.assertEqual(model.vectors.shape, self.vectors.shape)
+                self.assertEqual(list(model.index_to_key), self.words)
+                self.assertEqual(model.key_to_index["사과나무"], 1)
+                np.testing.assert_allclose(cosine(model.vectors), cosine(self.vectors), atol=tolerance)
+                self.assertIn("apple", load_vocabulary(self.path, game=True))
+
+        with open(artifact_path(self.path), "r+b") as f:
+            f.write(b"NOTGAME!")
+        with self.assertRaises(ValueError):
+            load_artifact(artifact_path(self.path))
+
+    def test_convert_vec_resumes_after_interruption(self):
+        vec_path = f"{self.path}.vec"
+        with open(vec_path, "w", encoding="utf-8") as f:
+            f.write(f"{len(self.words) + 1} 8\n")
+            for index, word in enumerate(self.words):
+                f.write(word + "".join(f" {value:.6f}" for value in self.vectors[index]) + "\n")
+                if index == 2:
+                    f.write("깨진줄 0.1 0.2\n")  # 차원 수가 맞지 않는 줄은 건너뜀
+
+        class Interrupted(Exception):
+            pass
+
+        def interrupt(message):
+            raise Interrupted(message)
+
+        # 첫 청크의 체크포인트를 남긴 직후 중단
+        with self.assertRaises(Interrupted):
+            convert_vec(vec_path, self.path, chunk_size=2, report=interrupt)
+        self.assertFalse(store_exists(self.path))
+
+        messages = []
+        self.assertEqual(convert_vec(vec_path, self.path, chunk_size=2, report=messages.append), len(self.words))
+        self.assertTrue(messages[0].startswith("2/6 행부터"))
+
+        model = load_store(self.path)
+        self.assertEqual(list(model.index_to_key), self.words)
+        np.testing.assert_allclose(model.vectors, self.vectors.astype(np.float16), atol=1e-6)
+        self.assertFalse(any(os.path.exists(path) for path in partial_paths(self.path)))
+
+
+class AnnIndexTests(TestCase):
+    def setUp(self):
+        answer_words.reset()
+
+    def tearDown(self):
+        ann._index = None
+
+    def test_recall_against_brute_force(self):
+        # 군집이 있는 합성 행렬 (실제 임베딩처럼 주제별로 모여 있음)
+        rng = np.random.default_rng(0)
+        centers = rng.standard_normal((20, 32))
+        vectors = (centers[rng.integers(0, 20, 2000)] + 0.5 * rng.standard_normal((2000, 32))).astype(np.float32)
+        index = AnnIndex.build(vectors, nlist=16, m=8, train_size=2000, iterations=5, report=lambda message: None)
+
+        normalized = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+        recalls = []
+        for row in rng.choice(len(vectors), 20, replace=False):
+            exact = np.argsort(-(normalized @ normalized[row]))
+            exact = exact[exact != row][:10]
+            rows, scores = index.search(vectors[row], k=10, nprobe=4, exclude=np.array([row]))
+            self.assertNotIn(row, rows)
+            self.assertTrue(np.all(np.diff(scores) <= 0))
+            recalls.append(len(set(rows) & set(exact)) / 10)
+        self.assertGreaterEqual(np.mean(recalls), 0.9)
+
+    def test_neighbors_endpoint(self):
+        model = model_store.get()
+        index = AnnIndex.build(model.vectors, nlist=8, m=30, train_size=1000, iterations=3, report=lambda message: None)
+        index.model = model
+        ann._index = index
+
+        answer = AnswerWord.objects.create(answer_word="신문")
+        response = self.client.get(reverse("get_nearest_neighbors", kwargs={"id": answer.id}), {"k": 5})
+        self.assertEqual(response.status_code, 200)
+        neighbors = response.json()["neighbors"]
+        self.assertEqual([neighbor["rank"] for neighbor in neighbors], [1, 2, 3, 4, 5])
+        self.assertNotIn("신문", [neighbor["word"] for neighbor in neighbors])
+        self.assertEqual(neighbors[0]["word"], model.most_similar("신문", topn=1)[0][0])
+
+        unknown = AnswerWord.objects.create(answer_word="없는단어없는단어")
+        response = self.client.get(reverse("get_nearest_neighbors", kwargs={"id": unknown.id}))
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(self.client.get(reverse("get_nearest_neighbors", kwargs={"id": answer.id}), {"k": "x"}).status_code, 400)
+
+
+@override_settings(SIMWORD_BASEWORD_FLUSH_INTERVAL=0, SIMWORD_GUESS_FLUSH_INTERVAL=0)
+class AsyncViewTests(TransactionTestCase):
+    # 풀 스레드가 자기 DB 연결로 읽으므로 트랜잭션으로 감싸지 않는 테스트 사용
+    # AsyncClient 는 한글 경로를 제대로 넘기지 못하므로 AsyncRequestFactory 로 뷰를 직접 호출
+    def setUp(self):
+        self.factory = AsyncRequestFactory()
+        clear_rank_indexes()
+        cache.clear()
+        base_word_buffer.reset()
+        guess_recorder.reset()
+        answer_words.reset()
+        reset_engine()
+
+        self.answer_word = AnswerWord.objects.create(answer_word="신문")
+        for word in ["기사", "잡지", "종이"]:
+            BaseWord.objects.create(base_word=word)
+
+    async def calculate(self, input_word):
+        request = self.factory.get(reverse("calculate_similarity", kwargs={"id": self.answer_word.id, "input_word": input_word}))
+        response = await async_views.calculate_similarity(request, self.answer_word.id, input_word)
+        return response.status_code, json.loads(response.content)
+
+    async def test_calculate_similarity_normalizes(self):
+        for input_word in ["기사", "기사를", " 기사 ", unicodedata.normalize("NFD", "기사")]:
+            status, data = await self.calculate(input_word)
+            self.assertEqual(status, 200, data)
+            self.assertEqual((data["input_word"], data["normalized_word"]), (input_word, "기사"))
+
+        status, data = await self.calculate("사과를")  # 뗀 형태가 후보 단어가 아님
+        self.assertEqual(status, 400)
+
+    async def test_unknown_word_suggests(self):
+        status, data = await self.calculate("잡짛")
+        self.assertEqual(status, 400)
+        self.assertEqual(data["suggestions"], ["잡지"])
+
+    async def test_coalesce_runs_once(self):
+        calls = []
+        started = threading.Event()
+        release = threading.Event()
+
+        def compute(value):
+            calls.append(value)
+            started.set()
+            release.wait(5)
+            return value * 2
+
+        first = asyncio.ensure_future(async_views.coalesce("key", compute, 21))
+        second = asyncio.ensure_future(async_views.coalesce("key", compute, 21))
+        cancelled = asyncio.ensure_future(async_views.coalesce("key", compute, 21))
+        await asyncio.sleep(0)
+        self.assertTrue(await asyncio.to_thread(started.wait, 5))
+
+        # 함께 기다리던 요청 하나가 취소되어도 계산은 계속됨
+        cancelled.cancel()
+        release.set()
+        self.assertEqual(await asyncio.gather(first, second), [42, 42])
+        self.assertEqual(calls, [21])
+        self.assertNotIn("key", async_views._inflight)
+
+    async def test_similarity_rank_list_concurrent_and_not_modified(self):
+        request = self.factory.get(reverse("get_similarity_rank_list", kwargs={"id": self.answer_word.id}))
+        responses = await asyncio.gather(*[async_views.get_similarity_rank_list(request, self.answer_word.id) for _ in range(3)])
+        self.assertEqual({response.status_code for response in responses}, {200})
+        self.assertEqual(len({response.content for response in responses}), 1)
+        self.assertTrue(responses[0]["ETag"].startswith("W/"))
+
+        # 같은 ETag 로 다시 요청하면 계산 없이 304
+        request = self.factory.get(
+            reverse("get_similarity_rank_list", kwargs={"id": self.answer_word.id}), headers={"If-None-Match": responses[0]["ETag"]}
+        )
+        self.assertEqual((await async_views.get_similarity_rank_list(request, self.answer_word.id)).status_code, 304)
+
+
+class QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+class NewsCrawlerTests(SimpleTestCase):
+    """저장해 둔 네이버 랭킹 / 기사 HTML 을 로컬 HTTP 서버로 제공해 수집기를 확인"""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        fixtures_dir = os.path.join(os.path.dirname(__file__), "testdata", "naver")
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), partial(QuietHandler, directory=fixtures_dir))
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.ranking_url = f"http://127.0.0.1:{cls.server.server_port}/ranking.html"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        super().tearDownClass()
+
+    def test_iter_popular_articles(self):
+        from .news_word_analysis import HostRateLimiter, iter_popular_articles
+
+        articles = list(iter_popular_articles(self.ranking_url, limiter=HostRateLimiter(rate=0)))
+
+        # 중복 링크 / 중복 본문 / 본문 없는 기사 / 404 기사는 제외
+        self.assertEqual(len(articles), 3)
+        self.assertTrue(any("경제 성장률" in article for article in articles))
+        self.assertTrue(all(articles.count(article) == 1 for article in articles))
+
+    def test_iter_popular_articles_stops_at_max_articles(self):
+        from .news_word_analysis import HostRateLimiter, iter_popular_articles
+
+        articles = list(iter_popular_articles(self.ranking_url, max_articles=2, limiter=HostRateLimiter(rate=0)))
+        self.assertEqual(len(articles), 2)
+
+
+class NounCountTests(SimpleTestCase):
+    def test_count_nouns_uses_cache(self):
+        with tempfile.TemporaryDirectory() as directory:
+            noun_cache = NounCache(directory)
+            noun_cache.set(NounCache.key("첫 기사"), ["경제", "성장률", "경제"])
+            noun_cache.set(NounCache.key("사진 기사"), [])
+
+            # 모두 캐시에 있으므로 형태소 분석 워커를 띄우지 않음
+            counts = count_nouns(iter(["첫 기사", "사진 기사", "첫 기사"]), workers=4, cache_directory=directory)
+
+        self.assertEqual(counts, Counter({"경제": 4, "성장률": 2}))
+
+
+class TermStatsTests(TestCase):
+    def setUp(self):
+        record_counts(Counter({"경제": 5, "기자": 3}), ["a"], date(2026, 1, 1))
+        record_counts(Counter({"기자": 3, "태풍": 4}), ["b"], date(2026, 1, 2))
+        record_counts(Counter({"태풍": 2}), ["c"], date(2026, 1, 2))
+
+    def test_counts_accumulate_per_day(self):
+        self.assertEqual(TermDailyCount.objects.get(date=date(2026, 1, 2), term="태풍").count, 6)
+        self.assertEqual(AnalyzedArticle.objects.count(), 3)
+        self.assertEqual(TermDay.objects.count(), 2)
+
+    def test_trending_terms(self):
+        until = date(2026, 1, 2)
+        self.assertEqual(trending_terms(days=2, until=until, method="count"), [("기자", 6), ("태풍", 6), ("경제", 5)])
+
+        # 매일 나오는 '기자' 는 IDF 가 낮아 뒤로 밀림
+        self.assertEqual([term for term, _ in trending_terms(days=2, until=until)], ["태풍", "경제", "기자"])
+        self.assertEqual(trending_terms(days=1, until=until, method="count"), [("태풍", 6), ("기자", 3)])
+
+    def test_analyzed_articles_are_skipped(self):
+        AnalyzedArticle.objects.create(content_hash=article_hash("이미 분석한 기사"), date=date(2026, 1, 2))
+
+        new_article_count, counts = record_articles(["이미 분석한 기사"])
+        self.assertEqual((new_article_count, counts), (0, Counter()))
+
+
+class IngestionTests(TestCase):
+    def test_ingest_words(self):
+        BaseWord.objects.create(base_word="기사")
+        vocabulary = {"기사", "태풍", "장마"}
+
+        created = ingest_words(["기사", "태풍", "없는단어", "태풍", "", "장마"], BaseWord, "base_word", vocabulary, report=None)
+
+        self.assertEqual(created, 2)
+        self.assertEqual(set(BaseWord.objects.values_list("base_word", flat=True)), {"기사", "태풍", "장마"})
+        self.assertEqual(ingest_words(["태풍"], BaseWord, "base_word", vocabulary, report=None), 0)
+
+    def test_ingest_words_dry_run(self):
+        created = ingest_words(["태풍", "장마"], BaseWord, "base_word", {"태풍", "장마"}, dry_run=True, report=None)
+
+        self.assertEqual(created, 2)
+        self.assertFalse(BaseWord.objects.exists())
+
+
+class JobTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        clear_rank_indexes()
+        reset_engine()
+
+    def test_run_job_records_stages(self):
+        with run_job("test_job", report=lambda message: None) as job:
+            with job.stage("fetch"):
+                pass
+            job.record(articles=3)
+
+            # 실행 중에는 같은 작업을 다시 시작할 수 없음
+            with self.assertRaises(JobLocked):
+                with run_job("test_job", report=lambda message: None):
+                    pass
+
+        run = JobRun.objects.get(name="test_job")
+        self.assertEqual(run.status, "success")
+        self.assertIn("fetch", run.timings)
+        self.assertEqual(run.stats, {"articles": 3})
+
+        # 끝나면 잠금이 풀림
+        with run_job("test_job", report=lambda message: None):
+            pass
+
+    def test_timed_stage_streams_items(self):
+        def articles():
+            yield "첫 기사"
+            yield "둘째 기사"
+
+        with run_job("test_stream", report=lambda message: None) as job:
+            fetched = job.timed("fetch", articles(), count="articles")
+            with job.stage("analyse", exclude=["fetch"]):
+                self.assertEqual(next(fetched), "첫 기사")  # 모두 받기 전에 첫 항목부터 처리
+                self.assertEqual(list(fetched), ["둘째 기사"])
+
+        run = JobRun.objects.get(name="test_stream")
+        self.assertEqual(run.stats, {"articles": 2})
+        self.assertIn("fetch", run.timings)
+        self.assertGreaterEqual(run.timings["analyse"], 0)
+
+    def test_precompute_rankings_updates_stale_tables(self):
+        answer = AnswerWord.objects.create(answer_word="신문")
+        for word in ["기사", "잡지", "종이"]:
+            BaseWord.objects.create(base_word=word)
+        self.assertEqual(precompute_rankings([answer], report=None), 1)
+
+        BaseWord.objects.create(base_word="뉴스")
+        self.assertEqual(precompute_rankings(report=None), 1)
+
+        table = RankTable.objects.get(answer_word=answer)
+        self.assertEqual(table.vocab_version, BaseWord.objects.latest("id").id)
+        self.assertIn("뉴스", [word for word, _ in table.ranking])
+
+    def test_prewarm_snapshots(self):
+        answer = AnswerWord.objects.create(answer_word="신문")
+        for word in ["기사", "잡지", "종이"]:
+            BaseWord.objects.create(base_word=word)
+        url = reverse("get_similarity_rank_list", kwargs={"id": answer.id})
+
+        with tempfile.TemporaryDirectory() as directory, override_settings(SIMWORD_SNAPSHOT_DIR=directory):
+            self.assertEqual(upcoming_answers(3), [answer])
+            self.assertEqual(prewarm_snapshots(upcoming_answers(3), report=None), 1)
+            generation = get_vocabulary_version()
+            self.assertEqual(current_version(), generation)
+            self.assertEqual(upcoming_answers(3), [answer])  # 순위표가 생겨도 출제 순서(커서)는 그대로
+
+            response = self.client.get(url, HTTP_ACCEPT_ENCODING="gzip")
+            self.assertEqual(response["Content-Encoding"], "gzip")
+            snapshot = json.loads(gzip.decompress(b"".join(response.streaming_content)))
+            self.assertEqual(snapshot["answer_word"], "신문")
+            self.assertEqual(self.client.get(url).json(), snapshot)
+            identity = self.client.get(url, HTTP_ACCEPT_ENCODING="gzip;q=0, identity")
+            self.assertFalse(identity.has_header("Content-Encoding"))
+            # 표현(gzip / identity)마다 바이트가 다르므로 약한 ETag + Vary
+            self.assertTrue(response["ETag"].startswith("W/"))
+            self.assertEqual(identity["ETag"], response["ETag"])
+            self.assertIn("Accept-Encoding", response["Vary"])
+            self.assertEqual(self.client.get(url, HTTP_ACCEPT_ENCODING="gzip", HTTP_IF_NONE_MATCH=response["ETag"]).status_code, 304)
+
+            # 후보가 100개보다 적으면 새 단어는 항상 상위 목록에 들어가므로 그 스냅샷만 지우고 current 세대는 유지
+            ingest_words(["뉴스"], BaseWord, "base_word", load_vocabulary(), report=None)
+            self.assertEqual(current_version(), generation)
+            response = self.client.get(url, HTTP_ACCEPT_ENCODING="gzip")
+            self.assertFalse(response.has_header("Content-Encoding"))
+            self.assertIn("뉴스", [item["word"] for item in response.json()["top_100_similarities"]])
+
+            # 새 어휘 버전에서 다시 실행하면 같은 창 전체를 새 세대로 만들고, 바로 전 세대는 한 번 더 남겼다가 지움
+            self.assertEqual(prewarm_snapshots(upcoming_answers(3), report=None), 1)
+            self.assertEqual(current_version(), get_vocabulary_version())
+            self.assertTrue(os.path.exists(os.path.join(directory, f"v{generation}")))
+            self.assertEqual(prewarm_snapshots(upcoming_answers(3), report=None), 0)
+            self.assertFalse(os.path.exists(os.path.join(directory, f"v{generation}")))
+
+    def test_prewarm_command_advances_window(self):
+        first, second, third = [AnswerWord.objects.create(answer_word=word) for word in ["신문", "학교", "하늘"]]
+        BaseWord.objects.create(base_word="기사")
+        with tempfile.TemporaryDirectory() as directory, override_settings(SIMWORD_SNAPSHOT_DIR=directory):
+            call_command("prewarm_snapshots", count=2, stdout=StringIO())
+            call_command("prewarm_snapshots", count=2, stdout=StringIO())
+
+            runs = JobRun.objects.filter(name="prewarm_snapshots").order_by("id")
+            self.assertEqual([run.stats["answers"] for run in runs], [[first.id, second.id], [third.id]])
+            self.assertEqual(upcoming_answers(2), [])
+            # 지난 창(지금 출제 중인 단어)의 스냅샷도 남아 있고 manifest 에서 계속 무효화 대상
+            for answer in (first, second, third):
+                self.assertIsNotNone(find_snapshot(answer.id))
+            self.assertEqual(invalidate(["뉴스"]), 3)
+
+    def test_snapshot_invalidated_only_by_words_entering_top_list(self):
+        answer = AnswerWord.objects.create(answer_word="신문")
+        with tempfile.TemporaryDirectory() as directory, override_settings(SIMWORD_SNAPSHOT_DIR=directory):
+            write_snapshot(answer.id, 1, b"{}")
+            entry = {"answer_word": "신문", "threshold": 0.99, "words": ["기사"]}
+            write_manifest(1, {answer.id: entry})
+            self.assertEqual(invalidate(["뉴스", "기사"]), 0)
+
+            write_manifest(1, {answer.id: {**entry, "threshold": -1.0}})
+            self.assertEqual(invalidate(["기사"]), 0)  # 이미 상위 목록에 있는 단어
+            self.assertEqual(invalidate(["뉴스"]), 1)
+            self.assertIsNone(find_snapshot(answer.id))
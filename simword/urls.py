@@ -1,9 +1,22 @@
 # urls.py
+from django.conf import settings
 from django.urls import path
 from . import views
 
+# ASGI 로 실행할 때는 주요 API 에 비동기 뷰를 사용
+if settings.SIMWORD_ASYNC_VIEWS:
+    from . import async_views as similarity_views
+else:
+    similarity_views = views
+
 urlpatterns = [
-    path('total/', views.answer_word_count, name='answer_word_count'),
-    path('<int:id>/<str:input_word>/', views.calculate_similarity, name='calculate_similarity'),
-    path('<int:id>/', views.get_similarity_rank_list, name='get_similarity_rank_list'),
+    path('total/', similarity_views.answer_word_count, name='answer_word_count'),
+    path('answers/', views.list_answer_words, name='list_answer_words'),
+    path('<int:id>/batch/', views.calculate_similarity_batch, name='calculate_similarity_batch'),
+    path('<int:id>/neighbors/', views.get_nearest_neighbors, name='get_nearest_neighbors'),
+    path('<int:id>/hints/', views.get_hints, name='get_hints'),
+    path('<int:id>/guesses/', views.get_my_guesses, name='get_my_guesses'),
+    path('<int:id>/leaderboard/', views.get_leaderboard, name='get_leaderboard'),
+    path('<int:id>/<str:input_word>/', similarity_views.calculate_similarity, name='calculate_similarity'),
+    path('<int:id>/', similarity_views.get_similarity_rank_list, name='get_similarity_rank_list'),
 ]
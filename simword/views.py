@@ -1,128 +1,351 @@
-import os
-from django.shortcuts import get_object_or_404
-from django.http import JsonResponse
-from gensim.models import KeyedVectors
-from .models import AnswerWord, BaseWord
-from django.db import IntegrityError
 import json
+from datetime import datetime, timezone
 from django.conf import settings
+from django.core.paginator import Paginator
+from django.http import HttpResponse, JsonResponse
+from django.utils.cache import patch_cache_control
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import condition, require_POST
+from .ann import get_index as get_ann_index
+from .caching import RANK_LIST_CACHE_TIMEOUT, get_or_fill, rank_list_etag, rank_list_key
+from .catalogue import answer_words
+from .difficulty import unusable_answer_ids
+from .game_sessions import get_player_id, new_player_id, recorder as guess_recorder, set_player_id, sorted_guesses
+from .leaderboard import TOP_K, leaderboards
+from .metrics import stage
+from .model_store import model_store
+from .models import AnswerWordStats, LeaderboardEntry
+from .ranking import TOP_N, build_similarity_rank_list, get_engine_or_error, get_rank_index, get_vocabulary_version
+from .similarity import get_engine, to_percentage
+from .snapshots import snapshot_response
+from .suggestions import resolve, suggest
+from .vocabulary import buffer as base_word_buffer
 
-# 모델 파일 경로
-VEC_FILE = os.path.join(settings.BASE_DIR, 'cc.ko.300.vec')
-KV_FILE = os.path.join(settings.BASE_DIR, 'cc.ko.300.kv')
+# 최근접 이웃 API 에서 한 번에 요청할 수 있는 최대 개수
+MAX_NEIGHBORS = 1000
 
-# 전역 모델 변수 (한 번만 로드 후 계속 사용)
-model = None
+# 일괄 채점 API 에서 한 번에 보낼 수 있는 최대 단어 수
+MAX_BATCH_WORDS = 1000
 
-def load_model():
-    """FastText 모델을 로드하고 전역 변수로 저장"""
-    global model
+# 정답 단어 목록 API 의 페이지 크기 (기본 / 최대)
+ANSWER_PAGE_SIZE = 50
+MAX_ANSWER_PAGE_SIZE = 500
 
-    if os.path.exists(KV_FILE):
-        model = KeyedVectors.load(KV_FILE)
-    else:
-        # 원본 벡터 파일 로드
-        model = KeyedVectors.load_word2vec_format(VEC_FILE, binary=False, unicode_errors="ignore")
-
-        # 벡터를 float16으로 변환 (메모리 절약)
-        model.vectors = model.vectors.astype("float16")
-
-        # 변환된 모델을 저장
-        model.save(KV_FILE)
-
-# 🚀 서버 시작 시 모델을 한 번 로드
-load_model()
+# 리더보드 API 의 기본 상위 기록 수
+LEADERBOARD_SIZE = 10
 
 def answer_word_count(request):
     """전체 AnswerWord 개수를 반환"""
-    total_count = AnswerWord.objects.all().count()
+    total_count = answer_words.count()
     return JsonResponse({"total_count": total_count})
 
+def list_answer_words(request):
+    """AnswerWord 목록을 id 순으로 페이지 단위로 반환 (?page=&page_size=)"""
+    try:
+        page_size = max(1, min(int(request.GET.get("page_size", ANSWER_PAGE_SIZE)), MAX_ANSWER_PAGE_SIZE))
+    except ValueError:
+        return JsonResponse({"error": "page_size must be an integer."}, status=400)
+
+    paginator = Paginator(answer_words.all(), page_size)
+    page = paginator.get_page(request.GET.get("page"))
+
+    return JsonResponse({
+        "count": paginator.count,
+        "page": page.number,
+        "num_pages": paginator.num_pages,
+        "results": [{"id": answer.id, "answer_word": answer.answer_word} for answer in page]
+    })
+
+def suggest_words(word):
+    """모델에 없는 입력 단어와 비슷한 후보 단어 목록 ('혹시 이 단어?')"""
+    version = get_vocabulary_version()
+    if not version:
+        return []
+    with stage("suggest"):
+        return suggest(get_engine(model_store.get(), version), word)
+
+def unknown_word_error(word):
+    return {"error": f"Input word '{word}' not found in the model.", "suggestions": suggest_words(word)}
+
+def similarity_rank_list_etag(request, id):
+    """정답 단어와 어휘 버전이 같으면 상위 100개 응답도 같으므로 계산 없이 304 로 응답"""
+    answer = answer_words.get(id)
+    if answer is None:
+        return None
+    return rank_list_etag(answer, get_vocabulary_version())
+
+@condition(etag_func=similarity_rank_list_etag)
 def get_similarity_rank_list(request, id):
     """특정 AnswerWord와 BaseWord 간 유사도 랭킹 상위 100개를 반환"""
     try:
-        answer = get_object_or_404(AnswerWord, pk=id)
-        candidate_words = list(BaseWord.objects.values_list("base_word", flat=True))
+        answer = answer_words.get_or_404(id)
+        version = get_vocabulary_version()
 
-        if not candidate_words:
-            return JsonResponse({"error": "No candidate words found in the database."}, status=404)
+        # 미리 만들어 둔 스냅샷이 있으면 계산 / 캐시 조회 없이 파일을 그대로 전송
+        response = snapshot_response(request, answer.id)
+        if response is not None:
+            patch_cache_control(response, public=True, max_age=settings.SIMWORD_RANK_LIST_MAX_AGE)
+            return response
 
-        if answer.answer_word not in model.key_to_index:
-            return JsonResponse({"error": f"Answer word '{answer.answer_word}' not found in the model."}, status=400)
+        status, content = get_or_fill(
+            rank_list_key(answer.id, version),
+            lambda: build_similarity_rank_list(answer, version),
+            should_cache=lambda value: value[0] == 200,
+            timeout=RANK_LIST_CACHE_TIMEOUT,
+        )
 
-        similarities = [
-            {
+        response = HttpResponse(content, status=status, content_type="application/json")
+        if status == 200:
+            patch_cache_control(response, public=True, max_age=settings.SIMWORD_RANK_LIST_MAX_AGE)
+        return response
+    except Exception as e:
+        return JsonResponse({"error": str(e)}, status=500)
+
+def resolve_rank(rank_index, word, similarity_percentage):
+    """입력 단어의 순위 표시값을 결정하고, 처음 보는 단어는 BaseWord 저장 대기열에 추가"""
+    base_word_exists = base_word_buffer.contains(word)
+
+    rank = rank_index.rank_of.get(word)
+    if rank is not None and rank <= TOP_N:
+        pass
+    elif rank is not None or base_word_exists:
+        rank = "순위 밖"
+    else:
+        rank = "?"
+
+    if similarity_percentage == 100:
+        rank = "정답!"
+
+    if not base_word_exists:
+        base_word_buffer.add(word)  # 주기적으로 일괄 저장
+
+    return rank
+
+def record_guess(request, response, answer, word, similarity_percentage, solved):
+    """플레이어의 추측을 세션 기록 대기열에 추가 (처음 온 플레이어에게는 ID 를 발급)"""
+    player = get_player_id(request)
+    if player is None:
+        player = new_player_id()
+        set_player_id(response, player)
+    guess_recorder.record(player, answer.id, word, similarity_percentage, solved)
+
+def calculate_similarity(request, id, input_word):
+    """입력 단어와 정답 단어의 유사도를 계산하고, 랭킹을 반환"""
+    try:
+        answer = answer_words.get_or_404(id)
+
+        # NFC 정규화 / 공백 / 조사 제거 후에도 모델에 없으면 엔진 / 순위표 준비 전에 비슷한 단어만 제시하고 거절
+        word = resolve(input_word, model_store.get().key_to_index, base_word_buffer)
+        if word is None:
+            return JsonResponse(unknown_word_error(input_word), status=400)
+
+        engine, error = get_engine_or_error(answer)
+        if error:
+            return error
+
+        with stage("rank_index"):
+            rank_index = get_rank_index(engine, answer)
+
+        with stage("similarity"):
+            score = engine.similarity(word, answer.answer_word)
+            similarity_percentage = to_percentage(score)
+            rank = resolve_rank(rank_index, word, similarity_percentage)
+
+        response = JsonResponse({
+            "id": id,
+            "input_word": input_word,
+            "normalized_word": word,
+            "similarity_percentage": similarity_percentage,
+            "rank": rank
+        })
+        record_guess(request, response, answer, word, similarity_percentage, similarity_percentage == 100)
+        return response
+    except Exception as e:
+        return JsonResponse({"error": str(e)}, status=500)
+
+@csrf_exempt
+@require_POST
+def calculate_similarity_batch(request, id):
+    """여러 입력 단어의 유사도와 랭킹을 한 번에 계산 (게임 기록 복원 / 일괄 채점용)"""
+    try:
+        answer = answer_words.get_or_404(id)
+
+        try:
+            words = json.loads(request.body).get("words")
+        except (ValueError, AttributeError):
+            return JsonResponse({"error": "Request body must be a JSON object."}, status=400)
+
+        if not isinstance(words, list) or not all(isinstance(word, str) for word in words):
+            return JsonResponse({"error": "'words' must be a list of strings."}, status=400)
+        if len(words) > MAX_BATCH_WORDS:
+            return JsonResponse({"error": f"At most {MAX_BATCH_WORDS} words can be scored at once."}, status=400)
+
+        engine, error = get_engine_or_error(answer)
+        if error:
+            return error
+
+        with stage("rank_index"):
+            rank_index = get_rank_index(engine, answer)
+
+        with stage("similarity"):
+            vocab = model_store.get().key_to_index
+            resolved = {word: resolve(word, vocab, base_word_buffer) for word in words}
+            valid_words = list({word for word in resolved.values() if word is not None})
+            scores = dict(zip(valid_words, engine.similarities(valid_words, answer.answer_word)))
+
+        results = []
+        for input_word in words:
+            word = resolved[input_word]
+            if word is None:
+                results.append({"input_word": input_word, **unknown_word_error(input_word)})
+                continue
+
+            similarity_percentage = to_percentage(scores[word])
+            results.append({
+                "input_word": input_word,
+                "normalized_word": word,
+                "similarity_percentage": similarity_percentage,
+                "rank": resolve_rank(rank_index, word, similarity_percentage)
+            })
+
+        return JsonResponse({
+            "id": id,
+            "results": results
+        })
+    except Exception as e:
+        return JsonResponse({"error": str(e)}, status=500)
+
+def get_my_guesses(request, id):
+    """플레이어가 이 정답 단어에 대해 추측한 단어를 유사도 내림차순으로 반환"""
+    try:
+        answer = answer_words.get_or_404(id)
+
+        player = get_player_id(request)
+        if player is None:
+            return JsonResponse({"id": id, "guess_count": 0, "solved_guesses": None, "guesses": []})
+
+        words, percentages, solved_guesses = guess_recorder.history(player, answer.id)
+        guesses = sorted_guesses(words, percentages)
+
+        rank_of = {}
+        if guesses:
+            engine, error = get_engine_or_error(answer)
+            if error:
+                return error
+            rank_of = get_rank_index(engine, answer).rank_of
+
+        results = []
+        for word, similarity_percentage, number in guesses:
+            rank = rank_of.get(word)
+            results.append({
                 "word": word,
-                "similarity_percentage": round(float(model.similarity(answer.answer_word, word)) * 100, 2)
-            }
-            for word in candidate_words
-            if word in model.key_to_index and word != answer.answer_word
-        ]
+                "similarity_percentage": similarity_percentage,
+                "rank": "정답!" if word == answer.answer_word else (rank if rank is not None and rank <= TOP_N else "순위 밖"),
+                "guess_number": number
+            })
 
-        if not similarities:
-            return JsonResponse({"error": "No valid candidate words found for similarity calculation."}, status=404)
+        return JsonResponse({
+            "id": id,
+            "guess_count": len(words),
+            "solved_guesses": solved_guesses,
+            "guesses": results
+        })
+    except Exception as e:
+        return JsonResponse({"error": str(e)}, status=500)
 
-        similarities = sorted(similarities, key=lambda x: x["similarity_percentage"], reverse=True)
+def get_leaderboard(request, id):
+    """정답까지 추측 횟수가 적은 상위 k개 기록과 요청한 플레이어의 순위 / 상위 % 를 반환"""
+    try:
+        answer = answer_words.get_or_404(id)
 
-        top_similarities = [
-            {"word": item["word"], "similarity_percentage": item["similarity_percentage"], "rank": rank + 1}
-            for rank, item in enumerate(similarities[:100])
+        try:
+            k = max(1, min(int(request.GET.get("k", LEADERBOARD_SIZE)), TOP_K))
+        except ValueError:
+            return JsonResponse({"error": "k must be an integer."}, status=400)
+
+        if unusable_answer_ids([answer.id]):
+            return JsonResponse({"error": "This answer is not ranked."}, status=404)
+
+        board = leaderboards.get(answer.id)
+        player = get_player_id(request)
+
+        top = [
+            {
+                "rank": board.rank(guesses),
+                "guesses": guesses,
+                "solved_at": datetime.fromtimestamp(solved_at, tz=timezone.utc).isoformat(),
+                "is_me": entry_player == player
+            }
+            for guesses, solved_at, entry_player in board.top[:k]
         ]
 
+        me = None
+        if player is not None:
+            guesses = LeaderboardEntry.objects.filter(answer_word_id=answer.id, player_id=player).values_list("guesses", flat=True).first()
+            if guesses is not None:
+                me = {"guesses": guesses, "rank": board.rank(guesses), "top_percent": board.top_percent(guesses)}
+
         return JsonResponse({
             "id": id,
-            "answer_word": answer.answer_word,
-            "top_100_similarities": top_similarities
+            "total": board.total,
+            "top": top,
+            "me": me
         })
     except Exception as e:
         return JsonResponse({"error": str(e)}, status=500)
 
-def calculate_similarity(request, id, input_word):
-    """입력 단어와 정답 단어의 유사도를 계산하고, 랭킹을 반환"""
+def get_hints(request, id):
+    """정답 단어의 1 / 10 / 100위 유사도 기준과 유사도 분포 백분위를 반환 (vet_answers 로 미리 계산)"""
     try:
-        answer = get_object_or_404(AnswerWord, pk=id)
+        answer = answer_words.get_or_404(id)
 
-        response = get_similarity_rank_list(request, id)
-        if response.status_code != 200:
-            return response
+        stats = AnswerWordStats.objects.filter(answer_word_id=answer.id).first()
+        if stats is None:
+            return JsonResponse({"error": "Hints have not been computed for this answer."}, status=404)
+        if not stats.usable:
+            # 이웃이 적거나 성긴 단어는 순위별 유사도 기준이 힌트로 의미가 없음
+            return JsonResponse({"error": "Hints are not available for this answer."}, status=404)
 
-        data = json.loads(response.content)
-        similarities = data.get("top_100_similarities", [])
+        response = JsonResponse({
+            "id": id,
+            "top1": stats.top1,
+            "top10": stats.top10,
+            "top100": stats.top100,
+            "percentiles": stats.percentiles,
+            "candidate_count": stats.candidate_count
+        })
+        patch_cache_control(response, public=True, max_age=settings.SIMWORD_RANK_LIST_MAX_AGE)
+        return response
+    except Exception as e:
+        return JsonResponse({"error": str(e)}, status=500)
 
-        base_word_exists = BaseWord.objects.filter(base_word=input_word).exists()
+def get_nearest_neighbors(request, id):
+    """전체 FastText 어휘에서 정답 단어와 가장 가까운 단어 K개를 반환 (근사 최근접 이웃 색인 사용)"""
+    try:
+        answer = answer_words.get_or_404(id)
 
-        rank = "?"
-        for item in similarities:
-            if item["word"] == input_word:
-                rank = item["rank"] if item["rank"] <= 100 else "순위 밖"
-                break
+        try:
+            k = max(1, min(int(request.GET.get("k", TOP_N)), MAX_NEIGHBORS))
+        except ValueError:
+            return JsonResponse({"error": "k must be an integer."}, status=400)
 
-        if rank == "?" and base_word_exists:
-            rank = "순위 밖"
+        index = get_ann_index()
+        if index is None:
+            return JsonResponse({"error": "Nearest neighbor index has not been built."}, status=503)
 
-        if input_word not in model.key_to_index:
-            return JsonResponse({"error": f"Input word '{input_word}' not found in the model."}, status=400)
-        if answer.answer_word not in model.key_to_index:
+        if answer.answer_word not in index.model.key_to_index:
             return JsonResponse({"error": f"Answer word '{answer.answer_word}' not found in the model."}, status=400)
 
-        similarity_score = model.similarity(input_word, answer.answer_word)
-        similarity_percentage = round(similarity_score * 100, 2)
-
-        if similarity_percentage == 100:
-            rank = "정답!"
-
-        if not base_word_exists:
-            try:
-                new_base_word = BaseWord(base_word=input_word)
-                new_base_word.save()
-            except IntegrityError:
-                pass
+        with stage("ann"):
+            neighbors = [
+                {"word": word, "similarity_percentage": to_percentage(score), "rank": rank}
+                for rank, (word, score) in enumerate(index.most_similar(answer.answer_word, k), start=1)
+            ]
 
         return JsonResponse({
             "id": id,
-            "input_word": input_word,
-            "similarity_percentage": similarity_percentage,
-            "rank": rank
+            "answer_word": answer.answer_word,
+            "neighbors": neighbors
         })
     except Exception as e:
         return JsonResponse({"error": str(e)}, status=500)
\ No newline at end of file
@@ -0,0 +1,112 @@
+import mmap
+import struct
+from collections.abc import Mapping, Sequence
+import numpy as np
+
+# 파일 구조 (리틀 엔디언)
+#   헤더    : 매직(8바이트) + 단어 수(uint64) + 문자열 영역 크기(uint64)
+#   offsets : uint64[단어 수 + 1]  행 순서대로 각 단어의 문자열 시작 위치
+#   order   : uint32[단어 수]      UTF-8 바이트 기준으로 정렬된 행 번호
+#   blob    : UTF-8 문자열을 이어 붙인 영역
+MAGIC = b"SWVOCAB1"
+HEADER = struct.Struct("<8sQQ")
+
+
+class VocabIndex(Mapping):
+    """메모리 맵으로 여는 어휘 색인 (단어 -> 모델 행 번호)
+
+    전체를 dict 로 만들지 않고 정렬된 문자열 표를 이진 탐색하므로
+    여러 프로세스가 같은 파일을 공유하며 즉시 열 수 있다.
+    """
+
+    def __init__(self, buffer, offset=0):
+        magic, count, blob_size = HEADER.unpack_from(buffer, offset)
+        if magic != MAGIC:
+            raise ValueError("올바른 어휘 색인 파일이 아닙니다.")
+
+        position = offset + HEADER.size
+        self._count = count
+        self._offsets = np.frombuffer(buffer, dtype="<u8", count=count + 1, offset=position)
+        position += self._offsets.nbytes
+        self._order = np.frombuffer(buffer, dtype="<u4", count=count, offset=position)
+        position += self._order.nbytes
+        self._blob = memoryview(buffer)[position:position + blob_size]
+        self._buffer = buffer
+        self.nbytes = position + blob_size - offset
+        self.keys_by_row = _KeysByRow(self)
+
+    @classmethod
+    def open(cls, path):
+        """파일을 읽기 전용 메모리 맵으로 열기"""
+        with open(path, "rb") as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(buffer)
+
+    @staticmethod
+    def to_bytes(words):
+        """행 순서의 단어 목록을 색인 바이트로 직렬화"""
+        encoded = [word.encode("utf-8") for word in words]
+        offsets = np.zeros(len(encoded) + 1, dtype="<u8")
+        np.cumsum([len(word) for word in encoded], out=offsets[1:])
+        order = np.array(sorted(range(len(encoded)), key=encoded.__getitem__), dtype="<u4")
+        blob = b"".join(encoded)
+        return HEADER.pack(MAGIC, len(encoded), len(blob)) + offsets.tobytes() + order.tobytes() + blob
+
+    @classmethod
+    def write(cls, words, path):
+        """단어 목록을 색인 파일로 저장"""
+        with open(path, "wb") as f:
+            f.write(cls.to_bytes(words))
+
+    def key_of(self, row):
+        """행 번호에 해당하는 단어"""
+        return bytes(self._blob[self._offsets[row]:self._offsets[row + 1]]).decode("utf-8")
+
+    def _find(self, word):
+        target = word.encode("utf-8")
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            row = int(self._order[middle])
+            key = bytes(self._blob[self._offsets[row]:self._offsets[row + 1]])
+            if key < target:
+                low = middle + 1
+            elif key > target:
+                high = middle
+            else:
+                return row
+        return -1
+
+    def __getitem__(self, word):
+        row = self._find(word) if isinstance(word, str) else -1
+        if row < 0:
+            raise KeyError(word)
+        return row
+
+    def __contains__(self, word):
+        return isinstance(word, str) and self._find(word) >= 0
+
+    def __len__(self):
+        return self._count
+
+    def __iter__(self):
+        return iter(self.keys_by_row)
+
+
+class _KeysByRow(Sequence):
+    """행 번호 -> 단어 (KeyedVectors.index_to_key 대용)"""
+
+    def __init__(self, index):
+        self._index = index
+
+    def __getitem__(self, row):
+        if isinstance(row, slice):
+            return [self._index.key_of(i) for i in range(*row.indices(len(self)))]
+        if row < 0:
+            row += len(self)
+        if not 0 <= row < len(self):
+            raise IndexError(row)
+        return self._index.key_of(row)
+
+    def __len__(self):
+        return len(self._index)
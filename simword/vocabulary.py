@@ -0,0 +1,123 @@
+import atexit
+import threading
+import time
+from django.conf import settings
+from django.db import close_old_connections, connection
+from .models import BaseWord
+from .snapshots import invalidate as invalidate_snapshots
+
+
+class BaseWordBuffer:
+    """추측 단어를 모아 두었다가 주기적으로 BaseWord 에 일괄 저장
+
+    이미 등록된 단어 집합을 프로세스 안에 두고 저장할 때마다 새로 추가된 행만
+    읽어 갱신하므로, 추측 요청 처리 중에는 DB 를 조회하거나 쓰지 않는다.
+    """
+
+    def __init__(self):
+        self.known = None  # DB 에 있는 단어 (처음 사용할 때 로드)
+        self.last_id = 0
+        self.pending = set()
+        self.flushing = set()
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._thread = None
+
+    def reset(self):
+        """단어 집합과 대기열을 비움 (다음 사용 시 DB 에서 다시 로드)"""
+        with self._lock:
+            self.known, self.last_id = None, 0
+            self.pending, self.flushing = set(), set()
+
+    def _new_rows(self):
+        """마지막으로 읽은 id 이후 추가된 BaseWord (id, 단어) 목록"""
+        return list(BaseWord.objects.filter(id__gt=self.last_id).order_by("id").values_list("id", "base_word"))
+
+    def _apply(self, rows):
+        for word_id, word in rows:
+            self.known.add(word)
+            self.last_id = max(self.last_id, word_id)
+
+    def _ensure_loaded(self):
+        if self.known is None:
+            rows = self._new_rows()
+            with self._lock:
+                if self.known is None:
+                    self.known = set()
+                    self._apply(rows)
+            self._start()
+
+    def contains(self, word):
+        """BaseWord 에 있거나 저장 대기 중인 단어인지 확인"""
+        self._ensure_loaded()
+        return word in self.known or word in self.pending or word in self.flushing
+
+    def __contains__(self, word):
+        return self.contains(word)
+
+    def add(self, word):
+        """새 단어를 저장 대기열에 추가 (DB 에는 flush 때 저장)"""
+        if self.contains(word):
+            return
+        with self._lock:
+            self.pending.add(word)
+        self._start()
+
+    def flush(self):
+        """대기 중인 단어를 bulk_create 로 한 번에 저장하고 단어 집합을 갱신"""
+        with self._flush_lock:
+            with self._lock:
+                self.flushing, self.pending = self.pending, set()
+            words = self.flushing
+
+            try:
+                if words:
+                    BaseWord.objects.bulk_create([BaseWord(base_word=word) for word in words], ignore_conflicts=True)
+                rows = self._new_rows() if self.known is not None else []
+            except Exception:
+                with self._lock:
+                    self.pending |= words  # 다음 flush 때 다시 시도
+                    self.flushing = set()
+                raise
+
+            with self._lock:
+                self._apply(rows)
+                self.flushing = set()
+            if words:
+                invalidate_snapshots(words)  # 새 단어가 상위 100개에 들어가는 스냅샷만 지움
+            return len(words)
+
+    def _start(self):
+        """주기적으로 flush 하는 백그라운드 스레드를 (워커 프로세스마다 한 번) 시작"""
+        interval = settings.SIMWORD_BASEWORD_FLUSH_INTERVAL
+        if not interval or self._thread is not None:
+            return
+
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, args=(interval,), name="baseword-flush", daemon=True)
+                self._thread.start()
+
+    def _run(self, interval):
+        while True:
+            time.sleep(interval)
+            close_old_connections()
+            try:
+                self.flush()
+            except Exception as e:
+                print(f"BaseWord 저장 실패: {e}")
+            finally:
+                connection.close()
+
+
+buffer = BaseWordBuffer()
+
+
+@atexit.register
+def _flush_on_exit():
+    # 워커 종료 시 남은 단어를 저장
+    if buffer.pending:
+        try:
+            buffer.flush()
+        except Exception as e:
+            print(f"BaseWord 저장 실패: {e}")